@@ -13,6 +13,8 @@ from pydantic import BaseModel, Field
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from backend.entities import *
+from backend.imageGC import pin_world_images
+from backend import spritePipeline
 from dotenv import load_dotenv
 import os
 
@@ -140,11 +142,15 @@ class CaptureGameInfo:
             print("species name - ", species.name)
             img_data, img_name = self.get_image("data/images/animals/", f"Pixel Art, Solid Background.\nAnimal Species: {species.name}\nDescription: {species.description}")
             print("img_name - ", img_name)
+            if img_name:
+                # Processed in the background; screens find the sprite from img_name via spritePipeline.sprite_path
+                spritePipeline.submit(img_name)
             animal = Animal(species=species.name, epoch=self.timeplace_info.epoch, size=species.relative_size_human, imagePath=img_name, description=species.description)
             print("\n\n later - ", animal.species, animal.imagePath, animal.description)
             animals.append(animal)
 
         self.game_animals = animals
+        pin_world_images((self.place, self.time_mya), (animal.imagePath for animal in animals))
         return animals
     
     def generate_background(self) -> str:
@@ -153,4 +159,5 @@ class CaptureGameInfo:
 
         bg_img_data, bg_img_name = self.get_image("data/images/backgrounds/", f"Pixel art texture, top-down view, suitable for 2D game background.\nClimate: {self.timeplace_info.climate}\nEnvironment: {self.timeplace_info.environment}")
         print("img_name - ", bg_img_name)
+        pin_world_images((self.place, self.time_mya), [bg_img_name])
         return bg_img_name
\ No newline at end of file
@@ -0,0 +1,102 @@
+# catchRecorder.py — records catches without blocking the game loop
+#
+# Saving a player rewrites their whole storage file, which is far too slow for the
+# render thread. record_catch() applies the catch to the in-memory Player right
+# away (cheap), snapshots it, and queues the snapshot for a single background
+# worker. One worker means saves happen in the order catches were made, so a later
+# save never gets overwritten by an earlier one. When a save finishes, `on_done` is
+# called with a CatchResult on the worker thread; the frontend turns that into a
+# pygame event.
+#
+# The worker never touches the live Player: the UI keeps using it (loading history
+# pages builds entries in place), so it is serialized on the calling thread and
+# the worker saves a private Player rebuilt from that snapshot.
+import atexit
+import queue
+import threading
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Optional
+
+from backend.entities import Animal, GameRecord, Player, PlayerManager
+
+
+@dataclass
+class CatchResult:
+    username: str
+    record: GameRecord
+    ok: bool
+    error: Optional[str] = None
+
+
+class CatchRecorder:
+    def __init__(self, manager: PlayerManager, on_done: Optional[Callable[[CatchResult], None]] = None):
+        self.manager = manager
+        self.on_done = on_done
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="catch-recorder", daemon=True)
+        self._worker.start()
+
+    def record_catch(self, player: Player, animal: Animal, place: str, time_mya: float,
+                     beastballs_used: int) -> GameRecord:
+        """Apply a catch to `player` now and queue it to be saved; returns the new GameRecord.
+
+        Call from the thread that uses `player` (the UI thread).
+        """
+        record = GameRecord(date=date.today().isoformat(), place=place, timeMYA=time_mya,
+                            beastballsUsed=beastballs_used, animalCaught=animal)
+        player.beastball_left = max(0, player.beastball_left - beastballs_used)
+        player.add_caught_animal(animal)
+        player.add_game_history(record)
+        # A lazily loaded copy, so the worker serializes it without racing the UI
+        snapshot = Player.from_dict(dict(player.to_dict(), username=player.username))
+        self._queue.put((snapshot, record))
+        return record
+
+    def _persist(self, player: Player) -> bool:
+        # Players are saved when they sign up, so a catch only ever updates one
+        return self.manager.update_player(player)
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                player, record = job
+                try:
+                    result = CatchResult(player.username, record, self._persist(player))
+                except Exception as e:
+                    print(f"Error: could not save catch for '{player.username}': {e}")
+                    result = CatchResult(player.username, record, False, str(e))
+                if self.on_done is not None:
+                    self.on_done(result)
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued catch has been saved."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Save everything still queued, then stop the worker."""
+        self._queue.put(None)
+        self._worker.join()
+
+
+# ---------------- Shared recorder ---------------- #
+_recorder: Optional[CatchRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_catch_recorder(manager: Optional[PlayerManager] = None,
+                       on_done: Optional[Callable[[CatchResult], None]] = None) -> CatchRecorder:
+    """The process-wide recorder, created on first use; queued catches are saved at exit."""
+    global _recorder
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = CatchRecorder(manager or PlayerManager(), on_done)
+            atexit.register(_recorder.close)
+        elif on_done is not None:
+            _recorder.on_done = on_done
+        return _recorder
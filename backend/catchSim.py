@@ -0,0 +1,361 @@
+# catchSim.py — the catch game's rules without a display, for balancing
+#
+# The movement and collision rules of frontend/catchGameScreen.py live here as
+# plain functions on integer positions, and the screen calls them, so the game and
+# this simulation can't drift apart. CatchRound plays one round step by step, the
+# way the screen does at SIM_HZ (same spawn positions, update order, cooldown and
+# win/lose checks), with no pygame involved.
+#
+# A policy stands in for the player: each step it looks at the round and returns
+# (move, shoot), move being -1, 0 or 1. run_batch plays many rounds per parameter
+# set and policy across a process pool and reports the win rate and the
+# distribution of beastballs used. Round i always uses seed + i, so results don't
+# depend on the number of workers.
+#
+#   python -m backend.catchSim --sizes 0.5 1 1.5 2 2.5 --episodes 5000
+#   python -m backend.catchSim --powers 1,2.5,2 1.5,4,3 --policies leading random --output bench/catch.json
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from backend.config import Config, get_config
+
+# Sprite boxes and spawn offsets, in pixels (shared with catchGameScreen)
+CATCHER_W, CATCHER_H = 90, 64
+CATCHER_MARGIN = 24      # gap between the catcher and the bottom of the screen
+BALL_W, BALL_H = 10, 24
+MUZZLE_GAP = 4           # beastballs spawn this far above the catcher
+
+WIN, LOSE, TIMEOUT = "win", "lose", "timeout"
+
+# Rounds handed to a worker at a time
+CHUNK = 250
+
+# Spread (standard deviation, px) of the casual policy's aiming error
+AIM_ERROR_PX = 40
+
+
+# ---------------- Rules ---------------- #
+def powers_for_size(size: float) -> Tuple[float, float, float]:
+    """(size_power, speed_power, shots_power) for an animal of the given relative size."""
+    size_power = max(0.5, 0.75 * size)
+    speed_power = 2.5  # Keeping speed fixed for now
+    shots_power = max(1.0, 2.0 * size_power)  # Direct relation to size
+    return size_power, speed_power, shots_power
+
+
+def move_animal(x: int, vx: float, size: int, width: int) -> Tuple[int, float]:
+    """Animal x and velocity after one step, bouncing off the screen edges."""
+    x += int(vx)
+    if x <= 0:
+        return 0, abs(vx)
+    if x + size >= width:
+        return width - size, -abs(vx)
+    return x, vx
+
+
+def move_catcher(x: int, dx: int, width: int) -> int:
+    """Catcher x after moving dx pixels, kept on screen."""
+    return max(0, min(width - CATCHER_W, x + dx))
+
+
+def overlaps(ax: int, ay: int, aw: int, ah: int, bx: int, by: int, bw: int, bh: int) -> bool:
+    """Whether two boxes overlap, as pygame.Rect.colliderect decides it."""
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+@dataclass(frozen=True)
+class CatchParams:
+    """Everything a round depends on; picklable, so it can be sent to worker processes."""
+    width: int
+    height: int
+    size_px: int
+    speed_px: float
+    hits: int
+    ammo: int
+    catcher_speed: int
+    ball_speed: int
+    cooldown_ms: float
+    step_ms: float
+
+    @classmethod
+    def from_powers(cls, size_power: float, speed_power: float, shots_power: float,
+                    config: Optional[Config] = None) -> "CatchParams":
+        config = config or get_config()
+        return cls(width=config.screen_width, height=config.screen_height,
+                   size_px=int(config.catch_base_size * size_power),
+                   speed_px=config.catch_base_speed * speed_power,
+                   hits=max(1, int(round(config.catch_base_shots * shots_power))),
+                   ammo=int(config.starting_beastballs),
+                   catcher_speed=config.catcher_speed, ball_speed=config.beastball_speed,
+                   cooldown_ms=config.beastball_cooldown_ms, step_ms=1000.0 / max(1, config.sim_hz))
+
+
+class CatchRound:
+    """One round of the catch game, advanced with step()."""
+    def __init__(self, params: CatchParams, rng: Optional[random.Random] = None):
+        rng = rng or random.Random()
+        p = self.params = params
+        self.animal_x = p.width // 2 - p.size_px // 2
+        self.animal_y = p.height // 3 - p.size_px // 2
+        self.vx = p.speed_px if rng.random() < 0.5 else -p.speed_px
+        self.catcher_x = p.width // 2 - CATCHER_W // 2
+        self.catcher_y = p.height - CATCHER_MARGIN - CATCHER_H
+        self.balls: List[List[int]] = []   # [x, y] of each beastball in flight
+        self.hits_left = p.hits
+        self.ammo = p.ammo
+        self.shots = 0
+        self.steps = 0
+        self.time_ms = 0.0
+        self.last_shot_ms = -p.cooldown_ms
+        self.outcome: Optional[str] = None
+
+    def can_shoot(self) -> bool:
+        return self.ammo > 0 and self.time_ms - self.last_shot_ms >= self.params.cooldown_ms
+
+    def step(self, move: int, shoot: bool) -> Optional[str]:
+        """Play one step; returns WIN or LOSE once the round is decided, else None."""
+        p = self.params
+        self.catcher_x = move_catcher(self.catcher_x, move * p.catcher_speed, p.width)
+        if shoot and self.can_shoot():
+            self.balls.append([self.catcher_x + CATCHER_W // 2 - BALL_W // 2,
+                               self.catcher_y - MUZZLE_GAP - BALL_H])
+            self.last_shot_ms = self.time_ms
+            self.ammo -= 1
+            self.shots += 1
+
+        self.animal_x, self.vx = move_animal(self.animal_x, self.vx, p.size_px, p.width)
+        ax, ay, size = self.animal_x, self.animal_y, p.size_px
+        if self.balls:
+            for ball in self.balls:
+                ball[1] -= p.ball_speed
+            self.balls = [b for b in self.balls if b[1] + BALL_H >= 0]
+            for i, (bx, by) in enumerate(self.balls):
+                if overlaps(bx, by, BALL_W, BALL_H, ax, ay, size, size):
+                    del self.balls[i]
+                    self.hits_left -= 1
+                    break
+
+        self.steps += 1
+        self.time_ms += p.step_ms
+        if self.hits_left <= 0:
+            self.outcome = WIN
+        elif self.ammo <= 0 and not self.balls:
+            self.outcome = LOSE
+        return self.outcome
+
+
+# ---------------- Policies ---------------- #
+# make_policy(rng) -> policy(round) -> (move, shoot)
+Policy = Callable[[CatchRound], Tuple[int, bool]]
+
+
+def _toward(catcher_x: int, target_x: float, speed: int) -> int:
+    offset = target_x - (catcher_x + CATCHER_W // 2)
+    return 0 if abs(offset) < speed else (1 if offset > 0 else -1)
+
+
+def _aimed(rnd: CatchRound, animal_x: float) -> bool:
+    """Whether a beastball fired now would pass through an animal at animal_x."""
+    ball_x = rnd.catcher_x + CATCHER_W // 2 - BALL_W // 2
+    return animal_x < ball_x + BALL_W and ball_x < animal_x + rnd.params.size_px
+
+
+def spray_policy(rng: random.Random) -> Policy:
+    """Stand still and fire as fast as the cooldown allows."""
+    return lambda rnd: (0, True)
+
+
+def random_policy(rng: random.Random) -> Policy:
+    """Wander, switching direction now and then, and fire at random."""
+    state = {"move": 0}
+
+    def policy(rnd: CatchRound) -> Tuple[int, bool]:
+        if rng.random() < 0.05:
+            state["move"] = rng.choice((-1, 0, 1))
+        return state["move"], rng.random() < 0.1
+    return policy
+
+
+def tracker_policy(rng: random.Random) -> Policy:
+    """Follow the animal and fire whenever it is straight above."""
+    def policy(rnd: CatchRound) -> Tuple[int, bool]:
+        p = rnd.params
+        move = _toward(rnd.catcher_x, rnd.animal_x + p.size_px / 2, p.catcher_speed)
+        return move, _aimed(rnd, rnd.animal_x)
+    return policy
+
+
+def _predicted_x(rnd: CatchRound) -> float:
+    """Where the animal will be when a beastball fired now reaches its height, bounces included."""
+    p = rnd.params
+    rise = (rnd.catcher_y - MUZZLE_GAP - BALL_H) - (rnd.animal_y + p.size_px)
+    flight = max(0, math.ceil((rise + 1) / p.ball_speed))
+    # Unfold the bounces: the animal moves on a line that is folded at the edges
+    span = max(1, p.width - p.size_px)
+    pos = (rnd.animal_x + int(rnd.vx) * (flight + 1)) % (2 * span)
+    return pos if pos <= span else 2 * span - pos
+
+
+def leading_policy(rng: random.Random) -> Policy:
+    """Aim where the animal will be when the beastball gets there; a perfect player."""
+    def policy(rnd: CatchRound) -> Tuple[int, bool]:
+        future_x = _predicted_x(rnd)
+        move = _toward(rnd.catcher_x, future_x + rnd.params.size_px / 2, rnd.params.catcher_speed)
+        return move, _aimed(rnd, future_x)
+    return policy
+
+
+def casual_policy(rng: random.Random) -> Policy:
+    """Lead the animal like leading_policy, but misjudge each shot by about AIM_ERROR_PX."""
+    state = {"error": rng.gauss(0, AIM_ERROR_PX), "shots": 0}
+
+    def policy(rnd: CatchRound) -> Tuple[int, bool]:
+        if rnd.shots != state["shots"]:
+            state["shots"] = rnd.shots
+            state["error"] = rng.gauss(0, AIM_ERROR_PX)
+        future_x = _predicted_x(rnd) + state["error"]
+        move = _toward(rnd.catcher_x, future_x + rnd.params.size_px / 2, rnd.params.catcher_speed)
+        return move, _aimed(rnd, future_x)
+    return policy
+
+
+POLICIES: Dict[str, Callable[[random.Random], Policy]] = {
+    "spray": spray_policy,
+    "random": random_policy,
+    "tracker": tracker_policy,
+    "leading": leading_policy,
+    "casual": casual_policy,
+}
+
+
+# ---------------- Batch runner ---------------- #
+def play(params: CatchParams, policy_name: str, seed: int, max_steps: int) -> Tuple[str, int, int]:
+    """Play one round; returns (outcome, beastballs used, steps)."""
+    rng = random.Random(seed)
+    rnd = CatchRound(params, rng)
+    policy = POLICIES[policy_name](rng)
+    step = rnd.step
+    while rnd.steps < max_steps:
+        move, shoot = policy(rnd)
+        if step(move, shoot):
+            return rnd.outcome, rnd.shots, rnd.steps
+    return TIMEOUT, rnd.shots, rnd.steps
+
+
+def _play_chunk(params: CatchParams, policy_name: str, seeds: range, max_steps: int) -> List[Tuple[str, int, int]]:
+    return [play(params, policy_name, seed, max_steps) for seed in seeds]
+
+
+def _percentile(ordered: List[int], pct: float) -> Optional[int]:
+    if not ordered:
+        return None
+    return ordered[max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))]
+
+
+def summarize(params: CatchParams, results: List[Tuple[str, int, int]]) -> Dict:
+    """Win rate and beastballs used for one parameter set and policy."""
+    outcomes = Counter(outcome for outcome, _, _ in results)
+    won = sorted(shots for outcome, shots, _ in results if outcome == WIN)
+    win_steps = [steps for outcome, _, steps in results if outcome == WIN]
+    n = max(1, len(results))
+    return {
+        "episodes": len(results),
+        "win_rate": round(outcomes[WIN] / n, 4),
+        "lose_rate": round(outcomes[LOSE] / n, 4),
+        "timeout_rate": round(outcomes[TIMEOUT] / n, 4),
+        # Beastballs used in won rounds: what a catch costs the player
+        "ammo_used_win": {
+            "mean": round(sum(won) / len(won), 2) if won else None,
+            "p50": _percentile(won, 50), "p90": _percentile(won, 90), "max": won[-1] if won else None,
+        },
+        "ammo_used_histogram": dict(sorted(Counter(shots for _, shots, _ in results).items())),
+        "mean_win_seconds": round(sum(win_steps) / len(win_steps) * params.step_ms / 1000.0, 2) if win_steps else None,
+    }
+
+
+def run_batch(param_sets: Dict[str, CatchParams], policies: List[str], episodes: int,
+              workers: Optional[int] = None, seed: int = 0, max_seconds: float = 120) -> List[Dict]:
+    """Play `episodes` rounds for every (parameter set, policy) pair; one summary dict per pair.
+
+    workers=1 plays in this process; otherwise rounds go to a process pool in
+    chunks of CHUNK.
+    """
+    jobs = [(label, params, policy) for label, params in param_sets.items() for policy in policies]
+    chunks = [(i, params, policy, range(seed + start, seed + min(episodes, start + CHUNK)),
+               max(1, int(max_seconds * 1000.0 / params.step_ms)))
+              for i, (_, params, policy) in enumerate(jobs) for start in range(0, episodes, CHUNK)]
+    results: List[List[Tuple[str, int, int]]] = [[] for _ in jobs]
+    if workers == 1:
+        for i, params, policy, seeds, max_steps in chunks:
+            results[i].extend(_play_chunk(params, policy, seeds, max_steps))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(i, pool.submit(_play_chunk, params, policy, seeds, max_steps))
+                       for i, params, policy, seeds, max_steps in chunks]
+            for i, future in futures:
+                results[i].extend(future.result())
+    return [dict(label=label, policy=policy, params=asdict(params), **summarize(params, results[i]))
+            for i, (label, params, policy) in enumerate(jobs)]
+
+
+# ---------------- CLI ---------------- #
+def _parse_powers(text: str) -> Tuple[float, float, float]:
+    try:
+        size, speed, shots = (float(v) for v in text.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected size,speed,shots powers, got {text!r}")
+    return size, speed, shots
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play the catch game headlessly to balance its powers.")
+    parser.add_argument("--sizes", type=float, nargs="*", default=[],
+                        help="relative animal sizes, turned into powers as the game does")
+    parser.add_argument("--powers", type=_parse_powers, nargs="*", default=[], metavar="SIZE,SPEED,SHOTS")
+    parser.add_argument("--policies", nargs="+", default=["leading", "casual", "random"], choices=sorted(POLICIES))
+    parser.add_argument("--episodes", type=int, default=2000, help="rounds per parameter set and policy")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count; 1 plays in-process)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-seconds", type=float, default=120, help="simulated time before a round times out")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    param_sets = {f"size {size:g}": CatchParams.from_powers(*powers_for_size(size)) for size in args.sizes}
+    param_sets.update({"powers {:g},{:g},{:g}".format(*powers): CatchParams.from_powers(*powers)
+                       for powers in args.powers})
+    if not param_sets:
+        param_sets = {f"size {size:g}": CatchParams.from_powers(*powers_for_size(size)) for size in (0.5, 1, 1.5, 2)}
+
+    start = time.perf_counter()
+    results = run_batch(param_sets, args.policies, args.episodes, args.workers, args.seed, args.max_seconds)
+    elapsed = time.perf_counter() - start
+    total = args.episodes * len(results)
+    print(f"{total} rounds in {elapsed:.1f}s ({total / elapsed:.0f}/s)", file=sys.stderr)
+
+    print(f"{'policy':<12}{'win':>8}{'timeout':>9}   {'beastballs to win (mean / p50 / p90)':<38}{'secs':>6}")
+    label = None
+    for row in results:
+        if row["label"] != label:
+            label, p = row["label"], row["params"]
+            print(f"{label}: {p['size_px']}px, {p['speed_px']:g} px/step, {p['hits']} hits, {p['ammo']} beastballs")
+        ammo = row["ammo_used_win"]
+        spent = f"{ammo['mean']} / {ammo['p50']} / {ammo['p90']}" if ammo["mean"] is not None else "-"
+        print(f"  {row['policy']:<10}{row['win_rate']:>8.1%}{row['timeout_rate']:>9.1%}   "
+              f"{spent:<38}{row['mean_win_seconds'] or '-':>6}")
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+# config.py — typed, cached access to config.yaml with hot reload
+#
+# config.yaml is parsed once into an immutable Config snapshot. Code reads values
+# through get_config() at the point of use, so after a reload every caller sees the
+# new snapshot on its next read. A watcher thread can poll the file and reload it
+# when it changes.
+#
+# Screen size and asset paths are read once when screens are set up, so changing
+# those still needs a restart. Tuning values (beastballs, FPS, speeds, cache
+# budgets) take effect on the next read.
+import os
+import threading
+from dataclasses import dataclass, fields, replace
+from typing import Dict, Optional
+
+import yaml
+
+CONFIG_PATH = "config.yaml"
+
+
+@dataclass(frozen=True)
+class Config:
+    """One immutable snapshot of config.yaml; each field is the lower-cased YAML key."""
+    # Paths
+    assets_path: str = "frontend/assets/"
+    player_data_path: str = "data/playerData.json"
+    player_data_compression: str = "none"
+    beastball_image_path: str = "frontend/assets/bullet.jpg"
+
+    # Player
+    starting_beastballs: int = 20
+
+    # Display
+    screen_width: int = 900
+    screen_height: int = 600
+    fps: int = 60
+    # Game simulation steps per second; catch and explore speeds are per step
+    sim_hz: int = 60
+
+    # Frame profiler (F3 overlay, F4 trace dump)
+    frame_profiler_frames: int = 600
+    frame_trace_dir: str = "data/traces"
+    frame_trace_on_exit: bool = False
+
+    # Catch game
+    catch_base_size: int = 60
+    catch_base_speed: float = 2.5
+    catch_base_shots: int = 2
+    catcher_speed: int = 6
+    beastball_speed: int = 9
+    beastball_cooldown_ms: int = 180
+
+    # Explore game: the world is explore_world_screens screens on each side,
+    # drawn in square chunks of explore_chunk_px, at most explore_chunk_cache kept
+    person_speed: int = 4
+    explore_world_screens: int = 3
+    explore_chunk_px: int = 256
+    explore_chunk_cache: int = 64
+
+    # Caches
+    image_cache_mb: int = 64
+    text_cache_entries: int = 512
+
+    # Generated image GC; an interval of 0 leaves the background collector off
+    image_disk_budget_mb: int = 512
+    image_gc_grace_hours: float = 24
+    image_gc_interval_minutes: float = 0
+
+
+# Smallest accepted value of numeric fields; anything below (e.g. FPS 0 or a
+# negative number of beastballs) keeps the default
+_MINIMUMS: Dict[str, float] = {
+    "starting_beastballs": 0,
+    "screen_width": 1,
+    "screen_height": 1,
+    "fps": 1,
+    "sim_hz": 1,
+    "frame_profiler_frames": 1,
+    "catch_base_size": 1,
+    "catch_base_speed": 0,
+    "catch_base_shots": 1,
+    "catcher_speed": 1,
+    "beastball_speed": 1,
+    "beastball_cooldown_ms": 0,
+    "person_speed": 1,
+    "explore_world_screens": 1,
+    "explore_chunk_px": 32,
+    "explore_chunk_cache": 1,
+    "image_cache_mb": 0,
+    "text_cache_entries": 0,
+    "image_disk_budget_mb": 0,
+    "image_gc_grace_hours": 0,
+    "image_gc_interval_minutes": 0,
+}
+
+
+def _accepts(kind: type, value) -> bool:
+    """Whether a parsed YAML value has the field's type; ints count as floats, bools as nothing else."""
+    if kind is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if kind is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    return isinstance(value, kind)
+
+
+def parse_config(data: Optional[dict]) -> Config:
+    """Build a Config from parsed YAML; missing values, and values of the wrong type or out of range, keep their defaults.
+
+    Values are checked, not converted: 2.5 for an int field or "false" (quoted) for
+    a bool field is rejected rather than read as 2 or True.
+    """
+    data = data or {}
+    values = {}
+    for field in fields(Config):
+        key = field.name.upper()
+        if key not in data:
+            continue
+        value = data[key]
+        minimum = _MINIMUMS.get(field.name)
+        if not _accepts(field.type, value):
+            print(f"Error: config value {key}={value!r} is not a valid {field.type.__name__}; using the default.")
+        elif minimum is not None and value < minimum:
+            print(f"Error: config value {key}={value!r} is below the minimum of {minimum}; using the default.")
+        else:
+            values[field.name] = field.type(value)
+    return replace(Config(), **values)
+
+
+def load_config(path: str = CONFIG_PATH) -> Config:
+    """Parse `path`; a missing or unreadable file gives the defaults."""
+    try:
+        with open(path, "r") as f:
+            return parse_config(yaml.safe_load(f))
+    except FileNotFoundError:
+        return Config()
+    except yaml.YAMLError as e:
+        print(f"Error: could not parse {path}: {e}")
+        return Config()
+
+
+# ---------------- Current snapshot ---------------- #
+_lock = threading.Lock()
+_config: Optional[Config] = None
+_mtime: Optional[float] = None
+_watcher: Optional[threading.Thread] = None
+_stop_watching = threading.Event()
+
+
+def _file_mtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def get_config() -> Config:
+    """The current snapshot, parsed on first use."""
+    global _config, _mtime
+    if _config is None:
+        with _lock:
+            if _config is None:
+                _mtime = _file_mtime(CONFIG_PATH)
+                _config = load_config(CONFIG_PATH)
+    return _config
+
+
+def reload_config() -> bool:
+    """Re-read config.yaml; returns True if any value changed.
+
+    A file that fails to parse keeps the current snapshot rather than falling back
+    to the defaults mid-game.
+    """
+    global _config, _mtime
+    old = get_config()
+    with _lock:
+        _mtime = _file_mtime(CONFIG_PATH)
+        try:
+            with open(CONFIG_PATH, "r") as f:
+                new = parse_config(yaml.safe_load(f))
+        except (OSError, yaml.YAMLError) as e:
+            print(f"Error: could not reload {CONFIG_PATH}: {e}")
+            return False
+        if new == old:
+            return False
+        _config = new
+    return True
+
+
+def _watch(interval: float) -> None:
+    while not _stop_watching.wait(interval):
+        if _file_mtime(CONFIG_PATH) != _mtime:
+            reload_config()
+
+
+def start_watching(interval: float = 1.0) -> None:
+    """Poll config.yaml every `interval` seconds on a daemon thread and reload it when it changes."""
+    global _watcher
+    get_config()
+    if _watcher is not None and _watcher.is_alive():
+        return
+    _stop_watching.clear()
+    _watcher = threading.Thread(target=_watch, args=(interval,), name="config-watcher", daemon=True)
+    _watcher.start()
+
+
+def stop_watching() -> None:
+    global _watcher
+    _stop_watching.set()
+    if _watcher is not None:
+        _watcher.join()
+        _watcher = None
@@ -1,12 +1,36 @@
-from typing import List, Dict, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import json
 import os
-import yaml
+import sys
+import threading
+import uuid
 
-with open('config.yaml', 'r') as file:
-    config = yaml.safe_load(file)
+from backend.config import get_config
+from backend.schema import SCHEMA_VERSION, upgrade_record
+from backend.playerIndex import PlayerIndex
+from backend.leaderboard import Leaderboard
+from backend.playerStream import COMPRESSIONS, CORRUPT_FILE_ERRORS, dump_players, iter_player_file, open_player_file, temp_path_for
+
+
+# Number of history entries materialized at a time by a HistoryView page
+HISTORY_PAGE_SIZE = 20
+
+def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """(inode, size, mtime) of a storage file, or None if it doesn't exist; every atomic save changes it."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _intern(value):
+    """Intern repeated strings (species, epochs, places, image paths) so loaded records share one copy."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 class AnimalGameFeats:
+    __slots__ = ("speed", "shotsRequired")
+
     def __init__(self, size: float):
         self.speed = self.set_speed(size)
         self.shotsRequired = self.set_shots_required(size)
@@ -33,11 +57,15 @@ class AnimalGameFeats:
         return instance
 
 class Animal:
-    def __init__(self, species: str, epoch: str, size: float, imagePath: str, description: str = ""):
-        self.species = species
-        self.epoch = epoch
+    __slots__ = ("animalId", "species", "epoch", "size", "imagePath", "description", "gameFeats")
+
+    def __init__(self, species: str, epoch: str, size: float, imagePath: str, description: str = "", animalId: Optional[str] = None):
+        # Stable per-player id; history records reference the animal by this id
+        self.animalId = animalId or uuid.uuid4().hex[:12]
+        self.species = _intern(species)
+        self.epoch = _intern(epoch)
         self.size = size
-        self.imagePath = imagePath
+        self.imagePath = _intern(imagePath)
         self.description = description
         self.gameFeats = AnimalGameFeats(self.size)
     
@@ -48,29 +76,34 @@ class Animal:
             "epoch": self.epoch,
             "size": self.size,
             "imagePath": self.imagePath,
+            "description": self.description,
             "gameFeats": self.gameFeats.to_dict()
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Animal':
+    def from_dict(cls, data: Dict, animalId: Optional[str] = None) -> 'Animal':
         """Create an Animal instance from a dictionary."""
         instance = cls(
             species=data["species"],
             epoch=data["epoch"],
             size=data["size"],
-            imagePath=data["imagePath"]
+            imagePath=data["imagePath"],
+            description=data["description"],
+            animalId=animalId
         )
         instance.gameFeats = AnimalGameFeats.from_dict(data["gameFeats"])
         return instance
 
 class BeastBall:
     def __init__(self):
-        self.imagePath = config['BEASTBALL_IMAGE_PATH']
+        self.imagePath = get_config().beastball_image_path
 
 class GameRecord:
+    __slots__ = ("date", "place", "timeMYA", "beastballsUsed", "animalCaught")
+
     def __init__(self, date: str, place: str, timeMYA: int, beastballsUsed: int, animalCaught: Animal):
         self.date = date
-        self.place = place
+        self.place = _intern(place)
         self.timeMYA = timeMYA
         self.beastballsUsed = beastballsUsed
         self.animalCaught = animalCaught
@@ -82,21 +115,23 @@ class GameRecord:
             "place": self.place,
             "timeMYA": self.timeMYA,
             "beastballsUsed": self.beastballsUsed,
-            "animalCaught": self.animalCaught.to_dict()
+            "animalCaught": self.animalCaught.animalId
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'GameRecord':
-        """Create a GameRecord instance from a dictionary."""
+    def from_dict(cls, data: Dict, animals: Dict[str, Animal]) -> 'GameRecord':
+        """Create a GameRecord instance from a dictionary, resolving the animal id via `animals`."""
         return cls(
             date=data["date"],
             place=data["place"],
             timeMYA=data["timeMYA"],
             beastballsUsed=data["beastballsUsed"],
-            animalCaught=Animal.from_dict(data["animalCaught"])
+            animalCaught=animals[data["animalCaught"]]
         )
 
 class BattleRecord:
+    __slots__ = ("date", "animal", "beastballChange")
+
     def __init__(self, date: str, animal: Animal, beastballChange: int):
         self.date = date
         self.animal = animal
@@ -106,85 +141,365 @@ class BattleRecord:
         """Convert BattleRecord to a JSON-serializable dictionary."""
         return {
             "date": self.date,
-            "animal": self.animal.to_dict(),
+            "animal": self.animal.animalId,
             "beastballChange": self.beastballChange
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'BattleRecord':
-        """Create a BattleRecord instance from a dictionary."""
+    def from_dict(cls, data: Dict, animals: Dict[str, Animal]) -> 'BattleRecord':
+        """Create a BattleRecord instance from a dictionary, resolving the animal id via `animals`."""
         return cls(
             date=data["date"],
-            animal=Animal.from_dict(data["animal"]),
+            animal=animals[data["animal"]],
             beastballChange=data["beastballChange"]
         )
 
+class PlayerStats:
+    """Running totals kept in the player header so rankings don't need the histories."""
+    __slots__ = ("catches", "games", "beastballsUsed", "epochs")
+
+    def __init__(self):
+        self.catches = 0
+        self.games = 0
+        self.beastballsUsed = 0
+        self.epochs: Dict[str, int] = {}
+
+    def to_dict(self) -> Dict:
+        """Convert PlayerStats to a JSON-serializable dictionary."""
+        return {
+            "catches": self.catches,
+            "games": self.games,
+            "beastballsUsed": self.beastballsUsed,
+            "epochs": dict(self.epochs)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'PlayerStats':
+        """Create a PlayerStats instance from a dictionary."""
+        instance = cls()
+        instance.catches = data["catches"]
+        instance.games = data["games"]
+        instance.beastballsUsed = data["beastballsUsed"]
+        instance.epochs = {_intern(epoch): count for epoch, count in data["epochs"].items()}
+        return instance
+
+
+class AnimalTable(dict):
+    """A player's id -> Animal table that builds each Animal the first time it is looked up."""
+
+    def __init__(self, raw: Optional[Dict[str, Dict]] = None):
+        super().__init__()
+        self.raw = raw or {}
+
+    def __missing__(self, animal_id: str) -> Animal:
+        # Drop the serialized copy once built; to_dict() re-serializes the Animal
+        animal = Animal.from_dict(self.raw.pop(animal_id), animalId=animal_id)
+        self[animal_id] = animal
+        return animal
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Serialized table: untouched raw entries plus every materialized animal."""
+        table = dict(self.raw)
+        for animal_id, animal in self.items():
+            table[animal_id] = animal.to_dict()
+        return table
+
+
+class HistoryView:
+    """Paged, iterable view over one of a player's collections.
+
+    Entries stay in their serialized form until the page holding them is first
+    accessed, then `build` turns that whole page into entity objects. Pages that
+    were never touched are written back as-is by `serialize`.
+    """
+    __slots__ = ("_entries", "_loaded", "_cls", "_build", "page_size")
+
+    def __init__(self, entries: List, cls: type, build: Callable, page_size: int = HISTORY_PAGE_SIZE):
+        self._entries = entries
+        self._loaded = set()
+        self._cls = cls
+        self._build = build
+        self.page_size = page_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def page_count(self) -> int:
+        return (len(self._entries) + self.page_size - 1) // self.page_size
+
+    def page(self, index: int) -> List:
+        """Materialize (once) and return page `index`."""
+        start = index * self.page_size
+        stop = min(start + self.page_size, len(self._entries))
+        if index not in self._loaded:
+            for i in range(start, stop):
+                entry = self._entries[i]
+                if not isinstance(entry, self._cls):
+                    self._entries[i] = self._build(entry)
+            if stop - start == self.page_size:
+                # A partial last page may still grow; only full pages are marked done
+                self._loaded.add(index)
+        return self._entries[start:stop]
+
+    def pages(self) -> Iterator[List]:
+        for index in range(self.page_count):
+            yield self.page(index)
+
+    def __iter__(self) -> Iterator:
+        for page in self.pages():
+            yield from page
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._entries)))]
+        if index < 0:
+            index += len(self._entries)
+        if not 0 <= index < len(self._entries):
+            raise IndexError("history index out of range")
+        return self.page(index // self.page_size)[index % self.page_size]
+
+    def append(self, item) -> None:
+        self._entries.append(item)
+
+    def serialize(self, dump: Callable) -> List:
+        """Serialized entries; materialized ones go through `dump`, the rest are reused as-is."""
+        return [dump(entry) if isinstance(entry, self._cls) else entry for entry in self._entries]
+
+
 class Player:
+    __slots__ = ("username", "beastball_left", "stats", "_animals", "_battle_history", "_game_history", "_caught_animals")
+
     def __init__(self, username: str):
         self.username = username
-        self.beastball_left = config['STARTING_BEASTBALLS']
-        self.battle_history: List[BattleRecord] = []
-        self.game_history: List[GameRecord] = []
-        self.caught_animals: List[Animal] = []
+        self.beastball_left = get_config().starting_beastballs
+        self.stats = PlayerStats()
+        self._animals = AnimalTable()
+        self.battle_history = []
+        self.game_history = []
+        self.caught_animals = []
+
+    # History collections are HistoryViews; assigning a plain list wraps it.
+    @property
+    def battle_history(self) -> HistoryView:
+        return self._battle_history
+
+    @battle_history.setter
+    def battle_history(self, records: List) -> None:
+        self._battle_history = HistoryView(list(records), BattleRecord,
+                                           lambda data: BattleRecord.from_dict(data, self._animals))
+
+    @property
+    def game_history(self) -> HistoryView:
+        return self._game_history
+
+    @game_history.setter
+    def game_history(self, records: List) -> None:
+        self._game_history = HistoryView(list(records), GameRecord,
+                                         lambda data: GameRecord.from_dict(data, self._animals))
+
+    @property
+    def caught_animals(self) -> HistoryView:
+        return self._caught_animals
+
+    @caught_animals.setter
+    def caught_animals(self, animals: List) -> None:
+        self._caught_animals = HistoryView(list(animals), Animal,
+                                           lambda animal_id: self._animals[animal_id])
 
     def to_dict(self) -> Dict:
-        """Convert Player to a JSON-serializable dictionary."""
+        """Convert Player to a JSON-serializable dictionary.
+
+        Each animal is stored once in the "animals" table; caught_animals and the
+        history records only hold animal ids. History pages that were never loaded
+        are written back without being materialized.
+        """
         return {
+            "version": SCHEMA_VERSION,
             "beastballs": self.beastball_left,
-            "battle_history": [record.to_dict() for record in self.battle_history],
-            "game_history": [record.to_dict() for record in self.game_history],
-            "caught_animals": [animal.to_dict() for animal in self.caught_animals]
+            "stats": self.stats.to_dict(),
+            "animals": self._animals.to_dict(),
+            "battle_history": self.battle_history.serialize(BattleRecord.to_dict),
+            "game_history": self.game_history.serialize(GameRecord.to_dict),
+            "caught_animals": self.caught_animals.serialize(lambda animal: animal.animalId)
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Player':
-        """Create a Player instance from a dictionary."""
+        """Create a Player instance from a dictionary.
+
+        Older records are upgraded to the current schema first. Only the header
+        (username, beastballs, stats) is read eagerly; animals and history records are
+        built page by page as they are accessed.
+        """
+        data = upgrade_record(data)
         player = cls(username=data["username"])
         player.beastball_left = data["beastballs"]
-        player.battle_history = [BattleRecord.from_dict(record) for record in data["battle_history"]]
-        player.game_history = [GameRecord.from_dict(record) for record in data["game_history"]]
-        player.caught_animals = [Animal.from_dict(animal) for animal in data["caught_animals"]]
+        player.stats = PlayerStats.from_dict(data["stats"])
+        player._animals = AnimalTable(data.get("animals", {}))
+        player.battle_history = data["battle_history"]
+        player.game_history = data["game_history"]
+        player.caught_animals = data["caught_animals"]
         return player
 
+    def _register_animal(self, animal: Animal):
+        self._animals[animal.animalId] = animal
+
     def add_caught_animal(self, animal: Animal):
+        self._register_animal(animal)
         self.caught_animals.append(animal)
+        self.stats.catches += 1
+        self.stats.epochs[animal.epoch] = self.stats.epochs.get(animal.epoch, 0) + 1
     
     def add_game_history(self, record: GameRecord):
+        self._register_animal(record.animalCaught)
         self.game_history.append(record)
+        self.stats.games += 1
+        self.stats.beastballsUsed += record.beastballsUsed
     
     def add_battle_history(self, record: BattleRecord):
+        self._register_animal(record.animal)
         self.battle_history.append(record)
 
-    def get_game_history(self) -> List[GameRecord]:
+    def get_game_history(self) -> HistoryView:
         return self.game_history
 
 
 class PlayerManager:
-    def __init__(self, file_path: str = "data/playerData.json"):
-        self.file_path = file_path
+    def __init__(self, file_path: Optional[str] = None, compression: Optional[str] = None):
+        self.file_path = file_path or get_config().player_data_path
+        # Applies to writes; reads detect each file's compression, so switching is seamless
+        self.compression = compression or get_config().player_data_compression
+        if self.compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {self.compression!r}; expected one of {COMPRESSIONS}")
+        self._ensure_storage()
+        # Guards reads and writes of the player file; subclasses may use one lock per file
+        self._lock = threading.RLock()
+        # Secondary indexes and leaderboard; built on first use, then updated on every write.
+        # _derived_signature is the storage as they last saw it: if another manager or
+        # process has written since, they are rebuilt on the next query.
+        self._derived_lock = threading.RLock()
+        self._index: Optional[PlayerIndex] = None
+        self._leaderboard: Optional[Leaderboard] = None
+        self._derived_signature: Optional[Dict[str, Tuple[int, int, int]]] = None
+
+    # ---------------- Storage layout ---------------- #
+    def _ensure_storage(self) -> None:
         # Ensure the JSON file exists; create an empty one if it doesn't
-        if not os.path.exists(file_path):
-            with open(file_path, 'w') as f:
+        if not os.path.exists(self.file_path):
+            with open(self.file_path, 'w') as f:
                 json.dump({}, f)
 
-    def _load_players(self) -> Dict:
-        """Load the player data from the JSON file."""
+    def _storage_paths(self) -> List[str]:
+        """Every file that holds player records."""
+        return [self.file_path]
+
+    def _load_players(self, path: Optional[str] = None) -> Dict:
+        """Load the player data from a JSON file (default: file_path)."""
+        path = path or self.file_path
         try:
-            with open(self.file_path, 'r') as f:
+            with open_player_file(path) as f:
                 return json.load(f)
-        except json.JSONDecodeError:
+        except FileNotFoundError:
+            return {}
+        except CORRUPT_FILE_ERRORS:
             # If the file is empty or corrupted, return an empty dict
             return {}
 
-    def _save_players(self, players: Dict) -> None:
-        """Save the player data to the JSON file."""
+    def _save_players(self, players: Dict, path: Optional[str] = None) -> None:
+        """Save the player data to a JSON file (default: file_path).
+
+        Written to a temporary file and swapped in, so streaming readers never see
+        a partially written file.
+        """
+        path = path or self.file_path
+        tmp_path = None
         try:
-            with open(self.file_path, 'w') as f:
-                json.dump(players, f, indent=4)
-        except PermissionError:
-            print(f"Error: No permission to write to {self.file_path}")
+            # Unique temp name: other managers or processes may be writing the same file
+            tmp_path = temp_path_for(path)
+            with open_player_file(tmp_path, 'w', self.compression) as f:
+                dump_players(players, f, self.compression)
+            os.replace(tmp_path, path)
+        except BaseException as e:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            if isinstance(e, PermissionError):
+                print(f"Error: No permission to write to {path}")
             raise
 
+    def _get_record(self, username: str) -> Optional[Dict]:
+        """Serialized record for `username`, or None."""
+        with self._lock:
+            return self._load_players().get(username)
+
+    def _put_record(self, username: str, record: Dict, create: bool) -> bool:
+        """Write `record`; fails if `create` and the player exists, or if not `create` and they don't."""
+        with self._lock:
+            before = self._signatures([self.file_path])
+            players = self._load_players()
+            if (username in players) == create:
+                return False
+            players[username] = record
+            self._save_players(players)
+            self._write_record(username, record, before)
+        return True
+
+    def iter_records(self) -> Iterator[Tuple[str, Dict]]:
+        """Stream (username, serialized record) pairs without loading whole files."""
+        for path in self._storage_paths():
+            try:
+                yield from iter_player_file(path)
+            except CORRUPT_FILE_ERRORS:
+                # Same policy as _load_players: a corrupted file reads as no players
+                print(f"Error: {path} is not valid JSON; skipping the rest of it.")
+
+    def invalidate_derived(self) -> None:
+        """Drop the indexes and leaderboard; they are rebuilt from storage on next use.
+
+        Call after replacing storage files behind the manager's back (e.g. an import).
+        """
+        with self._derived_lock:
+            self._index = None
+            self._leaderboard = None
+            self._derived_signature = None
+
+    def _signatures(self, paths: List[str]) -> Dict[str, Tuple[int, int, int]]:
+        return {path: sig for path in paths for sig in [_file_signature(path)] if sig is not None}
+
+    def _check_derived(self) -> None:
+        """Drop the indexes and leaderboard if the storage changed since they last saw it."""
+        with self._derived_lock:
+            current = self._signatures(self._storage_paths())
+            if current != self._derived_signature:
+                self._index = None
+                self._leaderboard = None
+                self._derived_signature = current
+
+    def _write_record(self, username: str, record: Dict, before: Dict[str, Tuple[int, int, int]]) -> None:
+        """Keep the secondary indexes and leaderboard in step with a record that was just written.
+
+        `before` holds the signatures of the files written, taken under their lock
+        before they were read. If someone else had written them since the indexes
+        last looked, patching in this one record isn't enough, so they are dropped.
+        """
+        with self._derived_lock:
+            if self._derived_signature is None:
+                return
+            if any(self._derived_signature.get(path) != sig for path, sig in before.items()):
+                self.invalidate_derived()
+                return
+            if self._index is not None:
+                self._index.update(username, record)
+            if self._leaderboard is not None:
+                self._leaderboard.update(username, record["stats"])
+            for path in before:
+                sig = _file_signature(path)
+                if sig is None:
+                    self._derived_signature.pop(path, None)
+                else:
+                    self._derived_signature[path] = sig
+
+    # ---------------- Player API ---------------- #
     def save_player(self, player: Player) -> bool:
         """Save a Player object to the JSON file.
         
@@ -197,12 +512,9 @@ class PlayerManager:
         if not player.username.strip():
             print("Username cannot be empty.")
             return False
-        players = self._load_players()
-        if player.username in players:
+        if not self._put_record(player.username, player.to_dict(), create=True):
             print(f"Username '{player.username}' already exists. Use update_player to modify.")
             return False
-        players[player.username] = player.to_dict()
-        self._save_players(players)
         print(f"Player '{player.username}' saved successfully.")
         return True
 
@@ -218,12 +530,9 @@ class PlayerManager:
         if not player.username.strip():
             print("Username cannot be empty.")
             return False
-        players = self._load_players()
-        if player.username not in players:
+        if not self._put_record(player.username, player.to_dict(), create=False):
             print(f"Username '{player.username}' not found.")
             return False
-        players[player.username] = player.to_dict()
-        self._save_players(players)
         print(f"Player '{player.username}' updated successfully.")
         return True
 
@@ -239,8 +548,7 @@ class PlayerManager:
         if not username.strip():
             print("Username cannots be empty.")
             return None
-        players = self._load_players()
-        player_data = players.get(username)
+        player_data = self._get_record(username)
         if player_data:
             # Add username to player_data for from_dict
             player_data["username"] = username
@@ -248,6 +556,72 @@ class PlayerManager:
         print(f"Player '{username}' not found.")
         return None
 
+    # ---------------- Secondary-index queries ---------------- #
+    def _get_index(self) -> PlayerIndex:
+        with self._derived_lock:
+            self._check_derived()
+            if self._index is None:
+                self._index = PlayerIndex().build(self.iter_records())
+            return self._index
+
+    def players_with_species(self, species: str) -> List[str]:
+        """Usernames of every player who has caught `species`."""
+        return self._get_index().players_with_species(species)
+
+    def _indexed_records(self, refs: Dict[str, List]) -> Iterator[Tuple[Dict, List]]:
+        """(upgraded record, refs) for each player the index referred to; loaded one at a time."""
+        for username, user_refs in refs.items():
+            record = self._get_record(username)
+            if record is not None:
+                yield upgrade_record(record), user_refs
+
+    def animals_in_epoch(self, epoch: str, username: Optional[str] = None) -> List[Animal]:
+        """Caught animals from `epoch`, for one player or for everyone."""
+        refs = self._get_index().animals_in_epoch(epoch, username)
+        return [Animal.from_dict(record["animals"][animal_id], animalId=animal_id)
+                for record, animal_ids in self._indexed_records(refs)
+                for animal_id in animal_ids
+                # The record may have been rewritten since it was indexed
+                if animal_id in record["animals"]]
+
+    def game_records_at_place(self, place: str, username: Optional[str] = None) -> List[GameRecord]:
+        """Game records of catches made at `place`, for one player or for everyone."""
+        refs = self._get_index().game_records_at_place(place, username)
+        results = []
+        for record, positions in self._indexed_records(refs):
+            games, animals = record["game_history"], record["animals"]
+            for position in positions:
+                if position >= len(games) or games[position]["animalCaught"] not in animals:
+                    continue
+                game = games[position]
+                animal_id = game["animalCaught"]
+                results.append(GameRecord.from_dict(game, {animal_id: Animal.from_dict(animals[animal_id], animalId=animal_id)}))
+        return results
+
+    # ---------------- Leaderboard ---------------- #
+    def get_leaderboard(self) -> Leaderboard:
+        """The leaderboard, rebuilt first if any manager or process has written since it was built."""
+        with self._derived_lock:
+            self._check_derived()
+            if self._leaderboard is None:
+                self.rebuild_leaderboard()
+            return self._leaderboard
+
+    def rebuild_leaderboard(self) -> Leaderboard:
+        """Recompute every board from scratch in one streaming pass over the players."""
+        with self._derived_lock:
+            self._check_derived()
+            self._leaderboard = Leaderboard.rebuild(self.iter_records())
+            return self._leaderboard
+
+    def top_players(self, board: str, k: int = 10) -> List[Tuple[str, float]]:
+        """The k best (username, value) pairs on a board ("catches", "efficiency" or "epochs")."""
+        return self.get_leaderboard().top(board, k)
+
+    def player_rank(self, board: str, username: str) -> Optional[int]:
+        """1-based rank of `username` on a board, or None if they are not ranked on it."""
+        return self.get_leaderboard().rank(board, username)
+
 # # Example usage
 # if __name__ == "__main__":
 #     # Initialize the PlayerManager
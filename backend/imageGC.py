@@ -0,0 +1,227 @@
+# imageGC.py — garbage collection of generated world images
+#
+# Every generated world saves UUID-named PNGs under data/images/animals/ and
+# data/images/backgrounds/. An image is live while a player record points at it
+# (an Animal's imagePath) or while its world is pinned in this process (recent
+# worlds the player can still walk back into). Sprites processed from an image
+# (data/images/sprites/, see spritePipeline) live exactly as long as it does.
+# Everything else is garbage:
+#
+#   mark   stream every player record and collect the image paths they reference
+#   sweep  delete unreferenced files older than the grace period, then, while the
+#          directories are over the disk budget, evict unreferenced files least
+#          recently used first
+#
+# Both phases are generators that do a bounded amount of work per step, so the
+# collector can be run a step at a time, or on a background thread that sleeps
+# between steps and never holds up a frame.
+#
+#   python -m backend.imageGC [--dry-run] [--grace-hours 24] [--budget-mb 512]
+import argparse
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from backend.config import get_config
+from backend.entities import PlayerManager
+from backend.playerShards import ShardedPlayerManager
+from backend.schema import upgrade_record
+from backend.spritePipeline import SPRITE_DIR, derived_paths
+
+IMAGE_DIRS = ("data/images/animals/", "data/images/backgrounds/", SPRITE_DIR)
+
+# Records marked or files examined per step
+STEP_SIZE = 200
+
+# Never evict a file this young, even over budget: it may still be being written
+MIN_EVICT_AGE_SECONDS = 300
+
+# Worlds whose images stay pinned in this process
+RECENT_WORLDS = 8
+
+
+def _norm(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _with_sprites(path: str) -> List[str]:
+    """`path` and the sprite files processed from it, which live exactly as long as it does."""
+    return [_norm(p) for p in [path] + derived_paths(path)]
+
+
+# ---------------- Live worlds ---------------- #
+_worlds_lock = threading.Lock()
+_live_worlds: "OrderedDict[Hashable, Set[str]]" = OrderedDict()
+
+
+def pin_world_images(world: Hashable, paths: Iterable[Optional[str]]) -> None:
+    """Keep the images of `world` alive; only the RECENT_WORLDS most recent worlds stay pinned."""
+    with _worlds_lock:
+        pinned = _live_worlds.setdefault(world, set())
+        for path in paths:
+            if path:
+                pinned.update(_with_sprites(path))
+        _live_worlds.move_to_end(world)
+        while len(_live_worlds) > RECENT_WORLDS:
+            _live_worlds.popitem(last=False)
+
+
+def pinned_images() -> Set[str]:
+    with _worlds_lock:
+        return set().union(*_live_worlds.values())
+
+
+# ---------------- Collector ---------------- #
+class ImageGC:
+    def __init__(self, manager: PlayerManager, directories: Iterable[str] = IMAGE_DIRS,
+                 grace_seconds: Optional[float] = None, budget_bytes: Optional[int] = None,
+                 dry_run: bool = False):
+        config = get_config()
+        self.manager = manager
+        self.directories = list(directories)
+        self.grace_seconds = config.image_gc_grace_hours * 3600 if grace_seconds is None else grace_seconds
+        self.budget_bytes = config.image_disk_budget_mb * 1024 * 1024 if budget_bytes is None else budget_bytes
+        self.dry_run = dry_run
+        self.referenced: Set[str] = set()
+        self.stats: Dict[str, int] = {}
+
+    def mark(self) -> Iterator[None]:
+        """Collect every image path referenced by a player record, STEP_SIZE records per step."""
+        referenced: Set[str] = set()
+        for count, (_, record) in enumerate(self.manager.iter_records(), 1):
+            for animal in upgrade_record(record).get("animals", {}).values():
+                if animal.get("imagePath"):
+                    referenced.update(_with_sprites(animal["imagePath"]))
+            if count % STEP_SIZE == 0:
+                yield
+        self.referenced = referenced
+        self.stats["referenced"] = len(referenced)
+
+    def _scan(self) -> Iterator[Optional[Tuple[str, int, float, float]]]:
+        """(path, size, last use, mtime) for each file; yields None between steps."""
+        for directory in self.directories:
+            try:
+                entries = os.scandir(directory)
+            except FileNotFoundError:
+                continue
+            with entries:
+                for count, entry in enumerate(entries, 1):
+                    if entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        # atime is only a hint on relatime mounts; a rewrite counts as a use too
+                        yield entry.path, st.st_size, max(st.st_atime, st.st_mtime), st.st_mtime
+                    if count % STEP_SIZE == 0:
+                        yield None
+
+    def _delete(self, path: str) -> bool:
+        if self.dry_run:
+            return True
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+        except PermissionError:
+            print(f"Error: No permission to delete {path}")
+            return False
+
+    def sweep(self) -> Iterator[None]:
+        """Delete expired unreferenced files, then evict LRU unreferenced files down to the budget."""
+        now = time.time()
+        live = self.referenced | pinned_images()
+        total = 0
+        candidates: List[Tuple[float, str, int, float]] = []
+        deleted = freed = 0
+        for item in self._scan():
+            if item is None:
+                yield
+                continue
+            path, size, last_use, mtime = item
+            if _norm(path) in live:
+                total += size
+            elif now - mtime > self.grace_seconds:
+                if self._delete(path):
+                    deleted += 1
+                    freed += size
+            else:
+                total += size
+                candidates.append((last_use, path, size, mtime))
+
+        evicted = 0
+        if self.budget_bytes and total > self.budget_bytes:
+            candidates.sort()
+            for count, (_, path, size, mtime) in enumerate(candidates, 1):
+                if total <= self.budget_bytes:
+                    break
+                if now - mtime < MIN_EVICT_AGE_SECONDS or _norm(path) in pinned_images():
+                    continue
+                if self._delete(path):
+                    evicted += 1
+                    freed += size
+                    total -= size
+                if count % STEP_SIZE == 0:
+                    yield
+
+        self.stats.update(deleted=deleted, evicted=evicted, freed_bytes=freed, remaining_bytes=total)
+
+    def run(self) -> Iterator[None]:
+        """One full collection as a series of small steps."""
+        self.stats = {}
+        yield from self.mark()
+        yield from self.sweep()
+
+    def collect(self) -> Dict[str, int]:
+        """Run a whole collection now; returns its stats."""
+        for _ in self.run():
+            pass
+        return self.stats
+
+
+def start_background_gc(manager: PlayerManager, interval: float = 3600, step_pause: float = 0.005,
+                        **kwargs) -> threading.Event:
+    """Collect every `interval` seconds on a daemon thread; set the returned event to stop it.
+
+    The thread sleeps `step_pause` between steps so it never holds the GIL for long.
+    """
+    stop = threading.Event()
+
+    def loop():
+        while not stop.is_set():
+            gc = ImageGC(manager, **kwargs)
+            try:
+                for _ in gc.run():
+                    if stop.wait(step_pause):
+                        return
+            except Exception as e:
+                print(f"Error: image GC failed: {e}")
+            stop.wait(interval)
+
+    threading.Thread(target=loop, name="image-gc", daemon=True).start()
+    return stop
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delete generated images no player references.")
+    storage = parser.add_mutually_exclusive_group()
+    storage.add_argument("--players", help="Single-file player storage (default: PLAYER_DATA_PATH in config.yaml)")
+    storage.add_argument("--sharded", help="Sharded player directory, e.g. data/players")
+    parser.add_argument("--grace-hours", type=float, help="Keep unreferenced files younger than this (default: IMAGE_GC_GRACE_HOURS)")
+    parser.add_argument("--budget-mb", type=float, help="Disk budget for the image directories (default: IMAGE_DISK_BUDGET_MB)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be deleted without deleting it")
+    args = parser.parse_args()
+
+    manager = ShardedPlayerManager(args.sharded) if args.sharded else PlayerManager(args.players)
+    gc = ImageGC(manager,
+                 grace_seconds=None if args.grace_hours is None else args.grace_hours * 3600,
+                 budget_bytes=None if args.budget_mb is None else int(args.budget_mb * 1024 * 1024),
+                 dry_run=args.dry_run)
+    stats = gc.collect()
+    verb = "Would free" if args.dry_run else "Freed"
+    print(f"{verb} {stats['freed_bytes'] / 1e6:.1f} MB: {stats['deleted']} expired and {stats['evicted']} evicted files; "
+          f"{stats['referenced']} images referenced, {stats['remaining_bytes'] / 1e6:.1f} MB remaining.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# imageOps.py — whole-image pixel operations for sprites
+#
+# dominant_color finds the most common color of a Surface, which for generated
+# sprites is almost always the flat background. With NumPy installed it works on
+# the pixel array through pygame.surfarray; without it, the pixels are read once
+# with pygame.image.tobytes and counted by a Counter, which is still far faster
+# than calling get_at per pixel.
+#
+# Two optional heuristics:
+#   quantize  drop this many low bits per channel before counting, so JPEG noise
+#             around a flat background lands in one bucket; the result is the most
+#             common exact color inside the winning bucket
+#   edges     count only a border `edges` pixels wide; a sprite's background
+#             touches the edges while the subject usually sits in the middle
+from collections import Counter
+from typing import Tuple
+
+import pygame
+
+try:
+    import numpy as np
+    import pygame.surfarray
+except ImportError:  # optional: the pure-Python path below is used instead
+    np = None
+
+Color = Tuple[int, int, int]
+
+
+def _pack(r, g, b):
+    return (r << 16) | (g << 8) | b
+
+
+def _unpack(packed: int) -> Color:
+    return (packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF
+
+
+def _border(pixels, edges: int):
+    """Pixels of a width x height x 3 array within `edges` of the border, as an N x 3 array."""
+    w, h = pixels.shape[:2]
+    if edges <= 0 or 2 * edges >= min(w, h):
+        return pixels.reshape(-1, 3)
+    return np.concatenate([
+        pixels[:edges].reshape(-1, 3), pixels[-edges:].reshape(-1, 3),
+        pixels[edges:-edges, :edges].reshape(-1, 3), pixels[edges:-edges, -edges:].reshape(-1, 3),
+    ])
+
+
+def _dominant_numpy(surface: pygame.Surface, quantize: int, edges: int) -> Color:
+    pixels = _border(pygame.surfarray.array3d(surface), edges).astype(np.uint32)
+    packed = _pack(pixels[:, 0], pixels[:, 1], pixels[:, 2])
+    if quantize:
+        # Few enough buckets to count directly instead of sorting
+        bits = 8 - quantize
+        buckets = ((pixels[:, 0] >> quantize) << (2 * bits)) | ((pixels[:, 1] >> quantize) << bits) \
+            | (pixels[:, 2] >> quantize)
+        packed = packed[buckets == np.bincount(buckets).argmax()]
+    values, counts = np.unique(packed, return_counts=True)
+    return _unpack(int(values[counts.argmax()]))
+
+
+def _dominant_python(surface: pygame.Surface, quantize: int, edges: int) -> Color:
+    w, h = surface.get_size()
+    data = pygame.image.tobytes(surface, "RGB")
+    if edges > 0 and 2 * edges < min(w, h):
+        stride = w * 3
+        rows = [data[y * stride:(y + 1) * stride] for y in range(h)]
+        parts = rows[:edges] + rows[-edges:]
+        for row in rows[edges:-edges]:
+            parts.append(row[:edges * 3])
+            parts.append(row[-edges * 3:])
+        data = b"".join(parts)
+    colors = Counter(zip(data[0::3], data[1::3], data[2::3]))
+    if quantize:
+        mask = (0xFF << quantize) & 0xFF
+        buckets: Counter = Counter()
+        for (r, g, b), n in colors.items():
+            buckets[(r & mask, g & mask, b & mask)] += n
+        bucket = buckets.most_common(1)[0][0]
+        colors = Counter({c: n for c, n in colors.items()
+                          if (c[0] & mask, c[1] & mask, c[2] & mask) == bucket})
+    return colors.most_common(1)[0][0]
+
+
+def dominant_color(surface: pygame.Surface, quantize: int = 0, edges: int = 0) -> Color:
+    """The most common RGB color of `surface` (alpha ignored); (0, 0, 0) if it has no pixels."""
+    w, h = surface.get_size()
+    if w == 0 or h == 0:
+        return (0, 0, 0)
+    quantize = max(0, min(7, quantize))
+    if np is not None:
+        return _dominant_numpy(surface, quantize, edges)
+    return _dominant_python(surface, quantize, edges)
+
+
+def key_out_background(surface: pygame.Surface, quantize: int = 0, edges: int = 0) -> pygame.Surface:
+    """Make the dominant color of `surface` its colorkey, in place; returns the surface."""
+    surface.set_colorkey(dominant_color(surface, quantize, edges))
+    surface.set_alpha(None)
+    return surface
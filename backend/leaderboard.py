@@ -0,0 +1,164 @@
+# leaderboard.py — incrementally maintained player rankings
+#
+# Boards:
+#   catches    most animals caught
+#   efficiency fewest beastballs used per catch (players with at least one game)
+#   epochs     most distinct epochs covered
+#
+# Each board is a RankedSet (an indexable skip list), so updating one player is
+# O(log n), "my rank" is O(log n) and top-k is O(log n + k). The input is the
+# "stats" header of a player record, so a full rebuild is one streaming pass over
+# the records and never touches their histories.
+import random
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.schema import upgrade_record
+
+BOARDS = ("catches", "efficiency", "epochs")
+
+_MAX_LEVELS = 32  # enough for 2**32 players
+
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key, levels: int):
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * levels
+        # width[i]: how many positions next[i] is ahead of this node
+        self.width: List[int] = [1] * levels
+
+
+class RankedSet:
+    """Sorted set of unique keys with O(log n) insert, remove and rank lookups."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self._head = _Node(None, _MAX_LEVELS)
+        self._size = 0
+        self._random = random.Random(seed)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _random_levels(self) -> int:
+        levels = 1
+        while levels < _MAX_LEVELS and self._random.random() < 0.5:
+            levels += 1
+        return levels
+
+    def _predecessors(self, key) -> Tuple[List[_Node], List[int]]:
+        """Last node before `key` on every level, and its position (head = 0)."""
+        chain: List[_Node] = [self._head] * _MAX_LEVELS
+        positions = [0] * _MAX_LEVELS
+        node, position = self._head, 0
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.next[level] is not None and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            positions[level] = position
+        return chain, positions
+
+    def add(self, key) -> None:
+        chain, positions = self._predecessors(key)
+        following = chain[0].next[0]
+        if following is not None and following.key == key:
+            return
+        levels = self._random_levels()
+        node = _Node(key, levels)
+        position = positions[0] + 1  # position the new node takes
+        for level in range(_MAX_LEVELS):
+            prev = chain[level]
+            if level < levels:
+                node.next[level] = prev.next[level]
+                prev.next[level] = node
+                distance = position - positions[level]
+                node.width[level] = prev.width[level] - distance + 1
+                prev.width[level] = distance
+            else:
+                prev.width[level] += 1
+        self._size += 1
+
+    def discard(self, key) -> None:
+        chain, _ = self._predecessors(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            return
+        for level in range(_MAX_LEVELS):
+            prev = chain[level]
+            if prev.next[level] is node:
+                prev.width[level] += node.width[level] - 1
+                prev.next[level] = node.next[level]
+            else:
+                prev.width[level] -= 1
+        self._size -= 1
+
+    def rank(self, key) -> Optional[int]:
+        """0-based position of `key`, or None if absent."""
+        chain, positions = self._predecessors(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            return None
+        return positions[0]
+
+    def first(self, k: int) -> List:
+        keys, node = [], self._head.next[0]
+        while node is not None and len(keys) < k:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+
+def _board_keys(username: str, stats: Dict) -> Dict[str, Tuple]:
+    """Sort key per board; smaller sorts first, ties broken by username."""
+    keys = {
+        "catches": (-stats.get("catches", 0), username),
+        "epochs": (-len(stats.get("epochs", {})), username),
+    }
+    if stats.get("games", 0) > 0:
+        keys["efficiency"] = (stats["beastballsUsed"] / stats["games"], username)
+    return keys
+
+
+def _board_value(board: str, key: Tuple):
+    return key[0] if board == "efficiency" else -key[0]
+
+
+class Leaderboard:
+    def __init__(self):
+        self._boards: Dict[str, RankedSet] = {board: RankedSet() for board in BOARDS}
+        self._keys: Dict[str, Dict[str, Tuple]] = {}
+
+    @classmethod
+    def rebuild(cls, records: Iterable[Tuple[str, Dict]]) -> "Leaderboard":
+        """Build from scratch in one pass over (username, record) pairs."""
+        board = cls()
+        for username, record in records:
+            board.update(username, upgrade_record(record).get("stats", {}))
+        return board
+
+    def update(self, username: str, stats: Dict) -> None:
+        """Re-rank one player from their stats header; O(log n) per board."""
+        self.remove(username)
+        keys = _board_keys(username, stats)
+        for board, key in keys.items():
+            self._boards[board].add(key)
+        self._keys[username] = keys
+
+    def remove(self, username: str) -> None:
+        for board, key in self._keys.pop(username, {}).items():
+            self._boards[board].discard(key)
+
+    def top(self, board: str, k: int = 10) -> List[Tuple[str, float]]:
+        """The k best (username, value) pairs on `board`."""
+        return [(key[1], _board_value(board, key)) for key in self._boards[board].first(k)]
+
+    def rank(self, board: str, username: str) -> Optional[int]:
+        """1-based rank of `username` on `board`, or None if they are not ranked there."""
+        key = self._keys.get(username, {}).get(board)
+        if key is None:
+            return None
+        return self._boards[board].rank(key) + 1
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -0,0 +1,232 @@
+# playerExport.py — streaming export and import of player data as NDJSON
+#
+# Each line of an export is {"username": ..., "record": ...}. Players are read from
+# and written to PlayerManager storage one record at a time, so memory stays flat
+# however many players there are. Exports may be gzip or lzma compressed.
+#
+# Both directions checkpoint their progress to a small JSON file next to the target,
+# so an interrupted run continues with --resume instead of starting over.
+#
+#   python -m backend.playerExport export backup.ndjson.gz
+#   python -m backend.playerExport import backup.ndjson.gz --sharded data/players
+import argparse
+import gzip
+import json
+import lzma
+import os
+from contextlib import ExitStack
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+from backend.entities import PlayerManager
+from backend.playerShards import ShardedPlayerManager, shard_of
+from backend.playerStream import COMPRESSIONS, PlayerFileWriter, detect_compression
+
+CHECKPOINT_EVERY = 500
+
+
+# ---------------- Helpers ---------------- #
+def compression_for(path: str) -> str:
+    """Compression implied by a file name: .gz -> gzip, .xz/.lzma -> lzma, else none."""
+    if path.endswith(".gz"):
+        return "gzip"
+    if path.endswith((".xz", ".lzma")):
+        return "lzma"
+    return "none"
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    # Every batch is a complete gzip member / xz stream; readers decode the concatenation
+    if compression == "gzip":
+        return gzip.compress(data)
+    if compression == "lzma":
+        return lzma.compress(data)
+    return data
+
+
+def open_ndjson(path: str) -> TextIO:
+    """Open an export for reading, detecting compression from its first bytes."""
+    compression = detect_compression(path)
+    if compression == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if compression == "lzma":
+        return lzma.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_ndjson(path: str) -> Iterator[Tuple[str, Dict]]:
+    """Yield (username, record) pairs from an export."""
+    with open_ndjson(path) as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                yield entry["username"], entry["record"]
+
+
+def _signature(paths: List[str]) -> List:
+    """Size and mtime of each file; a resume is refused if these have changed."""
+    return [[path, os.path.getsize(path), os.path.getmtime(path)] for path in paths if os.path.exists(path)]
+
+
+def _load_progress(path: str) -> Optional[Dict]:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _save_progress(path: str, progress: Dict) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(progress, f)
+    os.replace(tmp_path, path)
+
+
+# ---------------- Export ---------------- #
+def export_players(manager: PlayerManager, output_path: str, compression: Optional[str] = None,
+                   resume: bool = False, progress_path: Optional[str] = None) -> int:
+    """Stream every player in `manager` to `output_path`; returns the number of players written.
+
+    Records go out in batches of CHECKPOINT_EVERY. After each batch the output is
+    synced and the progress file updated, so a resumed export truncates back to the
+    last complete batch and skips the players already written. Resuming assumes
+    storage has not changed in between, and refuses if it has.
+    """
+    compression = compression or compression_for(output_path)
+    progress_path = progress_path or output_path + ".progress"
+    source = _signature(manager._storage_paths())
+
+    progress = _load_progress(progress_path) if resume else None
+    if progress is not None and (progress["source"] != source or progress["compression"] != compression):
+        raise RuntimeError("Player storage or compression changed since the interrupted export; start it again without --resume.")
+    if progress is None or not os.path.exists(output_path):
+        progress = {"source": source, "compression": compression, "done": 0, "offset": 0}
+
+    done = progress["done"]
+    with open(output_path, "r+b" if progress["offset"] else "wb") as out:
+        out.truncate(progress["offset"])
+        out.seek(progress["offset"])
+
+        def flush(lines: List[str]) -> None:
+            out.write(_compress("".join(lines).encode("utf-8"), compression))
+            out.flush()
+            os.fsync(out.fileno())
+            progress.update(done=done, offset=out.tell())
+            _save_progress(progress_path, progress)
+
+        batch: List[str] = []
+        for position, (username, record) in enumerate(manager.iter_records()):
+            if position < progress["done"]:
+                continue
+            batch.append(json.dumps({"username": username, "record": record}) + "\n")
+            done += 1
+            if len(batch) >= CHECKPOINT_EVERY:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+
+    if os.path.exists(progress_path):
+        os.remove(progress_path)
+    return done
+
+
+# ---------------- Import ---------------- #
+def _target_path(manager: PlayerManager, username: str) -> str:
+    """Storage file that `username` belongs in."""
+    if isinstance(manager, ShardedPlayerManager):
+        shards, previous = manager._layout()
+        if previous is not None:
+            raise RuntimeError("A reshard is in progress; finish it before importing.")
+        return manager.shard_path(shards, shard_of(username, shards))
+    return manager.file_path
+
+
+def import_players(manager: PlayerManager, input_path: str, overwrite: bool = False,
+                   resume: bool = False, progress_path: Optional[str] = None) -> int:
+    """Stream an export into `manager`'s storage; returns the number of players imported.
+
+    Each storage file is rebuilt from scratch in a staging file next to it and only
+    swapped in once the whole export has been read, so the game must not be writing
+    to this storage meanwhile. Existing players are replaced wholesale, which is why
+    a non-empty target needs `overwrite`.
+    """
+    progress_path = progress_path or input_path + ".progress"
+    source = _signature([input_path])
+
+    progress = _load_progress(progress_path) if resume else None
+    if progress is not None and progress["source"] != source:
+        raise RuntimeError("The export file changed since the interrupted import; start it again without --resume.")
+    if progress is None:
+        if not overwrite and next(manager.iter_records(), None) is not None:
+            raise RuntimeError("Target storage already has players; pass overwrite to replace them.")
+        progress = {"source": source, "done": 0, "writers": {}}
+
+    writers: Dict[str, PlayerFileWriter] = {}
+    with ExitStack() as stack:
+        def writer_for(path: str) -> PlayerFileWriter:
+            if path not in writers:
+                writer = PlayerFileWriter(path, staging_path=path + ".import",
+                                          resume=progress["writers"].get(path),
+                                          compression=manager.compression)
+                writers[path] = stack.enter_context(writer)
+            return writers[path]
+
+        def checkpoint() -> None:
+            progress["writers"].update((path, writer.checkpoint()) for path, writer in writers.items())
+            progress["done"] = done
+            _save_progress(progress_path, progress)
+
+        # Reopen every staging file from the last run, even ones this run won't add to
+        for path in list(progress["writers"]):
+            writer_for(path)
+        if not isinstance(manager, ShardedPlayerManager):
+            writer_for(manager.file_path)
+
+        done = 0
+        for username, record in iter_ndjson(input_path):
+            done += 1
+            if done <= progress["done"]:
+                continue
+            writer_for(_target_path(manager, username)).write(username, record)
+            if done % CHECKPOINT_EVERY == 0:
+                checkpoint()
+        checkpoint()
+
+    # Storage files that got no imported players would otherwise keep their old ones
+    for path in manager._storage_paths():
+        if path not in writers and os.path.exists(path):
+            os.remove(path)
+    manager.invalidate_derived()
+    if os.path.exists(progress_path):
+        os.remove(progress_path)
+    return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or import player data as (compressed) NDJSON.")
+    parser.add_argument("command", choices=("export", "import"))
+    parser.add_argument("path", help="NDJSON file to write or read; .gz/.xz implies compression")
+    storage = parser.add_mutually_exclusive_group()
+    storage.add_argument("--players", help="Single-file player storage (default: PLAYER_DATA_PATH in config.yaml)")
+    storage.add_argument("--sharded", help="Sharded player directory, e.g. data/players")
+    parser.add_argument("--compression", choices=COMPRESSIONS, help="Export compression (default: from the file name)")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted run from its progress file")
+    parser.add_argument("--overwrite", action="store_true", help="Import over storage that already has players")
+    args = parser.parse_args()
+
+    manager = ShardedPlayerManager(args.sharded) if args.sharded else PlayerManager(args.players)
+    try:
+        if args.command == "export":
+            count = export_players(manager, args.path, args.compression, resume=args.resume)
+            print(f"Exported {count} players to '{args.path}'.")
+        else:
+            count = import_players(manager, args.path, overwrite=args.overwrite, resume=args.resume)
+            print(f"Imported {count} players from '{args.path}'.")
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# playerIndex.py — secondary indexes over players' caught animals and game history
+#
+# PlayerManager builds a PlayerIndex in one streaming pass the first time it is
+# queried, then keeps it current by re-indexing only the player being written.
+# Each index maps a normalized key to references grouped by username (animal ids,
+# positions in game_history) rather than the records themselves, so the index stays
+# small however long players' histories grow. PlayerManager loads the referenced
+# records when a query runs, touching only the players in its result.
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.schema import upgrade_record
+
+
+def _key(value) -> str:
+    """Case- and whitespace-insensitive index key ("Late Cretaceous " == "late cretaceous")."""
+    return str(value).strip().casefold()
+
+
+class PlayerIndex:
+    def __init__(self):
+        # species -> {username: number of that species caught}
+        self.species_players: Dict[str, Dict[str, int]] = {}
+        # epoch -> {username: [animal_id]}
+        self.epoch_animals: Dict[str, Dict[str, List[str]]] = {}
+        # place -> {username: [position in game_history]}
+        self.place_games: Dict[str, Dict[str, List[int]]] = {}
+        # username -> keys that player appears under, per index (for removal on re-index)
+        self._keys_by_user: Dict[str, Dict[str, set]] = {}
+
+    def build(self, records: Iterable[Tuple[str, Dict]]) -> "PlayerIndex":
+        """Index every (username, record) pair, e.g. from PlayerManager.iter_records()."""
+        for username, record in records:
+            self.update(username, record)
+        return self
+
+    def update(self, username: str, record: Dict) -> None:
+        """Replace everything indexed for `username` with the contents of `record`."""
+        self.remove(username)
+        record = upgrade_record(record)
+        animals = record.get("animals", {})
+        keys = {"species": set(), "epoch": set(), "place": set()}
+
+        for animal_id in record.get("caught_animals", []):
+            animal = animals.get(animal_id)
+            if animal is None:
+                continue
+            species, epoch = _key(animal["species"]), _key(animal["epoch"])
+            per_user = self.species_players.setdefault(species, {})
+            per_user[username] = per_user.get(username, 0) + 1
+            self.epoch_animals.setdefault(epoch, {}).setdefault(username, []).append(animal_id)
+            keys["species"].add(species)
+            keys["epoch"].add(epoch)
+
+        for position, game in enumerate(record.get("game_history", [])):
+            if game["animalCaught"] not in animals:
+                continue
+            place = _key(game["place"])
+            self.place_games.setdefault(place, {}).setdefault(username, []).append(position)
+            keys["place"].add(place)
+
+        self._keys_by_user[username] = keys
+
+    def remove(self, username: str) -> None:
+        keys = self._keys_by_user.pop(username, None)
+        if keys is None:
+            return
+        for name, index in (("species", self.species_players), ("epoch", self.epoch_animals),
+                            ("place", self.place_games)):
+            for key in keys[name]:
+                per_user = index.get(key)
+                if per_user is None:
+                    continue
+                per_user.pop(username, None)
+                if not per_user:
+                    del index[key]
+
+    # ---------------- Queries ---------------- #
+    def players_with_species(self, species: str) -> List[str]:
+        return list(self.species_players.get(_key(species), {}))
+
+    def animals_in_epoch(self, epoch: str, username: Optional[str] = None) -> Dict[str, List[str]]:
+        """{username: [animal_id]} for every caught animal from `epoch`."""
+        return _select(self.epoch_animals.get(_key(epoch), {}), username)
+
+    def game_records_at_place(self, place: str, username: Optional[str] = None) -> Dict[str, List[int]]:
+        """{username: [position in game_history]} for every catch made at `place`."""
+        return _select(self.place_games.get(_key(place), {}), username)
+
+
+def _select(per_user: Dict[str, List], username: Optional[str]) -> Dict[str, List]:
+    if username is None:
+        return {user: list(refs) for user, refs in per_user.items()}
+    return {username: list(per_user[username])} if username in per_user else {}
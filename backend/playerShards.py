@@ -0,0 +1,291 @@
+# playerShards.py — hash-sharded player storage
+#
+# Usernames hash into N shard files under one directory:
+#   data/players/shards.json        layout manifest {"shards": N, "previous": M|null}
+#   data/players/shard-N-0000.json  one JSON object per shard, same format as playerData.json
+#
+# Every read or write loads and locks only the shard that holds the username, so
+# per-operation cost depends on shard size, not total population. Shard locks are
+# a thread lock plus an OS file lock (flock, or msvcrt on Windows) on
+# locks/<shard>.lock, so they hold across processes too; lock files are never
+# deleted, since removing one while a process waits on it would let two in.
+#
+# Resharding runs online, from the game or from another process. While it runs the
+# manifest keeps the old count in "previous": reads fall back to the old shard,
+# writes go to the new shard and drop the old copy. Every operation re-reads the
+# manifest once it holds its shard locks, so a process that opened the store
+# before a reshard follows the new layout. An interrupted reshard is finished by
+# the next one.
+#   python -m backend.playerShards data/players 64
+import argparse
+import hashlib
+import json
+import os
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from backend.entities import PlayerManager
+from backend.playerStream import temp_path_for
+
+DEFAULT_SHARDS = 16
+MANIFEST_NAME = "shards.json"
+LOCK_DIR = "locks"
+
+
+def shard_of(username: str, shards: int) -> int:
+    """Stable shard number for `username` (independent of PYTHONHASHSEED)."""
+    digest = hashlib.blake2b(username.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+def _check_shards(shards: int) -> None:
+    if shards < 1:
+        raise ValueError(f"shards must be at least 1, got {shards}")
+
+
+def _lock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:  # LK_LOCK gives up after about 10 seconds; keep waiting
+            continue
+
+
+def _unlock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """Reentrant lock shared by threads (RLock) and processes (OS lock on `path`).
+
+    The OS lock is taken by the outermost acquire and dropped by the matching release.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._rlock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self) -> "FileLock":
+        self._rlock.acquire()
+        if self._depth == 0:
+            try:
+                self._file = open(self.path, "a+b")
+                _lock_file(self._file)
+            except BaseException:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._rlock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                _unlock_file(self._file)
+            finally:
+                self._file.close()
+                self._file = None
+        self._rlock.release()
+
+
+class ShardedPlayerManager(PlayerManager):
+    def __init__(self, directory: str = "data/players", shards: int = DEFAULT_SHARDS,
+                 compression: Optional[str] = None):
+        _check_shards(shards)
+        self.directory = directory
+        self._initial_shards = shards
+        self._shards = shards
+        self._previous: Optional[int] = None
+        self._layout_lock = threading.Lock()
+        self._shard_locks: Dict[str, FileLock] = {}
+        super().__init__(file_path=os.path.join(directory, MANIFEST_NAME), compression=compression)
+        # One resharder at a time, across processes
+        self._reshard_lock = FileLock(os.path.join(directory, LOCK_DIR, MANIFEST_NAME + ".lock"))
+
+    # ---------------- Layout ---------------- #
+    def _ensure_storage(self) -> None:
+        os.makedirs(os.path.join(self.directory, LOCK_DIR), exist_ok=True)
+        if os.path.exists(self.file_path):
+            self._layout()
+        else:
+            self._write_manifest(self._initial_shards, None)
+
+    def _write_manifest(self, shards: int, previous: Optional[int]) -> None:
+        tmp_path = temp_path_for(self.file_path)
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"shards": shards, "previous": previous}, f, indent=4)
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        with self._layout_lock:
+            self._shards, self._previous = shards, previous
+
+    def _layout(self) -> Tuple[int, Optional[int]]:
+        """(shards, previous) as the manifest on disk has it now; another process may have resharded."""
+        try:
+            with open(self.file_path, "r") as f:
+                manifest = json.load(f)
+            layout = (manifest["shards"], manifest.get("previous"))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: could not read {self.file_path}: {e}; using the last layout read.")
+            with self._layout_lock:
+                return self._shards, self._previous
+        with self._layout_lock:
+            self._shards, self._previous = layout
+        return layout
+
+    def shard_path(self, shards: int, index: int) -> str:
+        return os.path.join(self.directory, f"shard-{shards}-{index:04d}.json")
+
+    def _path_for(self, username: str, shards: int) -> str:
+        return self.shard_path(shards, shard_of(username, shards))
+
+    def _shard_lock(self, path: str) -> FileLock:
+        with self._layout_lock:
+            lock = self._shard_locks.get(path)
+            if lock is None:
+                lock_path = os.path.join(self.directory, LOCK_DIR, os.path.basename(path) + ".lock")
+                lock = self._shard_locks[path] = FileLock(lock_path)
+            return lock
+
+    def _storage_paths(self) -> List[str]:
+        shards, previous = self._layout()
+        paths = [self.shard_path(shards, i) for i in range(shards)]
+        if previous is not None:
+            paths += [self.shard_path(previous, i) for i in range(previous)]
+        return [path for path in paths if os.path.exists(path)]
+
+    @contextmanager
+    def _locked(self, username: str) -> Iterator[Tuple[str, Optional[str]]]:
+        """Lock the shard(s) that may hold `username`; yields (current path, previous-layout path).
+
+        Locks are always taken old shard first, then new shard, as the resharder
+        does. The manifest is read again once the locks are held; if the layout
+        changed while we waited, release and retry. The resharder changes the
+        manifest before it moves a shard, and moves it under that shard's lock, so
+        a write never lands in a shard that has already been moved.
+        """
+        while True:
+            layout = self._layout()
+            shards, previous = layout
+            path = self._path_for(username, shards)
+            old_path = self._path_for(username, previous) if previous is not None else None
+            with ExitStack() as stack:
+                if old_path is not None:
+                    stack.enter_context(self._shard_lock(old_path))
+                stack.enter_context(self._shard_lock(path))
+                if self._layout() == layout:
+                    yield path, old_path
+                    return
+
+    # ---------------- Record access ---------------- #
+    def _get_record(self, username: str) -> Optional[Dict]:
+        with self._locked(username) as (path, old_path):
+            record = self._load_players(path).get(username)
+            if record is None and old_path is not None:
+                record = self._load_players(old_path).get(username)
+            return record
+
+    def _put_record(self, username: str, record: Dict, create: bool) -> bool:
+        with self._locked(username) as (path, old_path):
+            before = self._signatures([path] + ([old_path] if old_path is not None else []))
+            players = self._load_players(path)
+            old_players = self._load_players(old_path) if old_path is not None else {}
+            exists = username in players or username in old_players
+            if exists == create:
+                return False
+            players[username] = record
+            self._save_players(players, path)
+            if username in old_players:
+                # Moved to its new shard ahead of the resharder
+                del old_players[username]
+                self._save_players(old_players, old_path)
+            self._write_record(username, record, before)
+        return True
+
+    # ---------------- Resharding ---------------- #
+    def reshard(self, shards: int) -> Dict[str, int]:
+        """Move every player to a layout with `shards` shards while the store stays usable.
+
+        Each old shard is moved under its own lock, so only players in the shard
+        being moved wait. A reshard that was interrupted is finished first. Returns
+        counts of old shards and players moved.
+        """
+        _check_shards(shards)
+        with self._reshard_lock:
+            current, previous = self._layout()
+            stats = {"shards": 0, "players": 0}
+            if previous is not None:
+                print(f"Finishing the interrupted reshard from {previous} to {current} shards.")
+                stats["players"] += self._move_shards(previous, current)
+                stats["shards"] += previous
+                self._write_manifest(current, None)
+            if shards != current:
+                self._write_manifest(shards, current)
+                stats["players"] += self._move_shards(current, shards)
+                stats["shards"] += current
+                self._write_manifest(shards, None)
+            return stats
+
+    def _move_shards(self, current: int, shards: int) -> int:
+        """Move every player from the `current` layout's shards to the `shards` layout; returns players moved."""
+        moved = 0
+        for index in range(current):
+            old_path = self.shard_path(current, index)
+            with self._shard_lock(old_path):
+                old_players = self._load_players(old_path)
+                groups: Dict[str, Dict] = {}
+                for username, record in old_players.items():
+                    groups.setdefault(self._path_for(username, shards), {})[username] = record
+                for path, group in groups.items():
+                    with self._shard_lock(path):
+                        players = self._load_players(path)
+                        for username, record in group.items():
+                            # A copy already in the new shard was written during the reshard; it wins
+                            if username not in players:
+                                players[username] = record
+                                moved += 1
+                        self._save_players(players, path)
+                if os.path.exists(old_path):
+                    os.remove(old_path)
+        return moved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Change the number of player shards.")
+    parser.add_argument("directory", help="Sharded player directory, e.g. data/players")
+    parser.add_argument("shards", type=int, help="New number of shards")
+    args = parser.parse_args()
+    manager = ShardedPlayerManager(args.directory)
+    try:
+        stats = manager.reshard(args.shards)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Resharded '{args.directory}' to {args.shards} shards: "
+          f"{stats['players']} players moved from {stats['shards']} shards.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+# playerStream.py — record-by-record reading and writing of player data files
+#
+# A player file is one JSON object mapping username -> player record. These helpers
+# walk and produce that object one record at a time, so tools that touch every
+# player (migration, export, index rebuilds) run in memory bounded by the largest
+# single record instead of the whole file.
+#
+# Player files may be gzip or lzma compressed. Readers detect that from the file's
+# first bytes, so plain and compressed files can sit side by side and a change of
+# compression setting takes effect as each file is next written.
+import gzip
+import json
+import lzma
+import os
+import shutil
+import stat
+import tempfile
+from typing import Dict, Iterator, Optional, TextIO, Tuple
+
+_WHITESPACE = " \t\n\r"
+
+COMPRESSIONS = ("none", "gzip", "lzma")
+
+# Fast settings: player files are rewritten on every save
+GZIP_LEVEL = 6
+LZMA_PRESET = 1
+
+# What reading a damaged plain or compressed player file raises
+CORRUPT_FILE_ERRORS = (json.JSONDecodeError, EOFError, gzip.BadGzipFile, lzma.LZMAError)
+
+# os.umask can only be read by setting it, so read it once at import rather than per write
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def temp_path_for(path: str) -> str:
+    """Create an empty, uniquely named temp file next to `path`, to be swapped in with os.replace.
+
+    mkstemp creates files 0600; the temp file gets the mode `path` already has (or
+    the one open() would give a new file), so replacing it leaves permissions alone.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return tmp_path
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+
+
+def detect_compression(path: str) -> str:
+    """"gzip", "lzma" or "none", from the first bytes of `path`."""
+    with open(path, "rb") as f:
+        magic = f.read(len(_XZ_MAGIC))
+    if magic.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if magic.startswith(_XZ_MAGIC):
+        return "lzma"
+    return "none"
+
+
+def open_player_file(path: str, mode: str = "r", compression: str = "none") -> TextIO:
+    """Text stream over a player file.
+
+    Reading ignores `compression` and detects it from the file; writing ("w") uses it.
+    """
+    if mode == "r":
+        compression = detect_compression(path)
+    elif compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression {compression!r}; expected one of {COMPRESSIONS}")
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", compresslevel=GZIP_LEVEL, encoding="utf-8")
+    if compression == "lzma":
+        return lzma.open(path, mode + "t", preset=LZMA_PRESET if mode != "r" else None, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def dump_players(players: Dict, f: TextIO, compression: str = "none") -> None:
+    """Write a whole player object the way PlayerManager stores it.
+
+    Plain files stay indented for people reading them. Compressed ones are written
+    compactly, which also lets json use its C encoder.
+    """
+    if compression == "none":
+        json.dump(players, f, indent=4)
+    else:
+        json.dump(players, f, separators=(",", ":"))
+
+
+class _ObjectStreamReader:
+    """Incrementally decodes the members of a top-level JSON object from a text stream."""
+
+    def __init__(self, stream: TextIO, chunk_size: int = 1 << 16):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Append up to `size` more characters to the buffer; False once the stream is exhausted."""
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Next non-whitespace character ('' at end of stream), without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill(self.chunk_size):
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Malformed player file: expected {char!r}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def _decode(self):
+        """Decode one JSON value at the cursor, reading more input until it is complete."""
+        self._peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                self.pos = end
+                return value
+            except json.JSONDecodeError:
+                if self.eof or not self._fill(size):
+                    raise
+                size *= 2  # grow reads so a very large record isn't re-parsed once per chunk
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        if self._peek() == "":
+            return  # empty file: no players
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._decode()
+            if not isinstance(key, str):
+                raise ValueError("Malformed player file: object keys must be strings")
+            self._expect(":")
+            yield key, self._decode()
+            if self._peek() == ",":
+                self.pos += 1
+                continue
+            self._expect("}")
+            return
+
+
+def iter_player_file(path: str, chunk_size: int = 1 << 16) -> Iterator[Tuple[str, Dict]]:
+    """Yield (username, record) pairs from a player file without loading it whole.
+
+    Raises ValueError (json.JSONDecodeError) if the file is malformed.
+    """
+    if not os.path.exists(path):
+        return
+    with open_player_file(path) as f:
+        yield from _ObjectStreamReader(f, chunk_size).items()
+
+
+class PlayerFileWriter:
+    """Writes a player file one record at a time.
+
+    Output matches dump_players(players, f, compression). The data goes to a
+    temporary file that replaces `path` only when the writer is closed without an
+    error, so readers never see a half-written file.
+
+    Long-running writers can pass a fixed `staging_path`: it is kept when the writer
+    fails, and a later writer given the `resume` state from checkpoint() picks up
+    where the last checkpoint left off. A staging file is always plain text, so it
+    can be truncated back to a checkpoint; it is compressed when the writer closes.
+    """
+
+    def __init__(self, path: str, staging_path: Optional[str] = None, resume: Optional[Dict] = None,
+                 compression: str = "none"):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {compression!r}; expected one of {COMPRESSIONS}")
+        self.path = path
+        self.tmp_path: Optional[str] = staging_path
+        self.compression = compression
+        self._keep_on_error = staging_path is not None
+        self._resume = resume
+        self._file: Optional[TextIO] = None
+        self._count = 0
+
+    def __enter__(self) -> "PlayerFileWriter":
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self._resume is not None:
+            # Drop anything written after the checkpoint, then carry on appending
+            os.truncate(self.tmp_path, self._resume["offset"])
+            self._file = open(self.tmp_path, "a", encoding="utf-8")
+            self._count = self._resume["count"]
+            return self
+        if self.tmp_path is None:
+            self.tmp_path = temp_path_for(self.path)
+            self._file = open_player_file(self.tmp_path, "w", self.compression)
+        else:
+            self._file = open(self.tmp_path, "w", encoding="utf-8")
+        self._file.write("{")
+        return self
+
+    def write(self, username: str, record: Dict) -> None:
+        if self.compression == "none" or self._keep_on_error:
+            body = json.dumps(record, indent=4).replace("\n", "\n    ")
+            self._file.write(("," if self._count else "") + f"\n    {json.dumps(username)}: {body}")
+        else:
+            body = json.dumps(record, separators=(",", ":"))
+            self._file.write(("," if self._count else "") + f"{json.dumps(username)}:{body}")
+        self._count += 1
+
+    def checkpoint(self) -> Dict:
+        """Flush to disk and return the state a later writer needs to resume from here."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {"count": self._count, "offset": self._file.tell()}
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None and self._keep_on_error:
+            self._file.close()
+            return
+        compact = self.compression != "none" and not self._keep_on_error
+        self._file.write("\n}" if self._count and not compact else "}")
+        self._file.close()
+        if exc_type is not None:
+            os.remove(self.tmp_path)
+        elif self._keep_on_error and self.compression != "none":
+            self._compress_staging()
+        else:
+            os.replace(self.tmp_path, self.path)
+
+    def _compress_staging(self) -> None:
+        tmp_path = temp_path_for(self.path)
+        try:
+            with open(self.tmp_path, "r", encoding="utf-8") as src, open_player_file(tmp_path, "w", self.compression) as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        os.remove(self.tmp_path)
+
+    @property
+    def count(self) -> int:
+        return self._count
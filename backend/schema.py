@@ -0,0 +1,142 @@
+# schema.py — versioned player record schema and migrations
+#
+# Every player record carries a "version". Records are upgraded lazily by
+# Player.from_dict through upgrade_record(), and written back at SCHEMA_VERSION on
+# the next save. To change the record shape, bump SCHEMA_VERSION and register a
+# step with @migration(previous_version).
+#
+# Offline migration of a whole file, streamed one record at a time:
+#   python -m backend.schema data/playerData.json [--output migrated.json]
+import argparse
+import hashlib
+import json
+import os
+from typing import Callable, Dict
+
+from backend.playerStream import PlayerFileWriter, detect_compression, iter_player_file
+
+SCHEMA_VERSION = 4
+
+# Records written before versioning existed have no "version" field
+UNVERSIONED = 1
+
+_MIGRATIONS: Dict[int, Callable[[Dict], Dict]] = {}
+
+
+def migration(from_version: int):
+    """Register a step that upgrades a record from `from_version` to `from_version + 1`."""
+    def register(step: Callable[[Dict], Dict]) -> Callable[[Dict], Dict]:
+        if from_version in _MIGRATIONS:
+            raise ValueError(f"Migration from version {from_version} is already registered.")
+        _MIGRATIONS[from_version] = step
+        return step
+    return register
+
+
+def record_version(data: Dict) -> int:
+    return data.get("version", UNVERSIONED)
+
+
+def upgrade_record(data: Dict) -> Dict:
+    """Run every registered step needed to bring `data` up to SCHEMA_VERSION.
+
+    Current records are returned untouched. Raises ValueError for records written
+    by a newer build than this one.
+    """
+    version = record_version(data)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Player record version {version} is newer than supported version {SCHEMA_VERSION}.")
+    while version < SCHEMA_VERSION:
+        if version not in _MIGRATIONS:
+            raise ValueError(f"No migration registered from player record version {version}.")
+        data = _MIGRATIONS[version](data)
+        version += 1
+        data["version"] = version
+    return data
+
+
+# ---------------- Migration steps ---------------- #
+@migration(1)
+def _normalize_animals(data: Dict) -> Dict:
+    """v1 -> v2: move inline animal copies into an id-keyed "animals" table.
+
+    Inline copies get an id derived from their content, so the same animal stored
+    in caught_animals and in a history record collapses into one table entry.
+    """
+    animals: Dict[str, Dict] = dict(data.get("animals", {}))
+
+    def to_ref(animal):
+        if not isinstance(animal, dict):
+            return animal
+        animal_id = hashlib.sha1(json.dumps(animal, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+        animals.setdefault(animal_id, animal)
+        return animal_id
+
+    data["caught_animals"] = [to_ref(animal) for animal in data.get("caught_animals", [])]
+    data["game_history"] = [dict(record, animalCaught=to_ref(record["animalCaught"]))
+                            for record in data.get("game_history", [])]
+    data["battle_history"] = [dict(record, animal=to_ref(record["animal"]))
+                              for record in data.get("battle_history", [])]
+    data["animals"] = animals
+    return data
+
+
+@migration(2)
+def _add_animal_description(data: Dict) -> Dict:
+    """v2 -> v3: animals persist their description."""
+    for animal in data.get("animals", {}).values():
+        animal.setdefault("description", "")
+    return data
+
+
+@migration(3)
+def _add_player_stats(data: Dict) -> Dict:
+    """v3 -> v4: summary "stats" header, so rankings never need to read the histories."""
+    animals = data.get("animals", {})
+    epochs: Dict[str, int] = {}
+    for animal_id in data.get("caught_animals", []):
+        epoch = animals[animal_id]["epoch"]
+        epochs[epoch] = epochs.get(epoch, 0) + 1
+    games = data.get("game_history", [])
+    data["stats"] = {
+        "catches": len(data.get("caught_animals", [])),
+        "games": len(games),
+        "beastballsUsed": sum(game["beastballsUsed"] for game in games),
+        "epochs": epochs,
+    }
+    return data
+
+
+# ---------------- Offline migrator ---------------- #
+def migrate_file(path: str, output_path: str = None) -> Dict[str, int]:
+    """Upgrade every record in a player file, streaming one record at a time.
+
+    Writes to `output_path` (default: replace `path` in place once finished), with
+    the same compression as `path`. Returns counts of upgraded and already-current
+    records.
+    """
+    stats = {"upgraded": 0, "current": 0}
+    compression = detect_compression(path) if os.path.exists(path) else "none"
+    with PlayerFileWriter(output_path or path, compression=compression) as writer:
+        for username, record in iter_player_file(path):
+            if record_version(record) < SCHEMA_VERSION:
+                record = upgrade_record(record)
+                stats["upgraded"] += 1
+            else:
+                stats["current"] += 1
+            writer.write(username, record)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upgrade a player data file to the current schema version.")
+    parser.add_argument("path", nargs="?", default="data/playerData.json")
+    parser.add_argument("--output", help="Write the migrated file here instead of replacing PATH.")
+    args = parser.parse_args()
+    stats = migrate_file(args.path, args.output)
+    print(f"Migrated '{args.path}' to version {SCHEMA_VERSION}: "
+          f"{stats['upgraded']} upgraded, {stats['current']} already current.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# spritePipeline.py — turns generated animal images into ready-to-blit sprites
+#
+# DeepAI returns an opaque square PNG with the animal on a flat background. Right
+# after an image is saved, process_image runs on a small worker pool and writes to
+# SPRITE_DIR:
+#
+#   <stem>.png        the background made transparent and the image trimmed to the
+#                     animal's bounding box (processed_path_for)
+#   <stem>@<N>.png    the same, scaled to fit N x N for each N in VARIANT_SIZES
+#
+# Nothing records where sprites went: screens call sprite_path(raw_path, size),
+# which derives the paths from the raw image and checks which exist, to get the
+# smallest file at least `size` big, falling back to the raw image until processing
+# has finished.
+# Outputs newer than their source are reused, so reprocessing is a no-op. The image
+# GC treats a sprite as referenced whenever its source image is.
+#
+#   python -m backend.spritePipeline data/images/animals/*.png
+import argparse
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import pygame
+
+from backend.imageOps import dominant_color
+
+SPRITE_DIR = "data/images/sprites/"
+
+# Longest side of each pre-scaled variant: explore (40px), catch (60-180px), profile cards (~200px)
+VARIANT_SIZES = (64, 128, 256)
+
+# Background detection: sample a border this wide, and treat pixels within this
+# distance per channel of the background color as background
+EDGE_STRIP = 4
+BACKGROUND_TOLERANCE = 24
+
+WORKERS = 2
+
+
+def _stem(raw_path: str) -> str:
+    return os.path.splitext(os.path.basename(raw_path))[0]
+
+
+def processed_path_for(raw_path: str) -> str:
+    return os.path.join(SPRITE_DIR, _stem(raw_path) + ".png")
+
+
+def variant_path_for(raw_path: str, size: int) -> str:
+    return os.path.join(SPRITE_DIR, f"{_stem(raw_path)}@{size}.png")
+
+
+def derived_paths(raw_path: str) -> List[str]:
+    """Every file the pipeline writes for `raw_path`."""
+    return [processed_path_for(raw_path)] + [variant_path_for(raw_path, n) for n in VARIANT_SIZES]
+
+
+def sprite_path(raw_path: Optional[str], size: Optional[Tuple[int, int]] = None) -> Optional[str]:
+    """Best file to draw `raw_path` at `size`: a big enough variant, the full processed sprite, or the raw image."""
+    if not raw_path:
+        return raw_path
+    if size:
+        longest = max(size)
+        for n in VARIANT_SIZES:
+            if n >= longest:
+                path = variant_path_for(raw_path, n)
+                if os.path.exists(path):
+                    return path
+                break
+    path = processed_path_for(raw_path)
+    return path if os.path.exists(path) else raw_path
+
+
+# ---------------- Processing ---------------- #
+def remove_background(image: pygame.Surface, tolerance: int = BACKGROUND_TOLERANCE,
+                      edges: int = EDGE_STRIP) -> pygame.Surface:
+    """Copy of `image` with alpha, where background connected to the corners is transparent.
+
+    Only regions touching a corner are cleared, so background-colored pixels
+    inside the animal stay opaque.
+    """
+    rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+    rgba.blit(image, (0, 0))
+    background = dominant_color(image, quantize=2, edges=edges)
+    near = pygame.mask.from_threshold(rgba, background + (255,), (tolerance, tolerance, tolerance, 255))
+    w, h = near.get_size()
+    cleared = pygame.mask.Mask((w, h))
+    for corner in ((0, 0), (w - 1, 0), (0, h - 1), (w - 1, h - 1)):
+        if near.get_at(corner) and not cleared.get_at(corner):
+            cleared.draw(near.connected_component(corner), (0, 0))
+    cleared.invert()
+    return cleared.to_surface(setsurface=rgba, unsetcolor=(0, 0, 0, 0))
+
+
+def trim(sprite: pygame.Surface) -> pygame.Surface:
+    """Crop to the bounding box of the non-transparent pixels."""
+    bounds = sprite.get_bounding_rect()
+    if bounds.w == 0 or bounds.h == 0:
+        return sprite
+    return sprite.subsurface(bounds).copy()
+
+
+def _fit(sprite: pygame.Surface, box: int) -> pygame.Surface:
+    w, h = sprite.get_size()
+    scale = min(box / w, box / h)
+    return pygame.transform.smoothscale(sprite, (max(1, int(w * scale)), max(1, int(h * scale))))
+
+
+def _fresh(output: str, source_mtime: float) -> bool:
+    try:
+        return os.path.getmtime(output) >= source_mtime
+    except OSError:
+        return False
+
+
+def _save(surface: pygame.Surface, path: str) -> None:
+    # Write then rename, so a screen never loads a half-written PNG
+    tmp = path + ".tmp.png"
+    pygame.image.save(surface, tmp)
+    os.replace(tmp, path)
+
+
+def process_image(raw_path: str) -> Optional[str]:
+    """Write the processed sprite and its variants for `raw_path`; returns the processed path, None on failure."""
+    try:
+        source_mtime = os.path.getmtime(raw_path)
+        outputs = derived_paths(raw_path)
+        if all(_fresh(path, source_mtime) for path in outputs):
+            return outputs[0]
+        os.makedirs(SPRITE_DIR, exist_ok=True)
+        sprite = trim(remove_background(pygame.image.load(raw_path)))
+        _save(sprite, outputs[0])
+        for n, path in zip(VARIANT_SIZES, outputs[1:]):
+            _save(_fit(sprite, n) if max(sprite.get_size()) > n else sprite, path)
+        return outputs[0]
+    except (OSError, pygame.error, ValueError) as e:
+        print(f"Error: could not process sprite {raw_path}: {e}")
+        return None
+
+
+# ---------------- Worker pool ---------------- #
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def submit(raw_path: str) -> Future:
+    """Process `raw_path` on the shared worker pool; the future's result is the processed path."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="sprite-pipeline")
+    return _pool.submit(process_image, raw_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Make transparent, trimmed, pre-scaled sprites from generated images.")
+    parser.add_argument("images", nargs="+")
+    args = parser.parse_args()
+    done = sum(process_image(path) is not None for path in args.images)
+    print(f"Processed {done} of {len(args.images)} images into {SPRITE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
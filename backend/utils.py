@@ -7,6 +7,23 @@ def check_user(username):
 def add_new_user(username):
     return {"username": username, "place": "Amherst"}
 
+# Player signed in on this kiosk and the manager that stores them; set by the
+# login screen, read by later screens
+_active_player: Optional[Player] = None
+_player_manager: Optional[PlayerManager] = None
+
+def set_active_player(player: Optional[Player], manager: Optional[PlayerManager] = None):
+    global _active_player, _player_manager
+    _active_player = player
+    if manager is not None:
+        _player_manager = manager
+
+def get_active_player() -> Optional[Player]:
+    return _active_player
+
+def get_player_manager() -> Optional[PlayerManager]:
+    return _player_manager
+
 def route_to_instructions(background, screen):
     # """
     # Opens the instructions screen modally and returns its result ("back"/"next"/"quit"/None).
@@ -64,7 +81,7 @@ def route_to_mode(background, screen):
     result = disp.run()
     return result
 
-def route_to_playerInfo(background, screen):
+def route_to_playerInfo(background, screen, player=None):
     # """
     # Opens the instructions screen modally and returns its result ("back"/"next"/"quit"/None).
     # Works with either the BaseDisplay InstructionDisplay or legacy instructionScreen.
@@ -72,7 +89,7 @@ def route_to_playerInfo(background, screen):
         # Prefer BaseDisplay version if present
     from frontend.userProfile import UserProfileDisplay
     bg_path = background if isinstance(background, str) else None
-    disp = UserProfileDisplay(screen, background_path=bg_path)
+    disp = UserProfileDisplay(screen, background_path=bg_path, player=player or get_active_player())
     if bg_path is None and background is not None:
         # reuse the already-loaded Surface if you have one
         try:
@@ -102,7 +119,7 @@ def route_to_placeTimeInfo(background, screen, time_place_info, time_place_anima
     result = disp.run()
     return result
 
-def route_to_exploreGame(background, screen, animal_info, background_path):
+def route_to_exploreGame(background, screen, animal_info, background_path, world=None):
     # """
     # Opens the instructions screen modally and returns its result ("back"/"next"/"quit"/None).
     # Works with either the BaseDisplay InstructionDisplay or legacy instructionScreen.
@@ -110,7 +127,7 @@ def route_to_exploreGame(background, screen, animal_info, background_path):
         # Prefer BaseDisplay version if present
     from frontend.exploreGameScreen import PokemonDisplay
     bg_path = background if isinstance(background, str) else None
-    disp = PokemonDisplay(screen, background_path=background_path, animals=animal_info)
+    disp = PokemonDisplay(screen, background_path=background_path, animals=animal_info, world=world)
     if bg_path is None and background is not None:
         # reuse the already-loaded Surface if you have one
         try:
@@ -121,7 +138,7 @@ def route_to_exploreGame(background, screen, animal_info, background_path):
     result = disp.run()
     return result
 
-def route_to_catchGame(background, screen, animal_info):
+def route_to_catchGame(background, screen, animal_info, world=None):
     # """
     # Opens the instructions screen modally and returns its result ("back"/"next"/"quit"/None).
     # Works with either the BaseDisplay InstructionDisplay or legacy instructionScreen.
@@ -134,10 +151,9 @@ def route_to_catchGame(background, screen, animal_info):
     size = animal_info.relative_size
     
 
-    # setting the powers based on size
-    size_power: float = max(0.5, 0.75 * size)   # Clamp size between 0.5 and 2.0
-    speed_power: float = 2.5  # Keeping speed fixed for now,
-    shots_power: float = max(1.0, 2.0 * size_power)# Direct relation to size
+    # setting the powers based on size (backend/catchSim.py plays these headlessly for balancing)
+    from backend.catchSim import powers_for_size
+    size_power, speed_power, shots_power = powers_for_size(size)
     print("\npowers - ", size_power, speed_power, shots_power)  # DEBUG
 
     bg_path = background if isinstance(background, str) else None
@@ -148,7 +164,9 @@ def route_to_catchGame(background, screen, animal_info):
                               animal_desc = description,
                               size_power=size_power,
                               speed_power=speed_power,
-                              shots_power=shots_power
+                              shots_power=shots_power,
+                              catch_animal=animal_info.entity,
+                              world=world
                               )
     if bg_path is None and background is not None:
         # reuse the already-loaded Surface if you have one
@@ -0,0 +1,101 @@
+# compressionBench.py — when does compressed player storage pay off?
+#
+# For each population size and compression setting, times how long PlayerManager
+# spends encoding + compressing a player file (save) and decompressing + parsing it
+# (load) against a scratch file in the page cache, and records the stored size. Compression pays off
+# once the bytes it saves take longer to move than the extra CPU it costs:
+#
+#   break-even throughput = (plain bytes - compressed bytes) / (compressed CPU - plain CPU)
+#
+# On a device slower than that (SD cards: often a few MB/s for small random
+# writes), compressed storage is faster overall. When compressed CPU time is the
+# lower of the two, compression wins at any speed. `--throughput` additionally
+# models total save/load time at given device speeds.
+#
+#   python -m benchmarks.compressionBench --players 100 1000 5000 --throughput 5 20 --output bench/compression.json
+import argparse
+import json
+import os
+import tempfile
+from typing import Dict, List
+
+from backend.entities import PlayerManager
+from backend.playerStream import COMPRESSIONS
+from benchmarks.synthetic import make_population, write_population
+from benchmarks.timing import best_of
+
+
+def measure(players: Dict, compression: str, repeats: int, workdir: str) -> Dict[str, float]:
+    """CPU seconds to save and load `players` with `compression`, and the stored size.
+
+    Runs the real PlayerManager code path against a freshly written scratch file
+    that stays in the page cache, so the times are encoding and compression rather
+    than the device.
+    """
+    manager = PlayerManager(os.path.join(workdir, f"bench-{compression}.json"), compression=compression)
+    save = best_of(repeats, lambda: manager._save_players(players))
+    size = os.path.getsize(manager.file_path)
+    load = best_of(repeats, manager._load_players)
+    return {"bytes": size, "save_s": save, "load_s": load}
+
+
+def break_even(plain: Dict[str, float], other: Dict[str, float], phase: str):
+    """Device throughput (MB/s) below which `other` beats plain for `phase`; None if it always does."""
+    extra_cpu = other[f"{phase}_s"] - plain[f"{phase}_s"]
+    saved_bytes = plain["bytes"] - other["bytes"]
+    if extra_cpu <= 0:
+        return None
+    return round(saved_bytes / extra_cpu / 1e6, 2)
+
+
+def run(populations: List[int], games: int, repeats: int, throughputs: List[float]) -> List[Dict]:
+    results = []
+    with tempfile.TemporaryDirectory(prefix="eons-compress-") as workdir:
+        for count in populations:
+            source = PlayerManager(os.path.join(workdir, "source.json"), compression="none")
+            write_population(source, make_population(count, games, games // 4))
+            players = source._load_players()
+            rows = {compression: measure(players, compression, repeats, workdir) for compression in COMPRESSIONS}
+            for compression, row in rows.items():
+                row["ratio"] = round(rows["none"]["bytes"] / row["bytes"], 2)
+                if compression != "none":
+                    row["break_even_save_MBps"] = break_even(rows["none"], row, "save")
+                    row["break_even_load_MBps"] = break_even(rows["none"], row, "load")
+                for mbps in throughputs:
+                    io_s = row["bytes"] / (mbps * 1e6)
+                    row[f"save_at_{mbps:g}MBps_s"] = round(row["save_s"] + io_s, 4)
+                    row[f"load_at_{mbps:g}MBps_s"] = round(row["load_s"] + io_s, 4)
+                row["save_s"] = round(row["save_s"], 4)
+                row["load_s"] = round(row["load_s"], 4)
+            results.append({"players": count, "games": games, "results": rows})
+            os.remove(source.file_path)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find where compressed player storage beats plain JSON.")
+    parser.add_argument("--players", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--games", type=int, default=40, help="Games (and caught animals) per player")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--throughput", type=float, nargs="*", default=[5.0, 20.0],
+                        help="Device speeds in MB/s to model total save/load time at")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    results = run(args.players, args.games, args.repeats, args.throughput)
+    for entry in results:
+        print(f"\n{entry['players']} players, {entry['games']} games each")
+        print(f"{'compression':<12}{'size MB':>10}{'ratio':>8}{'save s':>9}{'load s':>9}{'save b/e MB/s':>15}{'load b/e MB/s':>15}")
+        for compression, row in entry["results"].items():
+            save_be = row.get("break_even_save_MBps", "-")
+            load_be = row.get("break_even_load_MBps", "-")
+            print(f"{compression:<12}{row['bytes'] / 1e6:>10.2f}{row['ratio']:>8}{row['save_s']:>9}{row['load_s']:>9}"
+                  f"{'always' if save_be is None else save_be:>15}{'always' if load_be is None else load_be:>15}")
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# dominantColorBench.py — dominant color detection on the bundled assets
+#
+# Times the original per-pixel get_at loop against backend.imageOps.dominant_color
+# (NumPy when installed, and the pure-Python fallback) on every image in
+# frontend/assets/, and checks that they find the same color. The heuristic
+# variants (quantized, edges only) are timed too, with the color they pick.
+#
+#   python -m benchmarks.dominantColorBench --output bench/dominant-color.json
+#   python -m benchmarks.dominantColorBench --skip-loop   # the get_at loop takes seconds per image
+import argparse
+import json
+import os
+from collections import Counter
+from typing import Dict, List
+
+import pygame
+
+from backend import imageOps
+from benchmarks.timing import best_of
+
+ASSETS_DIR = "frontend/assets/"
+
+
+def get_at_loop(image: pygame.Surface):
+    """The original catchGameScreen.get_most_common_color, since removed."""
+    width, height = image.get_size()
+    color_counter = Counter()
+    for x in range(width):
+        for y in range(height):
+            color_counter[image.get_at((x, y))[:3]] += 1
+    return color_counter.most_common(1)[0][0]
+
+
+def variants(skip_loop: bool) -> Dict:
+    """name -> fn(surface) returning a color."""
+    out = {}
+    if not skip_loop:
+        out["get_at loop"] = get_at_loop
+    out["python"] = lambda s: imageOps._dominant_python(s, 0, 0)
+    if imageOps.np is not None:
+        out["numpy"] = lambda s: imageOps._dominant_numpy(s, 0, 0)
+        out["numpy q3"] = lambda s: imageOps._dominant_numpy(s, 3, 0)
+        out["numpy edges8"] = lambda s: imageOps._dominant_numpy(s, 0, 8)
+    out["python q3"] = lambda s: imageOps._dominant_python(s, 3, 0)
+    out["python edges8"] = lambda s: imageOps._dominant_python(s, 0, 8)
+    return out
+
+
+def run(paths: List[str], repeats: int, skip_loop: bool) -> List[Dict]:
+    results = []
+    fns = variants(skip_loop)
+    for path in paths:
+        try:
+            image = pygame.image.load(path)
+        except pygame.error:
+            continue
+        row = {"image": os.path.basename(path), "size": list(image.get_size()), "variants": {}}
+        for name, fn in fns.items():
+            color = fn(image)
+            # The get_at loop is slow enough that one run is representative
+            seconds = best_of(1 if name == "get_at loop" else repeats, lambda: fn(image))
+            row["variants"][name] = {"ms": round(seconds * 1000, 2), "color": list(color)}
+        exact = {tuple(v["color"]) for n, v in row["variants"].items() if n in ("get_at loop", "python", "numpy")}
+        row["exact_match"] = len(exact) == 1
+        results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time dominant color detection on the bundled assets.")
+    parser.add_argument("--assets", default=ASSETS_DIR)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--skip-loop", action="store_true", help="Don't time the original get_at loop")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    paths = sorted(os.path.join(args.assets, f) for f in os.listdir(args.assets)
+                   if os.path.isfile(os.path.join(args.assets, f)))
+    results = run(paths, args.repeats, args.skip_loop)
+    if imageOps.np is None:
+        print("NumPy is not installed; only the pure-Python path is timed.")
+    for row in results:
+        w, h = row["size"]
+        print(f"\n{row['image']} ({w}x{h}){'' if row['exact_match'] else '  EXACT VARIANTS DISAGREE'}")
+        base = row["variants"].get("get_at loop", {}).get("ms")
+        for name, v in row["variants"].items():
+            speedup = f"{base / v['ms']:8.0f}x" if base and v["ms"] else ""
+            print(f"  {name:<14}{v['ms']:>10.2f} ms {speedup}  {tuple(v['color'])}")
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
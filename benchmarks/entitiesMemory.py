@@ -0,0 +1,128 @@
+# entitiesMemory.py — bytes per history record for the entities object model
+#
+# Run from the repository root:
+#   python -m benchmarks.entitiesMemory --records 5000
+#
+# "before" loads the same data into plain dict-backed classes that mirror the
+# original entities (no __slots__, no string interning); "after" uses
+# backend.entities as it is now.
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from typing import Dict
+
+from backend.entities import Player
+from backend.schema import SCHEMA_VERSION
+from benchmarks.synthetic import EPOCHS, PLACES, SPECIES
+
+
+# ---------------- Baseline (dict-backed) model ---------------- #
+class LegacyAnimalGameFeats:
+    def __init__(self, speed: float, shotsRequired: int):
+        self.speed = speed
+        self.shotsRequired = shotsRequired
+
+class LegacyAnimal:
+    def __init__(self, data: Dict):
+        self.species = data["species"]
+        self.epoch = data["epoch"]
+        self.size = data["size"]
+        self.imagePath = data["imagePath"]
+        self.description = ""
+        self.gameFeats = LegacyAnimalGameFeats(data["gameFeats"]["speed"], data["gameFeats"]["shotsRequired"])
+
+class LegacyGameRecord:
+    def __init__(self, data: Dict, animal: LegacyAnimal):
+        self.date = data["date"]
+        self.place = data["place"]
+        self.timeMYA = data["timeMYA"]
+        self.beastballsUsed = data["beastballsUsed"]
+        self.animalCaught = animal
+
+class LegacyPlayer:
+    def __init__(self, data: Dict):
+        animals = {animal_id: LegacyAnimal(animal) for animal_id, animal in data["animals"].items()}
+        self.username = data["username"]
+        self.beastball_left = data["beastballs"]
+        self.battle_history = []
+        self.game_history = [LegacyGameRecord(record, animals[record["animalCaught"]]) for record in data["game_history"]]
+        self.caught_animals = [animals[animal_id] for animal_id in data["caught_animals"]]
+
+
+# ---------------- Synthetic data ---------------- #
+def make_player_json(records: int, seed: int = 7) -> str:
+    """One player with `records` catches; each catch is a distinct animal from a small world pool."""
+    rng = random.Random(seed)
+    image_pool = [f"data/images/animals/{rng.getrandbits(128):032x}.png" for _ in range(50)]
+    animals, history, caught = {}, [], []
+    for i in range(records):
+        animal_id = f"{i:012x}"
+        size = rng.randint(1, 12)
+        animals[animal_id] = {
+            "species": rng.choice(SPECIES),
+            "epoch": rng.choice(EPOCHS),
+            "size": size,
+            "imagePath": rng.choice(image_pool),
+            "description": "",
+            "gameFeats": {"speed": 1.0 / size, "shotsRequired": size * 2},
+        }
+        history.append({"date": "2025-09-21", "place": rng.choice(PLACES), "timeMYA": rng.randint(0, 300),
+                        "beastballsUsed": rng.randint(1, 10), "animalCaught": animal_id})
+        caught.append(animal_id)
+    epochs = {}
+    for animal in animals.values():
+        epochs[animal["epoch"]] = epochs.get(animal["epoch"], 0) + 1
+    stats = {"catches": records, "games": records,
+             "beastballsUsed": sum(game["beastballsUsed"] for game in history), "epochs": epochs}
+    return json.dumps({"username": "bench", "version": SCHEMA_VERSION, "beastballs": 20, "stats": stats, "animals": animals,
+                       "battle_history": [], "game_history": history, "caught_animals": caught})
+
+
+def load_player(data: Dict) -> Player:
+    """Player.from_dict plus a full walk, so every lazily paged record is materialized."""
+    player = Player.from_dict(data)
+    list(player.game_history)
+    list(player.caught_animals)
+    return player
+
+
+def measure(loader, raw: str) -> int:
+    """Bytes still held after parsing `raw` and materializing it with `loader`.
+
+    Parsing is inside the measured window: json gives every value its own str, so
+    whatever the loader keeps (or drops via interning) shows up in the total.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    data = json.loads(raw)
+    obj = loader(data)
+    del data
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory per history record, before vs after __slots__/interning.")
+    parser.add_argument("--records", type=int, default=5000)
+    args = parser.parse_args()
+
+    raw = make_player_json(args.records)
+    before = measure(LegacyPlayer, raw)
+    after = measure(load_player, raw)
+    result = {
+        "records": args.records,
+        "before_bytes_per_record": round(before / args.records, 1),
+        "after_bytes_per_record": round(after / args.records, 1),
+        "reduction": round(1 - after / before, 3) if before else None,
+    }
+    print(json.dumps(result, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# playerManagerBench.py — PlayerManager latency under synthetic load
+#
+# Generates a synthetic population, then times get_player, save_player and
+# update_player single-threaded, across a thread pool and across a process pool.
+# Results (p50/p99/mean per operation, in ms) are written as JSON so runs from
+# different commits can be compared.
+#
+#   python -m benchmarks.playerManagerBench --players 10000 --games 50 --output bench/file-10k.json
+#   python -m benchmarks.playerManagerBench --storage sharded --shards 64 --players 100000
+#
+# Processes share the data files, and the single-file layout has no
+# inter-process lock, so concurrent update_player calls can overwrite each
+# other. That is fine for a latency measurement.
+import argparse
+import contextlib
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List
+
+from backend.entities import PlayerManager
+from backend.playerShards import ShardedPlayerManager
+from benchmarks.synthetic import make_population, make_player, username_for, write_population
+
+OPERATIONS = ("get_player", "update_player", "save_player")
+
+
+def open_manager(storage: str, path: str, shards: int) -> PlayerManager:
+    if storage == "sharded":
+        return ShardedPlayerManager(path, shards=shards)
+    return PlayerManager(path)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples`."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ms = [s * 1000.0 for s in samples]
+    return {
+        "count": len(ms),
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "mean_ms": round(sum(ms) / len(ms), 3),
+    }
+
+
+def run_ops(storage: str, path: str, shards: int, population: int, operation: str,
+            count: int, worker: int, games: int, manager: PlayerManager = None) -> List[float]:
+    """Time `count` calls of `operation`; returns per-call seconds.
+
+    Threads pass one shared manager, as the game would use; each process opens its own.
+    """
+    manager = manager or open_manager(storage, path, shards)
+    rng = random.Random(worker)
+    samples: List[float] = []
+    for i in range(count):
+        if operation == "get_player":
+            username = username_for(rng.randrange(population))
+            start = time.perf_counter()
+            manager.get_player(username)
+        elif operation == "update_player":
+            player = manager.get_player(username_for(rng.randrange(population)))
+            player.beastball_left += 1
+            start = time.perf_counter()
+            manager.update_player(player)
+        else:
+            player = make_player(f"new-{os.getpid()}-{worker}-{i}", games, 0, rng)
+            start = time.perf_counter()
+            manager.save_player(player)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _silence_stdout():
+    """PlayerManager prints a line per call; keep that out of the results (process pool initializer)."""
+    sys.stdout = open(os.devnull, "w")
+
+
+def run_mode(mode: str, workers: int, args, path: str) -> Dict[str, Dict[str, float]]:
+    results = {}
+    per_worker = max(1, args.ops // workers)
+    for operation in OPERATIONS:
+        call = (args.storage, path, args.shards, args.players, operation, per_worker)
+        if mode == "single":
+            samples = run_ops(*call, 0, args.games)
+        else:
+            if mode == "threads":
+                pool = ThreadPoolExecutor(max_workers=workers)
+                shared = open_manager(args.storage, path, args.shards)
+            else:
+                pool = ProcessPoolExecutor(max_workers=workers, initializer=_silence_stdout)
+                shared = None
+            with pool:
+                futures = [pool.submit(run_ops, *call, worker, args.games, shared) for worker in range(workers)]
+                samples = [s for future in futures for s in future.result()]
+        results[operation] = summarize(samples)
+        print(f"  {mode:<9} {operation:<14} {results[operation]}", file=sys.stderr)
+    return results
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency benchmark for PlayerManager.")
+    parser.add_argument("--players", type=int, default=10000)
+    parser.add_argument("--games", type=int, default=20, help="catches (game records) per player")
+    parser.add_argument("--battles", type=int, default=5, help="battle records per player")
+    parser.add_argument("--ops", type=int, default=200, help="calls per operation per mode")
+    parser.add_argument("--workers", type=int, default=4, help="threads/processes for the concurrent modes")
+    parser.add_argument("--storage", choices=("file", "sharded"), default="file")
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--modes", default="single,threads,processes")
+    parser.add_argument("--output", help="Write results JSON here (default: stdout)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="eons-bench-")
+    try:
+        path = os.path.join(workdir, "players" if args.storage == "sharded" else "playerData.json")
+        manager = open_manager(args.storage, path, args.shards)
+        start = time.perf_counter()
+        write_population(manager, make_population(args.players, args.games, args.battles))
+        print(f"generated {args.players} players in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+        results = {}
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            for mode in args.modes.split(","):
+                workers = 1 if mode == "single" else args.workers
+                results[mode] = run_mode(mode, workers, args, path)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "commit": current_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "config": {k: getattr(args, k) for k in ("players", "games", "battles", "ops", "workers", "storage", "shards")},
+        "results": results,
+    }
+    text = json.dumps(report, indent=4)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# synthetic.py — synthetic player populations for benchmarks
+import random
+from contextlib import ExitStack
+from typing import Iterator
+
+from backend.entities import Animal, BattleRecord, GameRecord, Player, PlayerManager
+from backend.playerShards import ShardedPlayerManager, shard_of
+from backend.playerStream import PlayerFileWriter
+
+SPECIES = ["Tyrannosaurus Rex", "Triceratops", "Smilodon", "Megalodon", "Pteranodon",
+           "Velociraptor", "Mammoth", "Dimetrodon", "Ankylosaurus", "Brachiosaurus"]
+EPOCHS = ["Late Cretaceous", "Pleistocene", "Neogene", "Jurassic", "Permian"]
+PLACES = ["Amherst", "Sahara Desert", "Gobi Desert", "North America", "Patagonia"]
+
+
+def make_player(username: str, games: int, battles: int, rng: random.Random) -> Player:
+    """A player with `games` catches (each recorded in caught_animals and game_history) and `battles` battles."""
+    player = Player(username)
+    player.beastball_left = rng.randint(0, 40)
+    for _ in range(games):
+        size = rng.randint(1, 12)
+        animal = Animal(species=rng.choice(SPECIES), epoch=rng.choice(EPOCHS), size=size,
+                        imagePath=f"data/images/animals/{rng.getrandbits(64):016x}.png")
+        player.add_caught_animal(animal)
+        player.add_game_history(GameRecord(date="2025-09-21", place=rng.choice(PLACES),
+                                           timeMYA=rng.randint(0, 300), beastballsUsed=rng.randint(1, 10),
+                                           animalCaught=animal))
+    caught = player.caught_animals
+    for _ in range(battles if len(caught) else 0):
+        player.add_battle_history(BattleRecord(date="2025-09-22", animal=caught[rng.randrange(len(caught))],
+                                               beastballChange=rng.choice((-1, 1))))
+    return player
+
+
+def make_population(players: int, games: int, battles: int, seed: int = 7) -> Iterator[Player]:
+    rng = random.Random(seed)
+    for i in range(players):
+        yield make_player(username_for(i), games, battles, rng)
+
+
+def username_for(i: int) -> str:
+    return f"player{i:07d}"
+
+
+def write_population(manager: PlayerManager, population: Iterator[Player]) -> int:
+    """Stream a population straight into the manager's files; replaces whatever they held."""
+    count = 0
+    if isinstance(manager, ShardedPlayerManager):
+        shards = manager._layout()[0]
+        with ExitStack() as stack:
+            writers = [stack.enter_context(PlayerFileWriter(manager.shard_path(shards, i), compression=manager.compression)) for i in range(shards)]
+            for player in population:
+                writers[shard_of(player.username, shards)].write(player.username, player.to_dict())
+                count += 1
+    else:
+        with PlayerFileWriter(manager.file_path, compression=manager.compression) as writer:
+            for player in population:
+                writer.write(player.username, player.to_dict())
+                count += 1
+    return count
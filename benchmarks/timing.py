@@ -0,0 +1,13 @@
+# timing.py — timing helpers shared by the benchmarks
+import time
+from typing import Callable
+
+
+def best_of(repeats: int, fn: Callable[[], object]) -> float:
+    """Fastest of `repeats` runs of `fn`, in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,150 @@
+# assetManager.py — process-wide cache of loaded, scaled and converted images
+#
+# Screens ask for an image by path, target size and transform; the first request
+# loads it from disk, applies the transform, converts it to the display's pixel
+# format and scales it. Later requests (the next route_to_* hop, the next beastball
+# fired) get the same Surface back. Entries are evicted least recently used first
+# once the cached pixels exceed IMAGE_CACHE_MB.
+#
+# Cached surfaces are shared between screens: blit them, don't draw on them.
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+import pygame
+
+from backend.config import get_config
+
+
+# ---------------- Transforms ---------------- #
+def lighten_alpha(surface: pygame.Surface, alpha: int = 80) -> pygame.Surface:
+    """Lighten by alpha-blending towards white."""
+    out = surface.copy()
+    overlay = pygame.Surface(out.get_size(), pygame.SRCALPHA)
+    overlay.fill((255, 255, 255, alpha))
+    out.blit(overlay, (0, 0))
+    return out
+
+
+# Named transforms, applied to the full-size image before it is converted and scaled.
+# The name is part of the cache key, so a transform must always give the same result.
+TRANSFORMS: Dict[str, Callable[[pygame.Surface], pygame.Surface]] = {
+    "lighten": lambda surface: lighten_alpha(surface, alpha=90),
+}
+
+
+def register_transform(name: str, fn: Callable[[pygame.Surface], pygame.Surface]) -> None:
+    TRANSFORMS[name] = fn
+
+
+def fit_size(size: Tuple[int, int], box: Tuple[int, int]) -> Tuple[int, int]:
+    """Largest size with the aspect ratio of `size` that fits inside `box`."""
+    w, h = size
+    scale = min(box[0] / w, box[1] / h)
+    return max(1, int(w * scale)), max(1, int(h * scale))
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+# ---------------- Cache ---------------- #
+class AssetManager:
+    def __init__(self, budget_bytes: Optional[int] = None):
+        # None follows IMAGE_CACHE_MB, so a config reload resizes the cache
+        self._budget_bytes = budget_bytes
+        self._entries: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def budget_bytes(self) -> int:
+        if self._budget_bytes is not None:
+            return self._budget_bytes
+        return get_config().image_cache_mb * 1024 * 1024
+
+    def get(self, path: Optional[str], size: Optional[Tuple[int, int]] = None,
+            transform: Optional[str] = None, fit: bool = False,
+            alpha: bool = False) -> Optional[pygame.Surface]:
+        """The image at `path`, transformed and scaled to `size`; None if it can't be loaded.
+
+        `fit` keeps the aspect ratio inside `size` instead of stretching to it, and
+        `alpha` keeps per-pixel transparency.
+        """
+        if not path:
+            return None
+        key = (path, tuple(size) if size else None, transform, fit, alpha)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self._load(path, key[1], transform, fit, alpha)
+        if surface is not None:
+            self._store(key, surface)
+        return surface
+
+    def _load(self, path: str, size: Optional[Tuple[int, int]], transform: Optional[str],
+              fit: bool, alpha: bool) -> Optional[pygame.Surface]:
+        try:
+            if not os.path.exists(path):
+                return None
+            image = pygame.image.load(path)
+            if transform:
+                image = TRANSFORMS[transform](image)
+            # convert() needs a display mode; before one is set the surface is kept as loaded
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if alpha else image.convert()
+            if size:
+                target = fit_size(image.get_size(), size) if fit else size
+                if target != image.get_size():
+                    try:
+                        image = pygame.transform.smoothscale(image, target)
+                    except ValueError:
+                        # smoothscale only takes 24/32-bit surfaces
+                        image = pygame.transform.scale(image, target)
+            return image
+        except Exception as e:
+            print(f"Error: could not load image {path}: {e}")
+            return None
+
+    def _store(self, key: Tuple, surface: pygame.Surface) -> None:
+        size = surface_bytes(surface)
+        budget = self.budget_bytes
+        if size > budget:
+            return
+        self._entries[key] = surface
+        self.bytes += size
+        while self.bytes > budget:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= surface_bytes(evicted)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        lookups = self.hits + self.misses
+        return {"entries": len(self._entries), "bytes": self.bytes, "budget_bytes": self.budget_bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_rate_pct": round(100 * self.hits / lookups) if lookups else 0}
+
+    def clear(self) -> None:
+        """Drop every cached surface, e.g. after the display mode changes."""
+        self._entries.clear()
+        self.bytes = 0
+
+
+# ---------------- Shared cache ---------------- #
+_assets = AssetManager()
+
+
+def get_asset_manager() -> AssetManager:
+    return _assets
+
+
+def get_image(path: Optional[str], size: Optional[Tuple[int, int]] = None,
+              transform: Optional[str] = None, fit: bool = False,
+              alpha: bool = False) -> Optional[pygame.Surface]:
+    """AssetManager.get on the process-wide cache."""
+    return _assets.get(path, size, transform, fit, alpha)
@@ -1,38 +1,33 @@
 # base_display.py
 import os, sys, pygame
-from typing import Optional, Tuple
-import yaml
-
-# Load config
-with open("config.yaml", 'r') as f:
-    config = yaml.safe_load(f)
-ASSETS_PATH = config.get("ASSETS_PATH", "frontend/assets/")
+from typing import List, Optional, Tuple
+from backend.config import get_config
+from frontend.assetManager import get_image, lighten_alpha
+from frontend.frameProfiler import FrameProfiler
+from frontend.simulation import FixedStep
+from frontend.textCache import get_text_cache
 
 # ---------------- Config ---------------- #
-SCREEN_W, SCREEN_H = 900, 600
+# Read once at import: the display and asset layout don't change while running
+ASSETS_PATH = get_config().assets_path
+SCREEN_W, SCREEN_H = get_config().screen_width, get_config().screen_height
 DEFAULT_BG = ASSETS_PATH + "login3.png"   # put your image in the same folder or change this path
 TITLE = "EONS"
 # ----------------------------------------- #
 
 # ---------------- Utility ---------------- #
-def lighten_alpha(surface, alpha=80):
-    """Lighten by alpha-blending towards white."""
-    out = surface.copy()
-    overlay = pygame.Surface(out.get_size(), pygame.SRCALPHA)
-    overlay.fill((255, 255, 255, alpha))
-    out.blit(overlay, (0, 0))
-    return out
-
 def load_background(size: Tuple[int,int], path: str = DEFAULT_BG) -> pygame.Surface:
     w, h = size
-    if os.path.exists(path):
-        img = pygame.image.load(path).convert()
-        img = pygame.transform.smoothscale(img, (w, h))
-        return lighten_alpha(img, alpha=90)  # 0..255 (higher = lighter)
+    img = get_image(path, (w, h), transform="lighten")
+    if img is not None:
+        return img
     # fallback
     surf = pygame.Surface((w, h))
     surf.fill((28, 32, 48))
     return surf
+# Frames presented by any screen. Screens open other screens modally from their
+# event handlers; if this moves while a handler runs, another screen drew over us.
+_presented_frames = 0
 # ----------------------------------------- #
 
 
@@ -51,6 +46,17 @@ class CloseButton:
 
 class BaseDisplay:
     CAPTION = "Screen"
+    # Opt-in dirty-rectangle rendering: only regions passed to mark_dirty() are
+    # redrawn and pushed to the display; frames with nothing dirty draw nothing.
+    # Screens that animate everywhere should leave this off.
+    DIRTY_RECTS = False
+    # Opt-in fixed-timestep simulation (frontend/simulation.py): fixed_update runs
+    # at SIM_HZ whatever the frame rate, and draw_content can interpolate with
+    # self.sim.alpha.
+    FIXED_STEP = False
+    # Screens whose draw_content paints every pixel itself (e.g. a scrolling world)
+    # set this so the full-screen background isn't drawn underneath each frame.
+    OPAQUE_CONTENT = False
 
     def __init__(self, screen: pygame.Surface, background_path: Optional[str] = DEFAULT_BG):
         self.screen = screen
@@ -62,21 +68,93 @@ class BaseDisplay:
         self.clock = pygame.time.Clock()
         self.running = True
         self.result = None
+        self.profiler = FrameProfiler(self.CAPTION, get_config().frame_profiler_frames)
+        self.profiler.notes.append(get_text_cache().summary)
+        self.sim: Optional[FixedStep] = FixedStep() if self.FIXED_STEP else None
+        if self.sim is not None:
+            self.profiler.notes.append(self.sim.summary)
+        self._dirty: List[pygame.Rect] = []
+        self._full_redraw = True
+        self._x_hover = False
 
     # --------- Hooks to override --------- #
     def on_event(self, event: pygame.event.Event):  # input
         pass
-    def update(self, dt_ms: int):                   # game logic
+    def update(self, dt_ms: int):                   # game logic, once per frame
+        pass
+    def fixed_update(self, step_ms: float):         # game logic, once per step (FIXED_STEP)
         pass
     def draw_content(self, surface: pygame.Surface):# UI on top of base
         pass
 
+    # --------- Dirty rectangles --------- #
+    def mark_dirty(self, rect=None):
+        """Redraw `rect` next frame, or the whole screen if None. Only used when DIRTY_RECTS is on."""
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._dirty.append(pygame.Rect(rect).clip(self.screen.get_rect()))
+
+    def _track_close_hover(self):
+        hover = self.x_btn.rect.collidepoint(pygame.mouse.get_pos())
+        if hover != self._x_hover:
+            self._x_hover = hover
+            self.mark_dirty(self.x_btn.rect)
+
+    def _dispatch(self, event: pygame.event.Event):
+        """on_event, switching to a full redraw if it opened another screen on top of this one."""
+        before = _presented_frames
+        self.on_event(event)
+        if _presented_frames != before:
+            pygame.display.set_caption(self.CAPTION)
+            self._full_redraw = True
+            # Don't count the time spent on the other screen as this frame's dt
+            self.clock.tick()
+
+    def _render_frame(self, background: Optional[pygame.Surface], draw_close: bool = True):
+        """Draw and present a frame: everything, or in DIRTY_RECTS mode only what was marked."""
+        global _presented_frames
+        if not self.DIRTY_RECTS or self._full_redraw:
+            rects = None
+        else:
+            self._track_close_hover()
+            overlay = self.profiler.overlay_rect()
+            if overlay is not None:
+                self._dirty.append(overlay)
+            rects = [r for r in self._dirty if r.w and r.h]
+            if not rects:
+                self.profiler.lap("draw")
+                return
+            self.screen.set_clip(rects[0].unionall(rects[1:]))
+        self._dirty = []
+        self._full_redraw = False
+
+        if background is not None:
+            self.screen.blit(background, (0, 0))
+        elif not self.OPAQUE_CONTENT:
+            self.screen.fill((0, 0, 0))
+        self.draw_content(self.screen)  # your UI
+        if draw_close:
+            self.x_btn.draw(self.screen)
+        self.profiler.draw_overlay(self.screen)
+        get_text_cache().end_frame()
+        self.screen.set_clip(None)
+        self.profiler.lap("draw")
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        _presented_frames += 1
+
     # --------- Main loop --------- #
     def run(self):
-        background = load_background((self.w, self.h), self.background_path)
+        background = None if self.OPAQUE_CONTENT else load_background((self.w, self.h), self.background_path)
         pygame.display.set_caption(self.CAPTION)
+        profiler = self.profiler
         while self.running:
-            dt = self.clock.tick(60)
+            profiler.start_frame()
+            dt = self.clock.tick(get_config().fps)
+            profiler.lap("wait")
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
@@ -86,15 +164,26 @@ class BaseDisplay:
                     break
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.x_btn.rect.collidepoint(event.pos):
                     pygame.quit(); sys.exit()
+                if profiler.handle_key(event, get_config().frame_trace_dir):
+                    self.mark_dirty()
+                    continue
                 # pass event to subclass
-                self.on_event(event)
+                self._dispatch(event)
+            profiler.lap("events")
 
             self.update(dt)
+            if self.sim is not None:
+                self.sim.run(dt, self.fixed_update)
+            profiler.lap("update")
 
             # base draw
-            self.screen.blit(background, (0, 0))
-            self.draw_content(self.screen)  # your UI
-            self.x_btn.draw(self.screen)
-            pygame.display.flip()
+            self._render_frame(background)
+            profiler.lap("flip")
+            profiler.end_frame()
 
+        self._finish_profiling()
         return self.result
+
+    def _finish_profiling(self):
+        if get_config().frame_trace_on_exit:
+            print(f"Frame trace written to {self.profiler.dump_trace(get_config().frame_trace_dir)}")
@@ -1,31 +1,25 @@
 import os
 import random
 import pygame
-from collections import Counter
-from typing import Optional, Tuple
-from frontend.baseDisplay import BaseDisplay
+from typing import Dict, Optional, Tuple
+from frontend.baseDisplay import BaseDisplay, ASSETS_PATH
+from frontend.simulation import lerp_point
+from frontend.assetManager import get_image, register_transform
+from frontend.textCache import render_text
+from frontend.textLayout import wrap_text
 from backend.utils import *
-import yaml
+from backend.config import get_config
+from backend.imageOps import key_out_background
+from backend.catchSim import (BALL_H, BALL_W, CATCHER_H, CATCHER_MARGIN, CATCHER_W, MUZZLE_GAP,
+                               CatchParams, move_animal, move_catcher)
+from backend.spritePipeline import sprite_path
+from backend.catchRecorder import CatchResult, get_catch_recorder
+from backend.entities import Animal as AnimalEntity
 # ---------------------- Config ---------------------- #
-FPS = 120
-
-config_path = "config.yaml"
-if os.path.exists(config_path):
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-else:
-    config = {} 
-# Base stats
-BASE_SIZE   = 60
-BASE_SPEED  = 2.5
-BASE_SHOTS  = 2
-BASE_AMMO   = config.get("STARTING_BEASTBALLS", 10)
-print(f"Using BASE_AMMO = {BASE_AMMO}")
-
-# catcher/beastBalls
-catcher_SPEED = 6
-beastBalls_SPEED  = 9
-beastBalls_COOLDOWN_MS = 180
+# Base stats, speeds and the beastball cooldown live in config.yaml (CATCH_*,
+# CATCHER_SPEED, BEASTBALL_*) and are read when used, so they can be tuned live.
+# Speeds are pixels per simulation step (SIM_HZ); the cooldown is in simulated time.
+# Movement rules and sprite boxes are shared with the headless backend/catchSim.py.
 
 # ---------------------- Utility ---------------------- #
 def load_font(size, bold=False):
@@ -41,51 +35,20 @@ def get_font(size, bold=False):
         _fonts_cache[key] = load_font(size, bold)
     return _fonts_cache[key]
 
-def get_most_common_color(image):
-    width, height = image.get_size()
-    
-    # Count frequency of each color
-    color_counter = Counter()
-    for x in range(width):
-        for y in range(height):
-            color = image.get_at((x, y))[:3]  # Get RGB, ignore alpha if present
-            color_counter[color] += 1
-    
-    # Return the most common color
-    most_common = color_counter.most_common(1)
-    if most_common:
-        return most_common[0][0]  # Return the RGB tuple
-    else:
-        return (0, 0, 0)
-    
-# Generic safe image loader (returns None if missing)
-def safe_load_image(path):
-    try:
-        if os.path.exists(path):
-            image = pygame.image.load(path)
-            # bg_color = get_most_common_color(image)
-            # image.set_colorkey(bg_color)
-            image.set_alpha(None)
-            return image.convert_alpha()
-    except Exception:
-        pass
-    return None
-
-def safe_load_image_no_bg(path):
-    try:
-        if os.path.exists(path):
-            image = pygame.image.load(path)
-            bg_color = get_most_common_color(image)
-            image.set_colorkey(bg_color)
-            image.set_alpha(None)
-            return image.convert_alpha()
-    except Exception:
-        pass
-    return None
+register_transform("no_bg", key_out_background)
+
+# Generic safe image loader (returns None if missing); images come from the shared asset cache,
+# using the processed sprite for generated images once it exists
+def safe_load_image(path, size=None, fit=False):
+    return get_image(sprite_path(path, size), size, fit=fit, alpha=True)
+
+def safe_load_image_no_bg(path, size=None):
+    return get_image(path, size, transform="no_bg", alpha=True)
+
 
 # -------------------- Entities ---------------------- #
 class Animal:
-    def __init__(self, cx, cy, size_px, speed_px, hits_required, img_raw):
+    def __init__(self, cx, cy, size_px, speed_px, hits_required, img_path):
         self.size = int(size_px)
         self.rect = pygame.Rect(0, 0, self.size, self.size)
         self.rect.center = (cx, cy)
@@ -93,22 +56,14 @@ class Animal:
         self.hits_left = max(1, int(round(hits_required)))
         self.color = (180, 100, 50)  # Default brown color
 
-        self.img_raw = img_raw
+        self.img_path = img_path
         self.img = None
         self._rescale_image()
+        self.prev = self.rect.topleft  # position before the last step, for interpolation
 
     def _rescale_image(self):
-        if self.img_raw:
-            # Keep aspect ratio; fit into square self.size x self.size
-            w, h = self.img_raw.get_size()
-            if w == 0 or h == 0:
-                self.img = None
-                return
-            scale = min(self.size / w, self.size / h)
-            new_w, new_h = max(1, int(w * scale)), max(1, int(h * scale))
-            self.img = pygame.transform.smoothscale(self.img_raw, (new_w, new_h))
-        else:
-            self.img = None
+        # Keep aspect ratio; fit into square self.size x self.size
+        self.img = safe_load_image(self.img_path, (self.size, self.size), fit=True)
 
     def set_size(self, new_size):
         center = self.rect.center
@@ -118,77 +73,74 @@ class Animal:
         self._rescale_image()
 
     def update(self, screen_width):
-        self.rect.x += int(self.vx)
-        if self.rect.left <= 0:
-            self.rect.left = 0
-            self.vx = abs(self.vx)
-        elif self.rect.right >= screen_width:
-            self.rect.right = screen_width
-            self.vx = -abs(self.vx)
-
-    def draw(self, surface):
+        self.prev = self.rect.topleft
+        self.rect.x, self.vx = move_animal(self.rect.x, self.vx, self.size, screen_width)
+
+    def draw(self, surface, alpha=1.0):
+        rect = self.rect.copy()
+        rect.topleft = lerp_point(self.prev, self.rect.topleft, alpha)
         if self.img:
             # Center the scaled image inside rect
-            img_rect = self.img.get_rect(center=self.rect.center)
+            img_rect = self.img.get_rect(center=rect.center)
             surface.blit(self.img, img_rect)
         else:
-            pygame.draw.ellipse(surface, self.color, self.rect)
-            pygame.draw.ellipse(surface, (0, 0, 0), self.rect, 2)
+            pygame.draw.ellipse(surface, self.color, rect)
+            pygame.draw.ellipse(surface, (0, 0, 0), rect, 2)
 
 class catcher:
-    def __init__(self, screen_width, screen_height, img_raw=None):
-        self.w = 90
-        self.h = 64
+    def __init__(self, screen_width, screen_height, img_path=None):
+        self.w = CATCHER_W
+        self.h = CATCHER_H
         self.rect = pygame.Rect(0, 0, self.w, self.h)
-        self.rect.midbottom = (screen_width // 2, screen_height - 24)
+        self.rect.midbottom = (screen_width // 2, screen_height - CATCHER_MARGIN)
         self.color = (255, 240, 180)
-        self.cooldown_ms = beastBalls_COOLDOWN_MS
-        self.last_shot_time = 0
+        self.cooldown_ms = get_config().beastball_cooldown_ms
+        self.last_shot_time = -self.cooldown_ms
         self.screen_width = screen_width
+        self.prev = self.rect.topleft
 
         # Prepare catcher image
-        if img_raw:
-            self.img = pygame.transform.smoothscale(img_raw, (self.w, self.h))
-        else:
-            self.img = None
+        self.img = safe_load_image_no_bg(img_path, (self.w, self.h))
 
     def move(self, dx):
-        self.rect.x += dx
-        self.rect.x = max(0, min(self.screen_width - self.w, self.rect.x))
+        self.prev = self.rect.topleft
+        self.rect.x = move_catcher(self.rect.x, dx, self.screen_width)
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
+        rect = self.rect.copy()
+        rect.topleft = lerp_point(self.prev, self.rect.topleft, alpha)
         if self.img:
-            surface.blit(self.img, self.rect)
+            surface.blit(self.img, rect)
         else:
-            pygame.draw.rect(surface, self.color, self.rect, border_radius=0)
+            pygame.draw.rect(surface, self.color, rect, border_radius=0)
             barrel = pygame.Rect(0, 0, 8, 16)
-            barrel.midtop = (self.rect.centerx, self.rect.top - 2)
+            barrel.midtop = (rect.centerx, rect.top - 2)
             pygame.draw.rect(surface, (255, 220, 140), barrel, border_radius=0)
 
-    def can_shoot(self):
-        return pygame.time.get_ticks() - self.last_shot_time >= self.cooldown_ms
+    def can_shoot(self, now_ms):
+        return now_ms - self.last_shot_time >= self.cooldown_ms
 
-    def record_shot(self):
-        self.last_shot_time = pygame.time.get_ticks()
+    def record_shot(self, now_ms):
+        self.last_shot_time = now_ms
 
 class beastBalls:
-    def __init__(self, x, y, img_raw=None):
-        self.w, self.h = 10, 24
+    def __init__(self, x, y, img_path=None):
+        self.w, self.h = BALL_W, BALL_H
         self.rect = pygame.Rect(x - self.w // 2, y - self.h, self.w, self.h)
         self.color = (255, 255, 255)
-        if img_raw:
-            self.img = pygame.transform.smoothscale(img_raw, (self.w, self.h))
-        else:
-            self.img = None
+        self.img = safe_load_image(img_path, (self.w, self.h))
+        self.prev = self.rect.topleft
 
     def update(self):
-        self.rect.y -= beastBalls_SPEED
+        self.prev = self.rect.topleft
+        self.rect.y -= get_config().beastball_speed
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
+        pos = lerp_point(self.prev, self.rect.topleft, alpha)
         if self.img:
-            surface.blit(self.img, self.rect)
+            surface.blit(self.img, pos)
         else:
-            pygame.draw.rect(surface, self.color, self.rect, border_radius=3)
+            pygame.draw.rect(surface, self.color, pygame.Rect(pos, self.rect.size), border_radius=3)
 
     def offscreen(self):
         return self.rect.bottom < 0
@@ -200,20 +152,31 @@ STATE_WIN     = "win"
 STATE_LOSE    = "lose"
 STATE_STOP    = "stop"   # stopped/paused via E key
 
+# Posted once a catch has been saved (or failed to); event.result is a CatchResult
+CATCH_RECORDED = pygame.event.custom_type()
+
+def _post_catch_recorded(result: CatchResult):
+    # Runs on the recorder's worker thread; pygame's event queue is thread-safe
+    if pygame.display.get_init():
+        pygame.event.post(pygame.event.Event(CATCH_RECORDED, result=result))
+
 # ------------------- Main Display ------------------- #
 class CaptureGameDisplay(BaseDisplay):
     CAPTION = "Animal Capture Game"
+    FIXED_STEP = True
 
     def __init__(self, screen: pygame.Surface, 
-                 background_path: Optional[str] = "frontend/assets/swamp.png",
+                 background_path: Optional[str] = ASSETS_PATH + "swamp.png",
                  animal_image_path: Optional[str] = None,
                  animal_name: str = "Mysterious Creature",
                  animal_desc: str = "A fascinating creature that requires skill to capture safely.",
                  size_power: float = 1.0,
                  speed_power: float = 1.0,
                  shots_power: float = 1.0,
-                 catcher_image_path: Optional[str] = "frontend/assets/human.jpeg",
-                 beastBalls_image_path: Optional[str] = "frontend/assets/beastBalls.jpg"):
+                 catcher_image_path: Optional[str] = ASSETS_PATH + "human.jpeg",
+                 beastBalls_image_path: Optional[str] = None,
+                 catch_animal: Optional[AnimalEntity] = None,
+                 world: Optional[Dict] = None):
         
         super().__init__(screen, background_path)
         
@@ -223,22 +186,24 @@ class CaptureGameDisplay(BaseDisplay):
         self.size_power = size_power
         self.speed_power = speed_power
         self.shots_power = shots_power
+
+        # What gets recorded on a win: the world's Animal and where/when it was caught
+        self.animal_image_path = animal_image_path
+        self.catch_animal = catch_animal
+        self.world = world or {}
+        self.save_status: Optional[str] = None
         
-        # Load images
-        self.animal_img_raw = safe_load_image(animal_image_path) if animal_image_path else None
-        self.catcher_img_raw = safe_load_image_no_bg(catcher_image_path) if catcher_image_path else None
-        self.beastBalls_img_raw = safe_load_image(beastBalls_image_path) if beastBalls_image_path else None
+        # Sprites load their images, already scaled, from the shared asset cache
+        self.catcher_image_path = catcher_image_path
+        self.beastBalls_image_path = beastBalls_image_path or get_config().beastball_image_path
         
         # Game state
         self.clock = pygame.time.Clock()
         self.reset_game()
 
     def apply_powers(self):
-        size_px  = BASE_SIZE  * self.size_power
-        speed_px = BASE_SPEED * self.speed_power
-        hits_req = BASE_SHOTS * self.shots_power
-        ammo     = int(BASE_AMMO)
-        return int(size_px), speed_px, hits_req, ammo
+        params = CatchParams.from_powers(self.size_power, self.speed_power, self.shots_power)
+        return params.size_px, params.speed_px, params.hits, params.ammo
 
     def reset_game(self):
         size_px, speed_px, hits_req, ammo = self.apply_powers()
@@ -247,24 +212,43 @@ class CaptureGameDisplay(BaseDisplay):
         self.intro_animal = Animal(
             self.w // 2, self.h // 2 - 20,
             max(180, size_px * 2), 0,
-            max(1, int(round(hits_req))), self.animal_img_raw
+            max(1, int(round(hits_req))), self.animal_image_path
         )
 
         # Playing animal
         self.animal = Animal(
             self.w // 2, self.h // 3,
             size_px, speed_px,
-            max(1, int(round(hits_req))), self.animal_img_raw
+            max(1, int(round(hits_req))), self.animal_image_path
         )
 
-        self.catcher = catcher(self.w, self.h, self.catcher_img_raw)
+        self.catcher = catcher(self.w, self.h, self.catcher_image_path)
         self.beastBallss = []
         self.ammo = int(ammo)
         self.shots_taken = 0
+        self.save_status = None
         self.state = STATE_INTRO
 
+    def _record_catch(self):
+        """Hand the catch to the background recorder; the result comes back as CATCH_RECORDED."""
+        player = get_active_player()
+        if player is None:
+            self.save_status = "Not signed in, so this catch was not saved."
+            return
+        animal = self.catch_animal or AnimalEntity(species=self.animal_name,
+                                                   epoch=self.world.get("epoch") or "Unknown",
+                                                   size=1.0,
+                                                   imagePath=self.animal_image_path,
+                                                   description=self.animal_desc)
+        recorder = get_catch_recorder(get_player_manager(), on_done=_post_catch_recorded)
+        recorder.record_catch(player, animal,
+                              place=self.world.get("place") or "Unknown",
+                              time_mya=self.world.get("time_mya") or 0,
+                              beastballs_used=self.shots_taken)
+        self.save_status = "Saving your catch..."
+
     def draw_text_center(self, surface, text, font, color, y):
-        t = font.render(text, True, color)
+        t = render_text(font, text, color)
         r = t.get_rect(center=(self.w // 2, y))
         surface.blit(t, r)
 
@@ -275,11 +259,15 @@ class CaptureGameDisplay(BaseDisplay):
             color = (90, 140, 200)
         pygame.draw.rect(surface, color, rect, border_radius=10)
         pygame.draw.rect(surface, (20, 30, 50), rect, width=2, border_radius=10)
-        txt = get_font(24).render(label, True, (255, 255, 255))
+        txt = render_text(get_font(24), label, (255, 255, 255))
         surface.blit(txt, txt.get_rect(center=rect.center))
         return enabled and hover
 
     def on_event(self, event: pygame.event.Event):
+        if event.type == CATCH_RECORDED:
+            self.save_status = "Added to your collection." if event.result.ok else "Could not save this catch."
+            return
+
         # Global hotkeys: E = stop/pause
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_e:
@@ -301,24 +289,26 @@ class CaptureGameDisplay(BaseDisplay):
             route_to_instructions(self.background_path, self.screen)
         if keys[pygame.K_m]: res = route_to_mode(self.background_path, self.screen); return
 
-    def update(self, dt_ms: int):
+    def fixed_update(self, step_ms: float):
         keys = pygame.key.get_pressed()
 
         if self.state == STATE_PLAYING:
             # catcher movement
             dx = 0
+            catcher_speed = get_config().catcher_speed
             if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                dx -= catcher_SPEED
+                dx -= catcher_speed
             if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                dx += catcher_SPEED
+                dx += catcher_speed
             self.catcher.move(dx)
 
             # Shooting
-            if (keys[pygame.K_SPACE] or keys[pygame.K_UP]) and self.ammo > 0 and self.catcher.can_shoot():
+            now = self.sim.time_ms
+            if (keys[pygame.K_SPACE] or keys[pygame.K_UP]) and self.ammo > 0 and self.catcher.can_shoot(now):
                 bx = self.catcher.rect.centerx
-                by = self.catcher.rect.top - 4
-                self.beastBallss.append(beastBalls(bx, by, self.beastBalls_img_raw))
-                self.catcher.record_shot()
+                by = self.catcher.rect.top - MUZZLE_GAP
+                self.beastBallss.append(beastBalls(bx, by, self.beastBalls_image_path))
+                self.catcher.record_shot(now)
                 self.ammo -= 1
                 self.shots_taken += 1
 
@@ -342,6 +332,7 @@ class CaptureGameDisplay(BaseDisplay):
             # Win/Lose logic
             if self.animal.hits_left <= 0:
                 self.state = STATE_WIN
+                self._record_catch()
             elif self.ammo <= 0 and not self.beastBallss:
                 self.state = STATE_LOSE
 
@@ -374,18 +365,8 @@ class CaptureGameDisplay(BaseDisplay):
             self.draw_text_center(surface, self.animal_name, get_font(36, bold=True), (255, 255, 255), self.h // 2 + 50)
 
             # Wrap description
-            words = self.animal_desc.split()
-            lines, line = [], []
             font_md = get_font(24)
-            for w in words:
-                test = " ".join(line + [w])
-                if font_md.size(test)[0] > self.w * 0.8:
-                    lines.append(" ".join(line))
-                    line = [w]
-                else:
-                    line.append(w)
-            if line:
-                lines.append(" ".join(line))
+            lines = wrap_text(self.animal_desc, font_md, int(self.w * 0.8))
             y_start = self.h // 2 + 110
             for i, ln in enumerate(lines[:3]):
                 self.draw_text_center(surface, ln, font_md, (230, 240, 255), y_start + i * 28)
@@ -404,11 +385,12 @@ class CaptureGameDisplay(BaseDisplay):
             self.draw_text_center(surface, "Press E to Stop • I for Instructions", get_font(18), (0, 0, 0), 24)
 
         elif self.state == STATE_PLAYING:
-            # Draw entities
-            self.animal.draw(surface)
+            # Draw entities between their last two simulation steps
+            alpha = self.sim.alpha
+            self.animal.draw(surface, alpha)
             for b in self.beastBallss:
-                b.draw(surface)
-            self.catcher.draw(surface)
+                b.draw(surface, alpha)
+            self.catcher.draw(surface, alpha)
 
             # HUD
             ui_pad = 10
@@ -419,8 +401,8 @@ class CaptureGameDisplay(BaseDisplay):
             font_md = get_font(24)
             info_left = f"Animal: {self.animal_name} | Hits Left: {self.animal.hits_left} | Ammo: {self.ammo}"
             info_right = ""
-            surface.blit(font_md.render(info_left, True, (255, 255, 255)), (hud_bg.x + ui_pad, hud_bg.y + 10))
-            rtxt = font_md.render(info_right, True, (255, 255, 255))
+            surface.blit(render_text(font_md, info_left, (255, 255, 255)), (hud_bg.x + ui_pad, hud_bg.y + 10))
+            rtxt = render_text(font_md, info_right, (255, 255, 255))
             surface.blit(rtxt, (hud_bg.right - rtxt.get_width() - ui_pad, hud_bg.y + 10))
 
             # Footer hint
@@ -437,8 +419,6 @@ class CaptureGameDisplay(BaseDisplay):
             elif self.state == STATE_WIN:
                 title = "Captured!"
                 detail = f"You captured the {self.animal_name} with {self.shots_taken} shots. Press R to Restart or ESC to Exit."
-                # TODO: add the code to update user info and add caught animals
-
             else:
                 title = "Out of Ammo!"
                 need = self.animal.hits_left
@@ -446,6 +426,8 @@ class CaptureGameDisplay(BaseDisplay):
 
             self.draw_text_center(surface, title, get_font(36, bold=True), (255, 255, 255), self.h // 2 - 30)
             self.draw_text_center(surface, detail, get_font(24), (230, 240, 255), self.h // 2 + 10)
+            if self.state == STATE_WIN and self.save_status:
+                self.draw_text_center(surface, self.save_status, get_font(20), (200, 230, 200), self.h // 2 + 44)
 
 # Optional: local run for testing
 if __name__ == "__main__":
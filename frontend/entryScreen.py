@@ -3,6 +3,7 @@ import pygame
 import threading
 from typing import Optional
 from frontend.baseDisplay import BaseDisplay
+from frontend.textCache import render_text
 from backend.utils import *
 from backend.catchGameUtils import *
 
@@ -52,7 +53,7 @@ class Button:
         pygame.draw.rect(surface, (15, 25, 40), self.rect, 2, border_radius=12)
         if font_obj is None:
             font_obj = font(size=24)
-        t = font_obj.render(self.label, True, (255, 255, 255))
+        t = render_text(font_obj, self.label, (255, 255, 255))
         surface.blit(t, t.get_rect(center=self.rect.center))
 
     def clicked(self, event):
@@ -88,7 +89,7 @@ class InputBox:
         # Text / placeholder
         shown = self.text if self.text else (self.placeholder or "")
         hint_color = (150, 155, 165) if not self.text else color
-        t = font_obj.render(shown, True, hint_color)
+        t = render_text(font_obj, shown, hint_color)
         surface.blit(t, (self.rect.x + 10, self.rect.y + self.rect.height//2 - t.get_height()//2))
 
 # -------------- Validation -------------- #
@@ -238,7 +239,7 @@ class EntryDisplay(BaseDisplay):
             dots = "." * self.loading_dots
             stage_text = self.loading_stage if self.loading_stage else "Loading Game"
             txt = stage_text + dots
-            t_surf = self.FONT_HERO.render(txt, True, (245, 248, 255))
+            t_surf = render_text(self.FONT_HERO, txt, (245, 248, 255))
             
             # Progress indicator
             # progress_text = "Fetching data from backend..."
@@ -261,8 +262,8 @@ class EntryDisplay(BaseDisplay):
         # Heading and subheading
         heading = "Enter Details"
         sub = "Provide a Place and a Time to start the game."
-        h_surf = self.FONT_HERO.render(heading, True, (30, 36, 48))
-        s_surf = self.FONT_SUB.render(sub, True, (70, 85, 110))
+        h_surf = render_text(self.FONT_HERO, heading, (30, 36, 48))
+        s_surf = render_text(self.FONT_SUB, sub, (70, 85, 110))
         surface.blit(h_surf, (self.card_rect.left + 24, self.card_rect.top + 20))
         surface.blit(s_surf, (self.card_rect.left + 24, self.card_rect.top + 20 + h_surf.get_height() + 6))
 
@@ -272,14 +273,14 @@ class EntryDisplay(BaseDisplay):
         field_w = int(self.card_rect.w * 0.75)
 
         # Place field
-        lbl1 = self.FONT_LBL.render("Place", True, (60, 70, 90))
+        lbl1 = render_text(self.FONT_LBL, "Place", (60, 70, 90))
         surface.blit(lbl1, (left, y)); y += lbl1.get_height() + 8
         self.place_box.rect.topleft = (left, y)
         self.place_box.rect.size = (field_w, 50)
         self.place_box.draw(surface, self.FONT_MD); y += 50 + 14
 
         # Time field
-        lbl2 = self.FONT_LBL.render("Time (million years ago)", True, (60, 70, 90))
+        lbl2 = render_text(self.FONT_LBL, "Time (million years ago)", (60, 70, 90))
         surface.blit(lbl2, (left, y)); y += lbl2.get_height() + 8
         self.time_box.rect.topleft = (left, y)
         self.time_box.rect.size = (field_w, 50)
@@ -287,7 +288,7 @@ class EntryDisplay(BaseDisplay):
 
         # Validation message
         if self.message:
-            warn = self.FONT_SM.render(self.message, True, (200, 60, 60))
+            warn = render_text(self.FONT_SM, self.message, (200, 60, 60))
             surface.blit(warn, warn.get_rect(midtop=(self.card_rect.centerx, y)))
             y += warn.get_height() + 10
 
@@ -301,11 +302,11 @@ class EntryDisplay(BaseDisplay):
             base = (150, 160, 175)
             pygame.draw.rect(surface, base, self.go_btn.rect, border_radius=12)
             pygame.draw.rect(surface, (120, 130, 145), self.go_btn.rect, 2, border_radius=12)
-            t = self.FONT_MD.render(self.go_btn.label, True, (240, 240, 240))
+            t = render_text(self.FONT_MD, self.go_btn.label, (240, 240, 240))
             surface.blit(t, t.get_rect(center=self.go_btn.rect.center))
 
         # Footer hint
-        footer = self.FONT_SM.render("Press I for Instructions", True, (0, 0, 0))
+        footer = render_text(self.FONT_SM, "Press I for Instructions", (0, 0, 0))
         surface.blit(footer, footer.get_rect(midbottom=(self.card_rect.centerx, self.card_rect.bottom - 8)))
 
     # ---------- Backend Processing ----------
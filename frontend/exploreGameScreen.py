@@ -1,15 +1,27 @@
 # frontend/pokemon_main.py â€" Animal Explorer (BaseDisplay)
 import math
+import os
 import random
+from collections import OrderedDict
 import pygame
 from typing import Optional, Tuple, List, Dict
 from backend.utils import *
+from backend.config import get_config
+from backend.spritePipeline import sprite_path
 
 # Robust import for BaseDisplay
 try:
     from frontend.baseDisplay import BaseDisplay
+    from frontend.assetManager import get_image
+    from frontend.textCache import render_text
+    from frontend.textLayout import wrap_paragraphs
+    from frontend.simulation import lerp_point
 except Exception:
     from baseDisplay import BaseDisplay  # fallback if project structure differs
+    from assetManager import get_image
+    from textCache import render_text
+    from textLayout import wrap_paragraphs
+    from simulation import lerp_point
 
 # Colors
 WHITE = (255, 255, 255)
@@ -25,7 +37,6 @@ BROWN = (121, 85, 72)
 
 # Game constants
 PERSON_SIZE = 40
-PERSON_SPEED = 4
 ANIMAL_SIZE = 35
 WIGGLE_DISTANCE = 100   # Distance at which animals start wiggles
 INTERACTION_DISTANCE = 50  # Distance at which name appears and info can be shown
@@ -36,14 +47,157 @@ DEFAULT_ANIMAL_INFO = "A mysterious creature from an ancient time."
 # Default animal colors for rendering unknown species
 ANIMAL_COLORS = [GREEN, BLUE, RED, PURPLE, ORANGE, BROWN, YELLOW]
 
+# ----------------- Spatial index ----------------- #
+class SpatialGrid:
+    """Uniform grid of entities (anything with .x/.y) for radius and nearest-neighbour queries.
+
+    With cells at least as big as the query radius, a query looks at no more than
+    3x3 cells, so it costs time proportional to the entities nearby rather than to
+    every entity in the world. Call move() after an entity's position changes.
+    """
+    def __init__(self, cell_size: int = WIGGLE_DISTANCE):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], list] = {}
+        self._where: Dict[object, Tuple[int, int]] = {}  # entity -> its cell
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def __len__(self):
+        return len(self._where)
+
+    def insert(self, entity) -> None:
+        cell = self._where[entity] = self._cell(entity.x, entity.y)
+        self._cells.setdefault(cell, []).append(entity)
+
+    def remove(self, entity) -> None:
+        cell = self._where.pop(entity)
+        bucket = self._cells[cell]
+        bucket.remove(entity)
+        if not bucket:
+            del self._cells[cell]
+
+    def move(self, entity) -> None:
+        """Re-file `entity` after it moved; nothing to do while it stays in its cell."""
+        if self._cell(entity.x, entity.y) != self._where[entity]:
+            self.remove(entity)
+            self.insert(entity)
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[Tuple[object, float]]:
+        """(entity, distance) for every entity within `radius` of (x, y)."""
+        cx0, cy0 = self._cell(x - radius, y - radius)
+        cx1, cy1 = self._cell(x + radius, y + radius)
+        found = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for entity in self._cells.get((cx, cy), ()):
+                    d = math.hypot(entity.x - x, entity.y - y)
+                    if d <= radius:
+                        found.append((entity, d))
+        return found
+
+    def nearest(self, x: float, y: float, max_dist: float) -> Optional[Tuple[object, float]]:
+        """Closest (entity, distance) within `max_dist` of (x, y), or None."""
+        return min(self.query_radius(x, y, max_dist), key=lambda hit: hit[1], default=None)
+
+    def query_rect(self, rect: pygame.Rect) -> list:
+        """Entities whose position lies inside `rect`."""
+        cx0, cy0 = self._cell(rect.left, rect.top)
+        cx1, cy1 = self._cell(rect.right, rect.bottom)
+        return [entity
+                for cx in range(cx0, cx1 + 1)
+                for cy in range(cy0, cy1 + 1)
+                for entity in self._cells.get((cx, cy), ())
+                if rect.collidepoint(entity.x, entity.y)]
+
+
+# ----------------- World background ----------------- #
+class ChunkedBackground:
+    """A world-sized background cut into square chunks, built only as the camera nears them.
+
+    Chunks are tiled from `tile` (or filled with a flat color) on first use and
+    kept in an LRU of `capacity` chunks, so memory stays the same however far the
+    player walks. Chunks one ring outside the view are prebuilt a few per frame,
+    so walking rarely has to build a chunk the frame it comes into view.
+    """
+    PREFETCH_PER_FRAME = 2
+    # Smaller chunks would mean thousands of blits a frame
+    MIN_CHUNK_PX = 32
+
+    def __init__(self, tile: Optional[pygame.Surface], chunk_px: int, capacity: int,
+                 view_size: Tuple[int, int], fill: Tuple[int, int, int] = (28, 32, 48)):
+        self.tile = tile
+        self.chunk_px = max(self.MIN_CHUNK_PX, chunk_px)
+        # Fewer chunks than the view plus its prefetch ring would rebuild chunks every frame
+        self.capacity = max(capacity, self.chunks_around(view_size))
+        self.fill = fill
+        self._chunks: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+        self.built = 0
+        self.evicted = 0
+
+    def _build(self, key: Tuple[int, int]) -> pygame.Surface:
+        size = self.chunk_px
+        chunk = pygame.Surface((size, size))
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+        chunk.fill(self.fill)
+        if self.tile is not None:
+            tw, th = self.tile.get_size()
+            # The chunk's world origin decides where the repeating tile starts inside it
+            ox, oy = (key[0] * size) % tw, (key[1] * size) % th
+            for y in range(-oy, size, th):
+                for x in range(-ox, size, tw):
+                    chunk.blit(self.tile, (x, y))
+        self.built += 1
+        return chunk
+
+    def chunk(self, key: Tuple[int, int]) -> pygame.Surface:
+        surf = self._chunks.get(key)
+        if surf is None:
+            surf = self._chunks[key] = self._build(key)
+            while len(self._chunks) > self.capacity:
+                self._chunks.popitem(last=False)
+                self.evicted += 1
+        else:
+            self._chunks.move_to_end(key)
+        return surf
+
+    def chunks_around(self, view_size: Tuple[int, int]) -> int:
+        """Most chunks a view of this size touches, counting the one-chunk ring around it."""
+        w, h = view_size
+        size = self.chunk_px
+        return (-(-w // size) + 3) * (-(-h // size) + 3)
+
+    def _keys(self, view: pygame.Rect, margin: int = 0) -> List[Tuple[int, int]]:
+        size = self.chunk_px
+        return [(kx, ky)
+                for ky in range(view.top // size - margin, (view.bottom - 1) // size + margin + 1)
+                for kx in range(view.left // size - margin, (view.right - 1) // size + margin + 1)]
+
+    def draw(self, surface: pygame.Surface, view: pygame.Rect) -> None:
+        """Draw the world area `view` (world coordinates) onto `surface` at (0, 0)."""
+        visible = self._keys(view)
+        budget = self.PREFETCH_PER_FRAME
+        for key in self._keys(view, margin=1):
+            if budget and key not in self._chunks and key not in visible:
+                self.chunk(key)
+                budget -= 1
+        for key in visible:
+            surface.blit(self.chunk(key), (key[0] * self.chunk_px - view.x, key[1] * self.chunk_px - view.y))
+
+    def stats(self):
+        return {"resident": len(self._chunks), "built": self.built, "evicted": self.evicted}
+
+
 # ----------------- Entities ----------------- #
 class Person:
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
         self.size = PERSON_SIZE
-        self.speed = PERSON_SPEED
+        self.speed = get_config().person_speed
         self.rect = pygame.Rect(x - self.size//2, y - self.size//2, self.size, self.size)
+        self.prev = (x, y)  # position before the last step, for interpolation
 
         # Animation vars
         self.frames = self._create_frames()
@@ -80,9 +234,11 @@ class Person:
             frames.append(surf)
         return frames
 
-    def update(self, keys, dt_ms: int, bounds: Tuple[int, int]):
-        """Move and animate based on input; clamp to bounds (width,height)."""
+    def update(self, keys, dt_ms: float, bounds: Tuple[int, int]):
+        """One simulation step: move and animate based on input; clamp to bounds (width,height)."""
         w, h = bounds
+        self.prev = (self.x, self.y)
+        self.speed = get_config().person_speed
         dx = dy = 0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:  dx = -self.speed
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]: dx =  self.speed
@@ -107,12 +263,17 @@ class Person:
         self.y = max(self.size//2, min(h - self.size//2, self.y + dy))
         self.rect.topleft = (self.x - self.size//2, self.y - self.size//2)
 
-    def draw(self, screen: pygame.Surface):
-        screen.blit(self.image, (self.x - self.size//2, self.y - self.size//2))
+    def render_pos(self, alpha: float = 1.0) -> Tuple[int, int]:
+        """Where to draw: `alpha` of the way from the previous step's position to the current one."""
+        return lerp_point(self.prev, (self.x, self.y), alpha)
+
+    def draw(self, screen: pygame.Surface, camera: Tuple[int, int] = (0, 0), alpha: float = 1.0):
+        x, y = self.render_pos(alpha)
+        screen.blit(self.image, (x - camera[0] - self.size//2, y - camera[1] - self.size//2))
 
 
 class Animal:
-    def __init__(self, x: int, y: int, species_name: str, description: str, image_name: Optional[str] = None, relative_size: float = 1.0):
+    def __init__(self, x: int, y: int, species_name: str, description: str, image_name: Optional[str] = None, relative_size: float = 1.0, entity=None):
         self.x = x
         self.y = y
         self.original_x = x
@@ -122,6 +283,7 @@ class Animal:
         self.description = description
         self.image_name = image_name
         self.relative_size = relative_size  # could be adjusted based on species
+        self.entity = entity  # backend Animal this creature came from, if any
         self.rect = pygame.Rect(x - self.size//2, y - self.size//2, self.size, self.size)
         self.info_timer = 0  
         self.info_duration = 5000
@@ -140,6 +302,7 @@ class Animal:
 
         # Info box
         self.info_font = pygame.font.Font(None, 22)
+        self.info_wrap_w = self.info_font.size("n" * 60)[0]  # about 60 characters per line
         self.show_info = False  # toggled via 'P' nearby
 
         # Render image & name
@@ -152,14 +315,15 @@ class Animal:
         
         # Try to load from image file if image_name is provided
         if self.image_name:
-            try:
-                # Try to load the actual image file
-                loaded_img = pygame.image.load(f"frontend/assets/animals/{self.image_name}")
-                scaled_img = pygame.transform.scale(loaded_img, (self.size, self.size))
+            # Try the actual image file; if loading fails, continue to procedural generation.
+            # Generated animals arrive as a full path, bundled ones as a name under assets/animals/
+            path = self.image_name
+            if not os.path.exists(path):
+                path = f"{get_config().assets_path}animals/{path}"
+            scaled_img = get_image(sprite_path(path, (self.size, self.size)),
+                                   (self.size, self.size), fit=True, alpha=True)
+            if scaled_img is not None:
                 return scaled_img
-            except Exception:
-                # If loading fails, continue to procedural generation
-                pass
         
         # Procedural generation based on species name or fallback
         species_lower = self.species_name.lower()
@@ -252,9 +416,10 @@ class Animal:
         # Add some unique features based on the secondary color
         pygame.draw.circle(surf, secondary, (self.size//2, self.size//2 + 8), 3)
 
-    def update(self, person: Person, dt: float):
+    def update(self, person: Person, dt: float, dist: Optional[float] = None):
         """Update proximity wiggle & name fade based on distance to person."""
-        dist = math.hypot(self.x - person.x, self.y - person.y)
+        if dist is None:
+            dist = math.hypot(self.x - person.x, self.y - person.y)
         if dist <= WIGGLE_DISTANCE:
             self.is_wiggling = True
             self.target_wiggle_intensity = min(1.0, (WIGGLE_DISTANCE - dist) / WIGGLE_DISTANCE)
@@ -295,34 +460,27 @@ class Animal:
                 self.show_info = False
                 self.info_timer = 0
 
-    def draw_info_box(self, screen: pygame.Surface):
+    def settled(self) -> bool:
+        """True once the animal is out of range and done animating, so update() can be skipped."""
+        if self.is_wiggling or self.name_box_alpha > 0 or self.info_timer > 0:
+            return False
+        if self.wiggle_intensity >= 0.01:
+            return False
+        self.wiggle_intensity = 0.0
+        return True
+
+    def draw_info_box(self, screen: pygame.Surface, camera: Tuple[int, int] = (0, 0)):
         if not self.show_info:
             return
         
-        # Split description by newlines and wrap long lines
-        lines = []
-        for line in self.description.split('\n'):
-            if len(line) > 60:  # Wrap long lines
-                words = line.split()
-                current_line = []
-                for word in words:
-                    test_line = ' '.join(current_line + [word])
-                    if len(test_line) <= 60:
-                        current_line.append(word)
-                    else:
-                        if current_line:
-                            lines.append(' '.join(current_line))
-                        current_line = [word]
-                if current_line:
-                    lines.append(' '.join(current_line))
-            else:
-                lines.append(line)
+        # Keep the description's own line breaks and wrap long lines
+        lines = wrap_paragraphs(self.description, self.info_font, self.info_wrap_w)
         
-        line_surfs = [self.info_font.render(line, True, BLACK) for line in lines]
+        line_surfs = [render_text(self.info_font, line, BLACK) for line in lines]
         box_w = max(s.get_width() for s in line_surfs) + 20
         box_h = sum(s.get_height() for s in line_surfs) + 15
-        box_x = int(self.x - box_w / 2)
-        box_y = int(self.y - self.size//2 - box_h - 10)
+        box_x = int(self.x - camera[0] - box_w / 2)
+        box_y = int(self.y - camera[1] - self.size//2 - box_h - 10)
         
         # Clamp into screen bounds
         sw, sh = screen.get_size()
@@ -341,14 +499,15 @@ class Animal:
             screen.blit(s, (box_x + 10, y))
             y += s.get_height() + 2
 
-    def draw(self, screen: pygame.Surface):
-        screen.blit(self.image, (int(self.x - self.size//2), int(self.y - self.size//2)))
+    def draw(self, screen: pygame.Surface, camera: Tuple[int, int] = (0, 0)):
+        sx, sy = self.x - camera[0], self.y - camera[1]
+        screen.blit(self.image, self.image.get_rect(center=(int(sx), int(sy))))
         # Name box
         if self.name_box_alpha > 10 and self.name_surface:
             bw = self.name_surface.get_width() + 10
             bh = self.name_surface.get_height() + 6
-            bx = int(self.x - bw // 2)
-            by = int(self.y - self.size//2 - bh - 5)
+            bx = int(sx - bw // 2)
+            by = int(sy - self.size//2 - bh - 5)
             box = pygame.Surface((bw, bh), pygame.SRCALPHA)
             box.fill((255, 255, 255, int(self.name_box_alpha * 0.9)))
             text = self.name_surface.copy()
@@ -357,24 +516,37 @@ class Animal:
             pygame.draw.rect(screen, (0, 0, 0, int(self.name_box_alpha * 0.5)), (bx, by, bw, bh), 2, border_radius=6)
             screen.blit(text, (bx + 5, by + 3))
         # Info panel
-        self.draw_info_box(screen)
+        self.draw_info_box(screen, camera)
 
 
 # --------------- Display (BaseDisplay) --------------- #
 class PokemonDisplay(BaseDisplay):
     CAPTION = "Animal Explorer"
+    FIXED_STEP = True
+    # The terrain chunks cover the whole view
+    OPAQUE_CONTENT = True
 
-    def __init__(self, screen: pygame.Surface, background_path: Optional[str] = "frontend/assets/swamp.png", animals: Optional[Dict[str, Dict[str, str]]] = None):
+    def __init__(self, screen: pygame.Surface, background_path: Optional[str] = get_config().assets_path + "swamp.png", animals: Optional[Dict[str, Dict[str, str]]] = None, world: Optional[Dict] = None):
         super().__init__(screen, background_path)
+        self.world = world  # place / time_mya / epoch of the generated world, passed on to catches
         w, h = self.screen.get_size()
 
-        # Prepare tiled background (overlays base background)
-        # self.bg_tiled = self._create_tiled_background_img(background_path)
-        self.bg_tiled = None
+        # The world is several screens across; the camera follows the person and the
+        # background is streamed in chunks around the view
+        config = get_config()
+        screens = max(1, config.explore_world_screens)
+        self.world_w, self.world_h = w * screens, h * screens
         self.background_path = background_path
+        self.terrain = ChunkedBackground(get_image(background_path, transform="lighten"),
+                                         config.explore_chunk_px, config.explore_chunk_cache, (w, h))
         # Entities
-        self.person = Person(w // 2, h // 2)
+        self.person = Person(self.world_w // 2, self.world_h // 2)
         self.animals: List[Animal] = []
+        # Proximity queries go through the grid; only animals near the person, or
+        # still fading out, are updated each frame
+        self.grid = SpatialGrid()
+        self._active: set = set()
+        self._info_animal: Optional[Animal] = None
         
         # Create animals from provided data or use defaults
         if animals:
@@ -390,17 +562,17 @@ class PokemonDisplay(BaseDisplay):
                 
                 # Find a good position
                 for _try in range(100):  # Prevent infinite loop
-                    x = random.randint(ANIMAL_SIZE, w - ANIMAL_SIZE)
-                    y = random.randint(ANIMAL_SIZE, h - ANIMAL_SIZE)
+                    x = random.randint(ANIMAL_SIZE, self.world_w - ANIMAL_SIZE)
+                    y = random.randint(ANIMAL_SIZE, self.world_h - ANIMAL_SIZE)
                     # Don't place too close to person
                     if math.hypot(x - self.person.x, y - self.person.y) < 100:
                         continue
                     # Don't place too close to other animals
-                    if any(math.hypot(x - a.x, y - a.y) < 80 for a in self.animals):
+                    if self.grid.query_radius(x, y, 80):
                         continue
                     break
                 
-                self.animals.append(Animal(x, y, species_name, description, image_name))
+                self._add_animal(Animal(x, y, species_name, description, image_name, entity=animal_data.get("entity")))
         else:
             # Fallback to default animals if none provided
             default_animals = {
@@ -414,15 +586,15 @@ class PokemonDisplay(BaseDisplay):
             for species_name, data in default_animals.items():
                 # Find a good position
                 for _try in range(100):
-                    x = random.randint(ANIMAL_SIZE, w - ANIMAL_SIZE)
-                    y = random.randint(ANIMAL_SIZE, h - ANIMAL_SIZE)
+                    x = random.randint(ANIMAL_SIZE, self.world_w - ANIMAL_SIZE)
+                    y = random.randint(ANIMAL_SIZE, self.world_h - ANIMAL_SIZE)
                     if math.hypot(x - self.person.x, y - self.person.y) < 100:
                         continue
-                    if any(math.hypot(x - a.x, y - a.y) < 80 for a in self.animals):
+                    if self.grid.query_radius(x, y, 80):
                         continue
                     break
                 
-                self.animals.append(Animal(x, y, species_name, data["description"], data["image_name"]))
+                self._add_animal(Animal(x, y, species_name, data["description"], data["image_name"]))
 
         # UI font for instructions
         self.font_instr = pygame.font.Font(None, 24)
@@ -435,39 +607,25 @@ class PokemonDisplay(BaseDisplay):
         if event.type == pygame.KEYDOWN:
         # Toggle info panel for closest animal when pressing 'P'
             if event.key == pygame.K_p:
-                closest = None
-                min_d = float('inf')
-                for a in self.animals:
-                    d = math.hypot(self.person.x - a.x, self.person.y - a.y)
-                    if d < min_d:
-                        min_d = d
-                        closest = a
-                if closest and min_d <= INTERACTION_DISTANCE:
+                closest = self._closest_animal()
+                if closest:
                     should = not closest.show_info
-                    for a in self.animals:
-                        a.show_info = False
-                        a.info_timer = 0  # Reset timers for all animals
+                    self._hide_info()
                     if should:
-                        closest.show_info = True
+                        self._show_info(closest)
                         closest.info_timer = 5000
                 
 
             # Alternate: Toggle info panel for closest animal when pressing 'C'
             if event.key == pygame.K_c:
-                closest = None
-                min_d = float('inf')
-                for a in self.animals:
-                    d = math.hypot(self.person.x - a.x, self.person.y - a.y)
-                    if d < min_d:
-                        min_d = d
-                        closest = a
-                if closest and min_d <= INTERACTION_DISTANCE:
+                closest = self._closest_animal()
+                if closest:
                     should = not closest.show_info
-                    for a in self.animals:
-                        a.show_info = False
-                    closest.show_info = should
+                    self._hide_info()
+                    if should:
+                        self._show_info(closest)
                     print("closest - ", closest.species_name, closest.description, closest.image_name)  # DEBUG 
-                    res = route_to_catchGame(self.background_path, self.screen, closest)
+                    res = route_to_catchGame(self.background_path, self.screen, closest, world=self.world)
             
         keys = pygame.key.get_pressed()
         if keys[pygame.K_ESCAPE]:
@@ -476,22 +634,29 @@ class PokemonDisplay(BaseDisplay):
             route_to_instructions(self.background_path, self.screen)
         if keys[pygame.K_m]: res = route_to_mode(self.background_path, self.screen); return
 
-    def update(self, dt_ms: int):
-        dt = dt_ms / 1000.0
+    def fixed_update(self, step_ms: float):
+        dt = step_ms / 1000.0
         keys = pygame.key.get_pressed()
-        self.person.update(keys, dt_ms, self.screen.get_size())
-        for a in self.animals:
-            a.update(self.person, dt)
+        self.person.update(keys, step_ms, (self.world_w, self.world_h))
+        px, py = self.person.x, self.person.y
+        near = dict(self.grid.query_radius(px, py, WIGGLE_DISTANCE))
+        self._active.update(near)
+        for a in list(self._active):
+            a.update(self.person, dt, near.get(a))
+            self.grid.move(a)
+            if a not in near and a.settled():
+                self._active.discard(a)
 
     def draw_content(self, surface: pygame.Surface):
-        # Background (tiled)
-        if self.bg_tiled:
-            surface.blit(self.bg_tiled, (0, 0))
+        alpha = self.sim.alpha
+        view = self.camera_rect(alpha)
+        camera = view.topleft
+        self.terrain.draw(surface, view)
 
-        # Animals then person (so person overlaps)
-        for a in self.animals:
-            a.draw(surface)
-        self.person.draw(surface)
+        # Animals on screen (with room for their name and info boxes), then person (so person overlaps)
+        for a in self.grid.query_rect(view.inflate(400, 400)):
+            a.draw(surface, camera)
+        self.person.draw(surface, camera, alpha)
 
         # Instructions
         lines = [
@@ -502,33 +667,40 @@ class PokemonDisplay(BaseDisplay):
             "Press ESC to exit",
         ]
         for i, line in enumerate(lines):
-            text = self.font_instr.render(line, True, WHITE)
-            shadow = self.font_instr.render(line, True, BLACK)
+            text = render_text(self.font_instr, line, WHITE)
+            shadow = render_text(self.font_instr, line, BLACK)
             surface.blit(shadow, (11, 11 + i * 25))
             surface.blit(text, (10, 10 + i * 25))
 
     # ---------- helpers ----------
-    def _create_tiled_background_img(self, image_path: Optional[str]) -> Optional[pygame.Surface]:
-        """Tile image 3x3 and crop to screen size; returns a Surface or None if load fails."""
-        if not image_path:
-            return None
-        try:
-            tile = pygame.image.load(image_path).convert()
-        except Exception:
-            return None
-        tw, th = tile.get_size()
-        sw, sh = self.screen.get_size()
-
-        full_w, full_h = tw * 3, th * 3
-        full_bg = pygame.Surface((full_w, full_h))
-        for r in range(3):
-            for c in range(3):
-                full_bg.blit(tile, (c * tw, r * th))
-
-        # crop center to screen
-        start_x = max(0, (full_w - sw)//2)
-        start_y = max(0, (full_h - sh)//2)
-        return full_bg.subsurface(pygame.Rect(start_x, start_y, sw, sh)).copy()
+    def camera_rect(self, alpha: float = 1.0) -> pygame.Rect:
+        """The world area on screen: centred on the (interpolated) person, kept inside the world."""
+        w, h = self.screen.get_size()
+        px, py = self.person.render_pos(alpha)
+        x = max(0, min(self.world_w - w, px - w // 2))
+        y = max(0, min(self.world_h - h, py - h // 2))
+        return pygame.Rect(x, y, w, h)
+
+    def _add_animal(self, animal: Animal):
+        self.animals.append(animal)
+        self.grid.insert(animal)
+
+    def _closest_animal(self) -> Optional[Animal]:
+        """The animal nearest the person, if within INTERACTION_DISTANCE."""
+        hit = self.grid.nearest(self.person.x, self.person.y, INTERACTION_DISTANCE)
+        return hit[0] if hit else None
+
+    def _show_info(self, animal: Animal):
+        animal.show_info = True
+        self._info_animal = animal
+        self._active.add(animal)  # so its info timer counts down
+
+    def _hide_info(self):
+        """Close the open info panel; only one animal shows its panel at a time."""
+        if self._info_animal is not None:
+            self._info_animal.show_info = False
+            self._info_animal.info_timer = 0  # Reset its timer
+            self._info_animal = None
 
 
 # Optional: local run
@@ -0,0 +1,155 @@
+# frameProfiler.py — per-phase frame timing for BaseDisplay screens
+#
+# BaseDisplay.run times every frame in phases: "wait" (clock.tick idling to the FPS
+# cap), "events" (event pump + on_event), "update", "draw" (background +
+# draw_content) and "flip" (presenting the frame). The last N frames are kept in
+# ring buffers, so profiling is always on at a few perf_counter calls per frame.
+#
+#   F3  toggle an overlay with p50/p95/p99 per phase
+#   F4  dump the buffered frames as Chrome-trace JSON (open in chrome://tracing
+#       or ui.perfetto.dev) to FRAME_TRACE_DIR
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+PHASES = ("wait", "events", "update", "draw", "flip")
+
+OVERLAY_KEY = pygame.K_F3
+TRACE_KEY = pygame.K_F4
+
+# Overlay numbers are recomputed at most this often
+OVERLAY_REFRESH_MS = 250
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class FrameProfiler:
+    def __init__(self, name: str, capacity: int = 600):
+        self.name = name
+        self.capacity = max(1, capacity)
+        # One ring buffer of durations (seconds) per phase, plus each frame's start time
+        self._durations: Dict[str, List[float]] = {phase: [0.0] * self.capacity for phase in PHASES}
+        self._starts: List[float] = [0.0] * self.capacity
+        self._index = 0
+        self._frames = 0
+        self._frame_start = 0.0
+        self._mark = 0.0
+
+        self.show_overlay = False
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_at = 0
+        self._font: Optional[pygame.font.Font] = None
+        # Extra overlay lines below the phase table, e.g. cache counters
+        self.notes: List[Callable[[], str]] = []
+
+    # --------- Recording --------- #
+    def start_frame(self) -> None:
+        self._frame_start = self._mark = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the last lap (or frame start) to `phase`."""
+        now = time.perf_counter()
+        self._durations[phase][self._index] = now - self._mark
+        self._mark = now
+
+    def end_frame(self) -> None:
+        self._starts[self._index] = self._frame_start
+        self._index = (self._index + 1) % self.capacity
+        self._frames += 1
+
+    def _recorded(self) -> List[int]:
+        """Buffer slots holding recorded frames, oldest first."""
+        count = min(self._frames, self.capacity)
+        first = (self._index - count) % self.capacity
+        return [(first + i) % self.capacity for i in range(count)]
+
+    # --------- Reporting --------- #
+    def stats(self) -> Dict[str, Tuple[float, float, float]]:
+        """(p50, p95, p99) in ms for each phase, and for the whole frame under "frame"."""
+        slots = self._recorded()
+        result = {}
+        totals = [0.0] * len(slots)
+        for phase in PHASES:
+            samples = [self._durations[phase][slot] * 1000.0 for slot in slots]
+            totals = [t + s for t, s in zip(totals, samples)]
+            ordered = sorted(samples)
+            result[phase] = (percentile(ordered, 50), percentile(ordered, 95), percentile(ordered, 99))
+        ordered = sorted(totals)
+        result["frame"] = (percentile(ordered, 50), percentile(ordered, 95), percentile(ordered, 99))
+        return result
+
+    def draw_overlay(self, surface: pygame.Surface) -> None:
+        if not self.show_overlay:
+            return
+        now = pygame.time.get_ticks()
+        if self._overlay is None or now - self._overlay_at >= OVERLAY_REFRESH_MS:
+            self._overlay = self._render_overlay()
+            self._overlay_at = now
+        surface.blit(self._overlay, (8, 8))
+
+    def overlay_rect(self) -> Optional[pygame.Rect]:
+        """Screen area the overlay covers, with slack for its width changing; None when hidden."""
+        if not self.show_overlay or self._overlay is None:
+            return None
+        return pygame.Rect(0, 0, self._overlay.get_width() + 60, self._overlay.get_height() + 16)
+
+    def _render_overlay(self) -> pygame.Surface:
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        lines = [f"{self.name}  ({min(self._frames, self.capacity)} frames)   p50 / p95 / p99 ms"]
+        for phase, (p50, p95, p99) in self.stats().items():
+            lines.append(f"{phase:<7} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        lines.extend(note() for note in self.notes)
+        rendered = [self._font.render(line, True, (235, 245, 255)) for line in lines]
+        width = max(r.get_width() for r in rendered) + 16
+        height = sum(r.get_height() for r in rendered) + 12
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((10, 14, 24, 190))
+        y = 6
+        for r in rendered:
+            panel.blit(r, (8, y))
+            y += r.get_height()
+        return panel
+
+    def chrome_trace(self) -> Dict:
+        """Buffered frames as Chrome trace events: one complete ("X") event per phase per frame."""
+        events = []
+        for slot in self._recorded():
+            ts = self._starts[slot] * 1e6
+            for phase in PHASES:
+                dur = self._durations[phase][slot] * 1e6
+                events.append({"name": phase, "cat": "frame", "ph": "X", "ts": round(ts, 1),
+                               "dur": round(dur, 1), "pid": os.getpid(), "tid": 0})
+                ts += dur
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"screen": self.name, "frames": len(events) // len(PHASES)}}
+
+    def dump_trace(self, directory: str) -> str:
+        """Write chrome_trace() to `directory`; returns the file path."""
+        os.makedirs(directory, exist_ok=True)
+        safe_name = "".join(c if c.isalnum() else "-" for c in self.name)
+        path = os.path.join(directory, f"{safe_name}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+    def handle_key(self, event: pygame.event.Event, trace_dir: str) -> bool:
+        """Profiler hotkeys; True if the event was one of them."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == OVERLAY_KEY:
+            self.show_overlay = not self.show_overlay
+            return True
+        if event.key == TRACE_KEY:
+            print(f"Frame trace written to {self.dump_trace(trace_dir)}")
+            return True
+        return False
@@ -2,6 +2,8 @@
 import pygame
 from typing import Optional, List
 from frontend.baseDisplay import BaseDisplay
+from frontend.textCache import render_text
+from frontend.textLayout import IncrementalWrapper
 from backend.utils import *
 
 TITLE = "Information"
@@ -26,25 +28,14 @@ class Button:
         base = (70, 110, 160) if (not hover or not enabled) else (90, 140, 200)
         pygame.draw.rect(surface, base, self.rect, border_radius=14)
         pygame.draw.rect(surface, (15, 25, 40), self.rect, 2, border_radius=14)
-        t = font.render(self.label, True, (255,255,255) if enabled else (230,230,230))
+        t = render_text(font, self.label, (255,255,255) if enabled else (230,230,230))
         surface.blit(t, t.get_rect(center=self.rect.center))
     def clicked(self, event, enabled=True):
         return enabled and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(event.pos)
 
-def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
-    words = (text or "").split()
-    lines: List[str] = []; line: List[str] = []
-    for w in words:
-        test = (" ".join(line + [w])).strip()
-        if not line or font.size(test)[0] <= max_width:
-            line.append(w)
-        else:
-            lines.append(" ".join(line)); line = [w]
-    if line: lines.append(" ".join(line))
-    return lines
-
 class InfoDisplay(BaseDisplay):
     CAPTION = TITLE
+    DIRTY_RECTS = True  # only the streaming text and the Start button change
     def __init__(self, screen: pygame.Surface, background_path: Optional[str] = None,
                  text: Optional[str] = None, title: Optional[str] = None,
                  ms_per_char: int = 22, enable_punct_pause: bool = True,
@@ -62,11 +53,14 @@ class InfoDisplay(BaseDisplay):
         self.start_btn = Button(0, 0, 160, 48, "Start")
         self.require_full = require_full_before_start
         self.ms_per_char = max(5, int(ms_per_char)); self.enable_punct_pause = enable_punct_pause
+        self._wrapper: Optional[IncrementalWrapper] = None
         self._chars = 0; self._done = False; self._accum = 0.0; self._cur_delay = float(self.ms_per_char)
         self.result = None
         self.time_place_info = time_place_info
         self.time_place_animals = time_place_animals
         self.time_background = time_background
+        self._text_rect: Optional[pygame.Rect] = None  # text area, known after the first draw
+        self._start_hover = False
 
     def on_event(self, event: pygame.event.Event):
         if self.start_btn.clicked(event, enabled=(self._done or not self.require_full)):
@@ -77,10 +71,13 @@ class InfoDisplay(BaseDisplay):
                 animal_info[str(getattr(animal, 'species', None))] = {
                     "image_name": str(getattr(animal, 'imagePath', "")),
                     "description": getattr(animal, 'description', 1.0),
-                    "relative_size": float(getattr(animal, 'size', 1.0))  # New field
+                    "relative_size": float(getattr(animal, 'size', 1.0)),  # New field
+                    "entity": animal  # backend Animal, recorded if it gets caught
                 }
             print("animal_info:", animal_info)  # DEBUG
-            res = route_to_exploreGame(self.background_path, self.screen, animal_info, self.time_background)
+            info = self.time_place_info or {}
+            world = {"place": info.get("place"), "time_mya": info.get("time_mya"), "epoch": info.get("epoch")}
+            res = route_to_exploreGame(self.background_path, self.screen, animal_info, self.time_background, world=world)
             
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.card_rect.collidepoint(event.pos) and not self._done: self._finish_stream()
@@ -91,25 +88,37 @@ class InfoDisplay(BaseDisplay):
             if event.key == pygame.K_ESCAPE: pygame.event.post(pygame.event.Event(pygame.QUIT)); return
             if event.key == pygame.K_m: res = route_to_mode(self.background_path, self.screen); return
     def update(self, dt_ms: int):
+        hover = self.start_btn.rect.collidepoint(pygame.mouse.get_pos())
+        if hover != self._start_hover:
+            self._start_hover = hover; self.mark_dirty(self.start_btn.rect)
         if self._done: return
-        self._accum += dt_ms
+        self._accum += dt_ms; chars = self._chars
         while self._accum >= self._cur_delay and not self._done:
             self._accum -= self._cur_delay; self._chars += 1
             if self._chars >= len(self.full_text): self._chars = len(self.full_text); self._done = True; break
             self._cur_delay = self._next_delay(self.full_text[self._chars - 1])
+        if self._chars != chars: self._mark_text_dirty()
+    def _mark_text_dirty(self):
+        # Text area down to the card bottom (a long paragraph may run past the viewport), plus the Start button
+        if self._text_rect is None: self.mark_dirty(); return
+        self.mark_dirty(pygame.Rect(self._text_rect.x, self._text_rect.y, self._text_rect.w, self.card_rect.bottom - self._text_rect.y))
+        self.mark_dirty(self.start_btn.rect)
     def draw_content(self, surface: pygame.Surface):
         draw_shadow(surface, self.card_rect, radius=22, spread=16, alpha=110)
         draw_round_rect(surface, self.card_rect, (24, 28, 44), radius=20)
         pygame.draw.rect(surface, (50, 70, 110), self.card_rect, 2, border_radius=20)
-        t_title = self.FONT_HERO.render(self.title, True, (255, 255, 255))
+        t_title = render_text(self.FONT_HERO, self.title, (255, 255, 255))
         surface.blit(t_title, (self.card_rect.left + 24, self.card_rect.top + 20))
         pad = 24; top_y = self.card_rect.top + 20 + t_title.get_height() + 12
         bottom_y = self.card_rect.bottom - (pad + 56)
         viewport = pygame.Rect(self.card_rect.left + pad, top_y, self.card_rect.w - pad*2, bottom_y - top_y)
-        snippet = self.full_text[:self._chars]; lines = wrap_text(snippet, self.FONT_MD, viewport.w)
+        self._text_rect = viewport
+        if self._wrapper is None or self._wrapper.max_width != viewport.w:
+            self._wrapper = IncrementalWrapper(self.FONT_MD, viewport.w)
+        lines = self._wrapper.show(self.full_text, self._chars)  # lays out only newly revealed characters
         y = viewport.y
         for ln in lines:
-            s = self.FONT_MD.render(ln, True, (220, 230, 245)); surface.blit(s, (viewport.x, y)); y += s.get_height() + 6
+            s = render_text(self.FONT_MD, ln, (220, 230, 245)); surface.blit(s, (viewport.x, y)); y += s.get_height() + 6
         if not self._done and lines:
             caret_w = max(2, self.FONT_MD.size("|")[0] // 3); caret_h = self.FONT_MD.get_height()
             caret_x = viewport.x + (self.FONT_MD.size(lines[-1])[0]); caret_y = y - (self.FONT_MD.get_height() + 6)
@@ -123,7 +132,7 @@ class InfoDisplay(BaseDisplay):
         if ch in ",;:": return float(self.ms_per_char * 2)
         if ch.isspace(): return max(10.0, float(self.ms_per_char) * 0.8)
         return float(self.ms_per_char)
-    def _finish_stream(self): self._chars = len(self.full_text); self._done = True; self._accum = 0.0; self._cur_delay = float(self.ms_per_char)
+    def _finish_stream(self): self._chars = len(self.full_text); self._done = True; self._accum = 0.0; self._cur_delay = float(self.ms_per_char); self._mark_text_dirty()
 
 if __name__ == "__main__":
     pygame.init()
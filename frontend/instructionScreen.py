@@ -2,6 +2,9 @@
 import pygame
 from typing import List, Tuple, Optional
 from frontend.baseDisplay import BaseDisplay
+from frontend.textCache import render_text
+from frontend.textLayout import wrap_text
+from backend.config import get_config
 
 TITLE = "Instructions"
 
@@ -29,30 +32,15 @@ class Button:
         base = (70, 110, 160) if (not hover or not enabled) else (90, 140, 200)
         pygame.draw.rect(surface, base, self.rect, border_radius=14)
         pygame.draw.rect(surface, (15, 25, 40), self.rect, 2, border_radius=14)
-        t = font.render(self.label, True, (255, 255, 255))
+        t = render_text(font, self.label, (255, 255, 255))
         surface.blit(t, t.get_rect(center=self.rect.center))
 
     def clicked(self, event, enabled=True):
         return enabled and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(event.pos)
 
-def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
-    """Wrap a long string into multiple lines that fit within max_width."""
-    words = text.split()
-    lines: List[str] = []
-    line: List[str] = []
-    for w in words:
-        test = (" ".join(line+[w])).strip()
-        if font.size(test)[0] <= max_width or not line:
-            line.append(w)
-        else:
-            lines.append(" ".join(line))
-            line = [w]
-    if line:
-        lines.append(" ".join(line))
-    return lines
-
 class InstructionDisplay(BaseDisplay):
     CAPTION = TITLE
+    DIRTY_RECTS = True  # redraws only on scroll and button hover
 
     def __init__(self, screen: pygame.Surface, background_path: Optional[str] = None):
         super().__init__(screen, background_path)
@@ -102,6 +90,7 @@ class InstructionDisplay(BaseDisplay):
         self.scroll_offset = 0
         self.content_height = 0  # computed
         self.viewport_rect = None  # computed
+        self._back_hover = False
 
     # ---------- BaseDisplay hooks ----------
     def on_event(self, event: pygame.event.Event):
@@ -138,10 +127,13 @@ class InstructionDisplay(BaseDisplay):
     def run(self):
         """Override BaseDisplay.run() to ensure proper exit handling."""
         clock = pygame.time.Clock()
+        profiler = self.profiler
         self._running = True
         
         while self._running:
-            dt_ms = clock.tick(60)
+            profiler.start_frame()
+            dt_ms = clock.tick(get_config().fps)
+            profiler.lap("wait")
             
             # Handle events
             for event in pygame.event.get():
@@ -150,24 +142,30 @@ class InstructionDisplay(BaseDisplay):
                     self.result = "quit"
                     self._running = False
                     break
+                elif profiler.handle_key(event, get_config().frame_trace_dir):
+                    self.mark_dirty()
                 else:
-                    self.on_event(event)
+                    self._dispatch(event)
+            profiler.lap("events")
             
             # Update and draw
             self.update(dt_ms)
-            self.screen.fill((0, 0, 0))
+            profiler.lap("update")
             
             # Draw background if available
-            if hasattr(self, 'background') and self.background:
-                self.screen.blit(self.background, (0, 0))
-            
-            self.draw_content(self.screen)
-            pygame.display.flip()
+            self._render_frame(getattr(self, 'background', None), draw_close=False)
+            profiler.lap("flip")
+            profiler.end_frame()
         
+        self._finish_profiling()
         return self
 
     def update(self, dt_ms: int):
-        pass  # no internal timers needed
+        # No internal timers; just track hover so the Back button redraws when it changes
+        hover = self.back_btn.rect.collidepoint(pygame.mouse.get_pos())
+        if hover != self._back_hover:
+            self._back_hover = hover
+            self.mark_dirty(self.back_btn.rect)
 
     def draw_content(self, surface: pygame.Surface):
         # Card background
@@ -175,7 +173,7 @@ class InstructionDisplay(BaseDisplay):
         draw_round_rect(surface, self.card_rect, (230, 236, 248), radius=20)
 
         # Title
-        t_title = self.FONT_HERO.render("How to Play", True, (25, 40, 65))
+        t_title = render_text(self.FONT_HERO, "How to Play", (25, 40, 65))
         surface.blit(t_title, (self.card_rect.left + 24, self.card_rect.top + 20))
 
         # Layout for body + viewport
@@ -198,7 +196,7 @@ class InstructionDisplay(BaseDisplay):
             else:
                 body_lines.extend(wrap_text(raw, self.FONT_MD, body_width))
 
-        line_surfs = [(None if ln=="" else self.FONT_MD.render(ln, True, (25, 40, 65))) for ln in body_lines]
+        line_surfs = [(None if ln=="" else render_text(self.FONT_MD, ln, (25, 40, 65))) for ln in body_lines]
         line_heights = [(18 if s is None else s.get_height()+6) for s in line_surfs]
         self.content_height = sum(line_heights)
         max_scroll = max(0, self.content_height - viewport_h)
@@ -233,7 +231,10 @@ class InstructionDisplay(BaseDisplay):
         if self.viewport_rect is None:
             return
         max_scroll = max(0, self.content_height - self.viewport_rect.h)
-        self.scroll_offset = max(0, min(self.scroll_offset + dy, max_scroll))
+        offset = max(0, min(self.scroll_offset + dy, max_scroll))
+        if offset != self.scroll_offset:
+            self.scroll_offset = offset
+            self.mark_dirty(self.card_rect)
 
 
 # Legacy function-based interface for backward compatibility
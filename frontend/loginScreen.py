@@ -12,10 +12,14 @@ from backend.utils import *
 #   show_instructions(screen, background) -> None
 import frontend.instructionScreen as instructionScreen
 from backend.entities import *
+from backend.config import get_config, start_watching
+from backend.imageGC import start_background_gc
+from frontend.assetManager import get_image
+from frontend.textCache import render_text
 
 # ---------------- Config ---------------- #
-SCREEN_W, SCREEN_H = 900, 600
-BACKGROUND_PATH = "frontend/assets/login3.png"   # put your image in the same folder or change this path
+SCREEN_W, SCREEN_H = get_config().screen_width, get_config().screen_height
+BACKGROUND_PATH = get_config().assets_path + "login3.png"   # put your image in the same folder or change this path
 TITLE = "EONS"
 
 # -------------- Pygame Setup ------------- #
@@ -36,23 +40,15 @@ clock = pygame.time.Clock()
 #     return surf
 
 def load_background():
-    if os.path.exists(BACKGROUND_PATH):
-        img = pygame.image.load(BACKGROUND_PATH).convert()
-        img = pygame.transform.smoothscale(img, (SCREEN_W, SCREEN_H))
-        return lighten_alpha(img, alpha=90)  # 0..255 (higher = lighter)
+    # Shared with BaseDisplay screens using the same background
+    img = get_image(BACKGROUND_PATH, (SCREEN_W, SCREEN_H), transform="lighten")
+    if img is not None:
+        return img
     # fallback
     surf = pygame.Surface((SCREEN_W, SCREEN_H))
     surf.fill((28, 32, 48))
     return surf
 
-def lighten_alpha(surface, alpha=80):
-    """Lighten by alpha-blending towards white."""
-    out = surface.copy()
-    overlay = pygame.Surface(out.get_size(), pygame.SRCALPHA)
-    overlay.fill((255, 255, 255, alpha))
-    out.blit(overlay, (0, 0))
-    return out
-
 BACKGROUND = load_background()
 
 def font(name="Georgia", size=28, bold=False):
@@ -118,7 +114,7 @@ class InputBox:
         border = 3 if self.active else 2
         pygame.draw.rect(surface, (240, 240, 240), self.rect, border, border_radius=10)
         # Text
-        txt = FONT_MD.render(self.text or "", True, (0, 0, 0))
+        txt = render_text(FONT_MD, self.text or "", (0, 0, 0))
         surface.blit(txt, (self.rect.x + 10, self.rect.y + self.rect.height//2 - txt.get_height()//2))
 
 class Button:
@@ -131,7 +127,7 @@ class Button:
         base = (70, 110, 160) if not hover else (90, 140, 200)
         pygame.draw.rect(surface, base, self.rect, border_radius=12)
         pygame.draw.rect(surface, (15, 25, 40), self.rect, 2, border_radius=12)
-        t = FONT_MD.render(self.label, True, (255, 255, 255))
+        t = render_text(FONT_MD, self.label, (255, 255, 255))
         surface.blit(t, t.get_rect(center=self.rect.center))
 
     def clicked(self, event):
@@ -139,7 +135,7 @@ class Button:
 
 # -------------- Helpers ------------------- #
 def draw_center_text(surface, text, font, color, y):
-    t = font.render(text, True, color)
+    t = render_text(font, text, color)
     surface.blit(t, t.get_rect(center=(SCREEN_W // 2, y)))
 
 def show_user_info(username: str, player: Player, new_user=False):
@@ -184,7 +180,7 @@ def show_user_info(username: str, player: Player, new_user=False):
         #     draw_center_text(screen, "Loading user info...", FONT_MD, (230, 240, 255), y)
 
         pygame.display.flip()
-        clock.tick(60)
+        clock.tick(get_config().fps)
 
 
 
@@ -254,17 +250,21 @@ def show_user_info(username: str, player: Player, new_user=False):
 
 # -------------- Main Loop ---------------- #
 def start_login():
+    # Pick up edits to config.yaml (beastballs, FPS, speeds) while the game runs
+    start_watching()
     input_box = InputBox(SCREEN_W//2 - 170, SCREEN_H//2 - 10, 340, 48)
     enter_btn = Button(SCREEN_W//2 + 190, SCREEN_H//2 - 10, 120, 48, "Enter")
 
     message = ""     # transient feedback line
     msg_timer = 0    # ms remaining to show the message
 
-    playerManager = PlayerManager("data/playerData.json")
+    playerManager = PlayerManager()
+    if get_config().image_gc_interval_minutes > 0:
+        start_background_gc(playerManager, interval=get_config().image_gc_interval_minutes * 60)
 
     running = True
     while running:
-        dt = clock.tick(60)
+        dt = clock.tick(get_config().fps)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -303,6 +303,7 @@ def start_login():
                         player = Player(username=username.lower())
                         playerManager.save_player(player)
                         show_user_info(username, player, new_user=True)
+                    set_active_player(player, playerManager)
                     res = route_to_mode(BACKGROUND, screen)
 
         # Decrement message timer
@@ -318,7 +319,7 @@ def start_login():
         draw_center_text(screen, "Gotta Unearth 'Em All!", FONT_SM, (20, 69, 22), 180)
 
         # Label
-        label = FONT_MD.render("Username:", True, (0, 0, 0))
+        label = render_text(FONT_MD, "Username:", (0, 0, 0))
         screen.blit(label, (SCREEN_W//2 - 170, SCREEN_H//2 - 40))
 
         # Input and button
@@ -2,6 +2,8 @@
 import pygame
 from typing import Optional, List, Tuple
 from frontend.baseDisplay import BaseDisplay
+from frontend.textCache import render_text
+from frontend.textLayout import wrap_text
 from backend.utils import *
 TITLE = "Select Mode"
 
@@ -17,21 +19,6 @@ def draw_shadow(surface, rect, radius=22, spread=16, alpha=110):
     pygame.draw.rect(shadow, (0, 0, 0, alpha), shadow.get_rect(), border_radius=radius+4)
     surface.blit(shadow, (rect.x + 6, rect.y + 8))
 
-def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
-    words = text.split()
-    lines: List[str] = []
-    line: List[str] = []
-    for w in words:
-        test = (" ".join(line+[w])).strip()
-        if font.size(test)[0] <= max_width or not line:
-            line.append(w)
-        else:
-            lines.append(" ".join(line))
-            line = [w]
-    if line:
-        lines.append(" ".join(line))
-    return lines
-
 class IconButton:
     """Top-right X (close) button."""
     def __init__(self, right, top, size=36):
@@ -71,7 +58,7 @@ class ModeCard:
         pygame.draw.rect(surface, glow, lifted, 2, border_radius=18)
 
         pad = 18
-        title_surf = FONT_TITLE.render(self.title, True, (255, 255, 255))
+        title_surf = render_text(FONT_TITLE, self.title, (255, 255, 255))
         surface.blit(title_surf, (lifted.x + pad, lifted.y + pad))
 
         # description block
@@ -80,7 +67,7 @@ class ModeCard:
         lines = wrap_text(self.desc, FONT_DESC, max_w)
         y = desc_top
         for ln in lines[:6]:  # clamp a bit to keep tidy
-            s = FONT_DESC.render(ln, True, (210, 220, 235))
+            s = render_text(FONT_DESC, ln, (210, 220, 235))
             surface.blit(s, (lifted.x + pad, y))
             y += s.get_height() + 6
 
@@ -89,6 +76,7 @@ class ModeCard:
 
 class ModeSelectDisplay(BaseDisplay):
     CAPTION = TITLE
+    DIRTY_RECTS = True  # static apart from hover and the coming-soon popup
 
     def __init__(self, screen: pygame.Surface, background_path: Optional[str] = None):
         super().__init__(screen, background_path)
@@ -110,6 +98,7 @@ class ModeSelectDisplay(BaseDisplay):
 
         # Cached layout (recomputed each draw to be robust on resize)
         self._cards: Tuple[ModeCard, ModeCard, ModeCard] = self._compute_layout()
+        self._hovered: Optional[int] = None
 
     # ---------- BaseDisplay hooks ----------
     def on_event(self, event: pygame.event.Event):
@@ -137,7 +126,7 @@ class ModeSelectDisplay(BaseDisplay):
                 return
             if player_info.hit(pos):
                 self.choice = "player_info"
-                self._show_coming_soon_message("Player Info - Coming Soon!")
+                res = route_to_playerInfo(self.background_path, self.screen)
                 return
             
         keys = pygame.key.get_pressed()
@@ -153,12 +142,23 @@ class ModeSelectDisplay(BaseDisplay):
             if self.coming_soon_timer <= 0:
                 self.show_coming_soon = False
                 self.coming_soon_message = ""
+                self.mark_dirty()
+
+        # Redraw only the cards whose hover state changed (with room for the lift and shadow)
+        mouse = pygame.mouse.get_pos()
+        hovered = next((i for i, card in enumerate(self._cards) if card.hit(mouse)), None)
+        if hovered != self._hovered:
+            for index in (self._hovered, hovered):
+                if index is not None:
+                    self.mark_dirty(self._cards[index].rect.inflate(60, 60))
+            self._hovered = hovered
 
     def _show_coming_soon_message(self, message: str):
         """Show a temporary 'Coming Soon' message"""
         self.coming_soon_message = message
         self.show_coming_soon = True
         self.coming_soon_timer = 1000  # Show for 2 seconds
+        self.mark_dirty()
 
     def draw_content(self, surface: pygame.Surface):
         W, H = surface.get_width(), surface.get_height()
@@ -180,12 +180,12 @@ class ModeSelectDisplay(BaseDisplay):
             pygame.draw.rect(surface, (86, 154, 255), pygame.Rect(box_x, box_y, box_w, box_h), 3, border_radius=16)
             
             # Message text
-            msg_surf = self.FONT_MESSAGE.render(self.coming_soon_message, True, (255, 255, 255))
+            msg_surf = render_text(self.FONT_MESSAGE, self.coming_soon_message, (255, 255, 255))
             msg_rect = msg_surf.get_rect(center=(W // 2, H // 2 - 10))
             surface.blit(msg_surf, msg_rect)
             
             # Subtitle
-            sub_surf = self.FONT_DESC.render("This feature will be available in a future update", True, (200, 210, 230))
+            sub_surf = render_text(self.FONT_DESC, "This feature will be available in a future update", (200, 210, 230))
             sub_rect = sub_surf.get_rect(center=(W // 2, H // 2 + 20))
             surface.blit(sub_surf, sub_rect)
             
@@ -195,8 +195,8 @@ class ModeSelectDisplay(BaseDisplay):
         # Header
         heading = "Choose Your Mode"
         sub     = "Hover and click to pick how you want to play."
-        t1 = self.FONT_HERO.render(heading, True, (20, 69, 22))
-        t2 = self.FONT_SUB.render(sub, True, (20, 69, 22))
+        t1 = render_text(self.FONT_HERO, heading, (20, 69, 22))
+        t2 = render_text(self.FONT_SUB, sub, (20, 69, 22))
         surface.blit(t1, t1.get_rect(midtop=(W // 2, int(H * 0.15))))  # Moved up slightly
         surface.blit(t2, t2.get_rect(midtop=(W // 2, int(H * 0.15) + 56)))
 
@@ -214,7 +214,7 @@ class ModeSelectDisplay(BaseDisplay):
         player_info.draw(surface, hover_player_info, (self.FONT_TITLE, self.FONT_DESC))
 
         # Footer + X
-        hint = self.FONT_DESC.render("Press I for Instructions", True, (0, 0, 0))
+        hint = render_text(self.FONT_DESC, "Press I for Instructions", (0, 0, 0))
         surface.blit(hint, hint.get_rect(midbottom=(W // 2, H - 10)))
         self.x_btn.draw(surface)
 
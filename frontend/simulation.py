@@ -0,0 +1,95 @@
+# simulation.py — fixed-timestep game simulation with interpolated rendering
+#
+# Screens used to move things a fixed number of pixels per update, so game speed
+# followed the frame rate. A FixedStep turns each frame's elapsed time into a whole
+# number of simulation steps of 1000 / SIM_HZ ms; the remainder carries over to the
+# next frame. Speeds in config.yaml are per step, so at SIM_HZ 60 they mean what
+# they meant at the old 60 FPS.
+#
+# Slow frames run several steps to catch up, at most MAX_STEPS_PER_FRAME; past that
+# the backlog is dropped and the game slows down rather than spiralling. Fast frames
+# run no step at all and draw entities between their previous and current step
+# positions (alpha, 0..1), so raising FPS above SIM_HZ looks smoother without
+# simulating more often.
+#
+# BaseDisplay drives this for screens with FIXED_STEP on: fixed_update(step_ms) runs
+# once per step and draw_content reads self.sim.alpha.
+from typing import Callable, Optional, Tuple
+
+from backend.config import get_config
+
+# Steps run in one frame at most; the rest of a long stall is dropped
+MAX_STEPS_PER_FRAME = 5
+
+
+def lerp(a: float, b: float, alpha: float) -> float:
+    return a + (b - a) * alpha
+
+
+def lerp_point(prev: Tuple[float, float], cur: Tuple[float, float], alpha: float) -> Tuple[int, int]:
+    """Pixel position `alpha` of the way from prev to cur."""
+    return round(lerp(prev[0], cur[0], alpha)), round(lerp(prev[1], cur[1], alpha))
+
+
+class FixedStep:
+    def __init__(self, hz: Optional[int] = None, max_steps: int = MAX_STEPS_PER_FRAME):
+        # None follows SIM_HZ, so a config reload changes the rate
+        self._hz = hz
+        self.max_steps = max(1, max_steps)
+        self.accumulator = 0.0
+        self.steps = 0               # steps run since the last reset
+        self.time_ms = 0.0           # simulated time at the start of the current step
+        self.dropped_ms = 0.0        # backlog discarded by the step cap
+        self.last_frame_steps = 0
+
+    @property
+    def hz(self) -> int:
+        return max(1, self._hz if self._hz is not None else get_config().sim_hz)
+
+    @property
+    def step_ms(self) -> float:
+        return 1000.0 / self.hz
+
+    def advance(self, dt_ms: float) -> int:
+        """Add a frame's elapsed time; returns how many steps are due (see run)."""
+        step = self.step_ms
+        self.accumulator += max(0.0, dt_ms)
+        # The epsilon keeps float error from leaving a step waiting until the next frame
+        n = int((self.accumulator + 1e-6) // step)
+        if n > self.max_steps:
+            self.dropped_ms += (n - self.max_steps) * step
+            n = self.max_steps
+            self.accumulator = step * n + self.accumulator % step
+        self.accumulator = max(0.0, self.accumulator - n * step)
+        self.last_frame_steps = n
+        return n
+
+    def run(self, dt_ms: float, step_fn: Callable[[float], None]) -> int:
+        """Advance by a frame's elapsed time, calling step_fn(step_ms) for each step due.
+
+        time_ms moves on after each call, so every step sees its own simulated time.
+        """
+        n = self.advance(dt_ms)
+        for _ in range(n):
+            step = self.step_ms
+            step_fn(step)
+            self.steps += 1
+            self.time_ms += step
+        return n
+
+    @property
+    def alpha(self) -> float:
+        """How far the frame is between the last step and the next one."""
+        return min(1.0, self.accumulator / self.step_ms)
+
+    def reset(self) -> None:
+        self.accumulator = 0.0
+        self.steps = 0
+        self.time_ms = 0.0
+        self.dropped_ms = 0.0
+        self.last_frame_steps = 0
+
+    def summary(self) -> str:
+        """One line for the frame profiler overlay."""
+        return (f"sim     {self.hz} Hz, {self.last_frame_steps} step(s) this frame, "
+                f"alpha {self.alpha:.2f}, {self.dropped_ms / 1000.0:.1f}s dropped")
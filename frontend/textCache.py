@@ -0,0 +1,86 @@
+# textCache.py — shared cache of rendered text surfaces
+#
+# Most text on screen is the same from frame to frame (titles, hints, instruction
+# lines, HUD labels), yet font.render rasterizes it again on every frame. The cache
+# keeps rendered surfaces keyed by (font, text, color, antialias) and evicts the
+# least recently used ones past TEXT_CACHE_ENTRIES. Keys hold the Font itself, so a
+# font can't be freed and its id reused while its text is cached.
+#
+# Cached surfaces are shared: blit them, don't change them (set_alpha included).
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from backend.config import get_config
+
+
+class TextCache:
+    def __init__(self, max_entries: Optional[int] = None):
+        # None follows TEXT_CACHE_ENTRIES, so a config reload resizes the cache
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Counts for the frame being drawn, and for the last finished frame
+        self._frame_hits = 0
+        self._frame_misses = 0
+        self.last_frame: Tuple[int, int] = (0, 0)
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return get_config().text_cache_entries
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        """font.render(text, antialias, color), reusing an earlier identical render."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._frame_hits += 1
+            return surface
+        self.misses += 1
+        self._frame_misses += 1
+        surface = font.render(text, antialias, color)
+        limit = self.max_entries
+        if limit > 0:
+            self._entries[key] = surface
+            while len(self._entries) > limit:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return surface
+
+    def end_frame(self) -> None:
+        """Close the per-frame counters; last_frame is (renders avoided, renders done)."""
+        self.last_frame = (self._frame_hits, self._frame_misses)
+        self._frame_hits = self._frame_misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "frame_avoided": self.last_frame[0],
+                "frame_rendered": self.last_frame[1]}
+
+    def summary(self) -> str:
+        """One line for the frame profiler overlay."""
+        avoided, rendered = self.last_frame
+        return f"text    {avoided} cached / {rendered} rendered per frame, {len(self._entries)} entries"
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# ---------------- Shared cache ---------------- #
+_text_cache = TextCache()
+
+
+def get_text_cache() -> TextCache:
+    return _text_cache
+
+
+def render_text(font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+    """TextCache.render on the process-wide cache."""
+    return _text_cache.render(font, text, color, antialias)
@@ -0,0 +1,105 @@
+# textLayout.py — word wrapping shared by all screens
+#
+# wrap_text greedily fills lines word by word, measuring each candidate line with
+# font.size. Screens wrap the same strings every frame, so results are memoized by
+# (text, font, width); the returned lists are shared and must not be modified.
+#
+# IncrementalWrapper lays out text that only ever grows (the Info screen's
+# typewriter): each new character re-measures just the line it lands on, and lines
+# already closed never change.
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import pygame
+
+# Wrapped texts kept by wrap_text
+LAYOUT_CACHE_ENTRIES = 256
+
+_layouts: "OrderedDict[Tuple, List[str]]" = OrderedDict()
+
+
+def _wrap(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+    lines: List[str] = []
+    line: List[str] = []
+    for w in (text or "").split():
+        test = " ".join(line + [w])
+        if not line or font.size(test)[0] <= max_width:
+            line.append(w)
+        else:
+            lines.append(" ".join(line))
+            line = [w]
+    if line:
+        lines.append(" ".join(line))
+    return lines
+
+
+def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+    """Wrap `text` into lines no wider than max_width; whitespace, newlines included, collapses.
+
+    A word wider than max_width gets a line to itself rather than being split.
+    """
+    key = (text, font, max_width)
+    lines = _layouts.get(key)
+    if lines is not None:
+        _layouts.move_to_end(key)
+        return lines
+    lines = _layouts[key] = _wrap(text, font, max_width)
+    while len(_layouts) > LAYOUT_CACHE_ENTRIES:
+        _layouts.popitem(last=False)
+    return lines
+
+
+def wrap_paragraphs(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+    """Like wrap_text, but each newline starts a new line and blank lines are kept."""
+    lines: List[str] = []
+    for paragraph in (text or "").split("\n"):
+        lines.extend(wrap_text(paragraph, font, max_width) or [""])
+    return lines
+
+
+class IncrementalWrapper:
+    """Greedy wrap of a growing text, giving the same lines wrap_text would."""
+    def __init__(self, font: pygame.font.Font, max_width: int):
+        self.font = font
+        self.max_width = max_width
+        self.reset()
+
+    def reset(self) -> None:
+        self.text = ""
+        self._closed: List[str] = []
+        self._words: List[str] = []    # words on the open (last) line
+        self._in_word = False          # whether the last character fed was part of a word
+        self._lines: Optional[List[str]] = None
+
+    def extend(self, more: str) -> None:
+        """Append `more` to the text laid out so far."""
+        for ch in more:
+            if ch.isspace():
+                self._in_word = False
+                continue
+            if self._in_word:
+                self._words[-1] += ch
+            else:
+                self._words.append(ch)
+                self._in_word = True
+            # Only the open line can change; when its last word stops fitting, the word moves down
+            if len(self._words) > 1 and self.font.size(" ".join(self._words))[0] > self.max_width:
+                self._closed.append(" ".join(self._words[:-1]))
+                self._words = self._words[-1:]
+        self.text += more
+        self._lines = None
+
+    def show(self, text: str, length: int) -> List[str]:
+        """Lines for text[:length], extending the current layout when it is a prefix of that."""
+        target = text[:length]
+        if not target.startswith(self.text):
+            self.reset()
+        if len(target) > len(self.text):
+            self.extend(target[len(self.text):])
+        return self.lines
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self._closed + ([" ".join(self._words)] if self._words else [])
+        return self._lines
@@ -1,11 +1,19 @@
 # userProfileTemplate.py — User Profile screen implemented on BaseDisplay
-import os
 import pygame
+from bisect import bisect_left, bisect_right
 from typing import Optional, List, Dict, Any, Tuple
 from frontend.baseDisplay import BaseDisplay
+from frontend.assetManager import get_image
+from frontend.textCache import render_text
+from frontend.textLayout import wrap_text
 from backend.utils import route_to_instructions
+from backend.entities import Player, GameRecord
+from backend.spritePipeline import sprite_path
 
 TITLE = "User Profile"
+CARD_GAP = 16
+# Cards this far outside the viewport keep their rendered surface, for scrolling back
+CARD_CACHE_MARGIN = 4
 
 def _font(size=28, bold=False):
     f = pygame.font.SysFont("arial", size, bold=bold)
@@ -14,42 +22,18 @@ def _font(size=28, bold=False):
 def draw_round_rect(surface, rect, color, radius=18, width=0):
     pygame.draw.rect(surface, color, rect, width=width, border_radius=radius)
 
-def safe_load(path: str) -> Optional[pygame.Surface]:
-    try:
-        if path and os.path.exists(path):
-            img = pygame.image.load(path)
-            return img.convert_alpha()
-    except Exception:
-        pass
-    return None
-
-def blit_image_fit(surface: pygame.Surface, img: Optional[pygame.Surface], rect: pygame.Rect):
-    """Scale 'img' to fit within 'rect' preserving aspect ratio, centered."""
-    if img is None or rect.w <= 0 or rect.h <= 0:
-        return
-    iw, ih = img.get_size()
-    if iw == 0 or ih == 0:
-        return
-    scale = min(rect.w / iw, rect.h / ih)
-    new_size = (max(1, int(iw * scale)), max(1, int(ih * scale)))
-    scaled = pygame.transform.smoothscale(img, new_size)
-    dst = scaled.get_rect(center=rect.center)
-    surface.blit(scaled, dst)
-
-def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
-    words = (text or "").split()
-    lines: List[str] = []
-    line: List[str] = []
-    for w in words:
-        test = (" ".join(line + [w])).strip()
-        if not line or font.size(test)[0] <= max_width:
-            line.append(w)
-        else:
-            lines.append(" ".join(line))
-            line = [w]
-    if line:
-        lines.append(" ".join(line))
-    return lines
+def blit_image_fit(surface: pygame.Surface, path: Optional[str], rect: pygame.Rect) -> bool:
+    """Blit the image at 'path' scaled to fit within 'rect' preserving aspect ratio, centered.
+
+    Returns False if there is no image to draw.
+    """
+    if not path or rect.w <= 0 or rect.h <= 0:
+        return False
+    scaled = get_image(sprite_path(path, rect.size), rect.size, fit=True, alpha=True)
+    if scaled is None:
+        return False
+    surface.blit(scaled, scaled.get_rect(center=rect.center))
+    return True
 
 class IconButton:
     """Top-right X (close) button."""
@@ -79,8 +63,8 @@ class ProfileCard:
           species (str), epoch (str), place (str), time/time_mya/mya (str|float), image (path)
         """
         self.data = data
-        self.thumb = safe_load(data.get("image", ""))
         self._cached: Optional[Tuple[pygame.Surface, Tuple[int,int]]] = None  # (surface, (w,h))
+        self._heights: Dict[int, int] = {}  # width -> measured height
 
     def _get_time_value(self) -> str:
         # try common keys
@@ -95,6 +79,11 @@ class ProfileCard:
 
     def measure_height(self, width: int, fonts: Dict[str, pygame.font.Font]) -> int:
         """Compute needed card height for given width so we don't clip the 'Time' line."""
+        if width not in self._heights:
+            self._heights[width] = self._measure_height(width, fonts)
+        return self._heights[width]
+
+    def _measure_height(self, width: int, fonts: Dict[str, pygame.font.Font]) -> int:
         FONT_TITLE = fonts["title"]
         FONT_MD    = fonts["md"]
         pad = 16
@@ -141,18 +130,16 @@ class ProfileCard:
         img_rect = pygame.Rect(pad, pad, int(w * 0.28), h - pad * 2)
         content = pygame.Rect(img_rect.right + 14, pad, w - (img_rect.right + 14) - pad, h - pad * 2)
 
-        # image
-        if self.thumb:
-            blit_image_fit(surf, self.thumb, img_rect)
-        else:
+        # image (the thumbnail is loaded at this size only while the card is drawn)
+        if not blit_image_fit(surf, self.data.get("image"), img_rect):
             # placeholder
             pygame.draw.rect(surf, (60, 66, 86), img_rect, border_radius=10)
-            ph = FONT_SM.render("No Image", True, (180, 190, 210))
+            ph = render_text(FONT_SM, "No Image", (180, 190, 210))
             surf.blit(ph, ph.get_rect(center=img_rect.center))
 
         # text
         y = content.y
-        title = FONT_TITLE.render(str(self.data.get("species", "Unknown")), True, (235, 240, 252))
+        title = render_text(FONT_TITLE, str(self.data.get("species", "Unknown")), (235, 240, 252))
         surf.blit(title, (content.x, y))
         y += title.get_height() + 8
 
@@ -163,21 +150,21 @@ class ProfileCard:
         bottom_limit = content.bottom
 
         def draw_kv(label: str, value: str, y: int) -> int:
-            lab = FONT_MD.render(label, True, label_color)
+            lab = render_text(FONT_MD, label, label_color)
             first_line_w = max(0, content.w - label_w)
             val_lines = wrap_text(str(value), FONT_MD, first_line_w) or [""]
             if y + lab.get_height() > bottom_limit:
                 return bottom_limit
             surf.blit(lab, (content.x, y))
-            v0 = FONT_MD.render(val_lines[0], True, value_color)
+            v0 = render_text(FONT_MD, val_lines[0], value_color)
             surf.blit(v0, (content.x + label_w, y))
             y2 = y + v0.get_height() + line_gap
             for ln in val_lines[1:]:
                 if y2 + v0.get_height() > bottom_limit:
-                    ell = FONT_MD.render("…", True, value_color)
+                    ell = render_text(FONT_MD, "…", value_color)
                     surf.blit(ell, (content.x + label_w, bottom_limit - ell.get_height()))
                     return bottom_limit
-                v = FONT_MD.render(ln, True, value_color)
+                v = render_text(FONT_MD, ln, value_color)
                 surf.blit(v, (content.x + label_w, y2))
                 y2 += v.get_height() + line_gap
             return y2
@@ -195,11 +182,16 @@ class ProfileCard:
             return self._cached[0]
         return self._render_card_surface(size, fonts)
 
+    def release(self):
+        """Drop the rendered surface; it is rebuilt the next time the card is drawn."""
+        self._cached = None
+
 class UserProfileDisplay(BaseDisplay):
     CAPTION = TITLE
 
     def __init__(self, screen: pygame.Surface, background_path: Optional[str] = None,
-                 user: Optional[Dict[str, Any]] = None, animals: Optional[List[Dict[str, Any]]] = None):
+                 user: Optional[Dict[str, Any]] = None, animals: Optional[List[Dict[str, Any]]] = None,
+                 player: Optional[Player] = None):
         super().__init__(screen, background_path)
         # Fonts
         self.FONT_HERO  = _font(46, bold=True)
@@ -215,13 +207,21 @@ class UserProfileDisplay(BaseDisplay):
 
         # Data
         self.user = user or {"username": "Player", "coins": 0}
-        # If no animals provided, show a small stub list
-        self.animals: List[Dict[str, Any]] = animals or [
-            {"species": "Triceratops", "epoch": "Late Cretaceous", "place": "North America", "time": "68–66 MYA", "image": ""},
-            {"species": "Smilodon", "epoch": "Pleistocene", "place": "Americas", "time": "2.5–0.01 MYA", "image": ""},
-            {"species": "Megalodon", "epoch": "Neogene", "place": "Global Oceans", "time": "23–3.6 MYA", "image": ""},
-        ]
+        # A real player's catches are paged in from game_history as the list scrolls
+        self.player = player
+        self._next_page = 0
+        if player is not None:
+            self.user = {"username": player.username, "coins": player.beastball_left}
+            self.animals: List[Dict[str, Any]] = []
+        else:
+            # If no animals provided, show a small stub list
+            self.animals = animals or [
+                {"species": "Triceratops", "epoch": "Late Cretaceous", "place": "North America", "time": "68–66 MYA", "image": ""},
+                {"species": "Smilodon", "epoch": "Pleistocene", "place": "Americas", "time": "2.5–0.01 MYA", "image": ""},
+                {"species": "Megalodon", "epoch": "Neogene", "place": "Global Oceans", "time": "23–3.6 MYA", "image": ""},
+            ]
         self.cards: List[ProfileCard] = [ProfileCard(a) for a in self.animals]
+        self._load_next_page()
 
         # Scrolling / inertia
         self.scroll_y: float = 0.0
@@ -229,9 +229,13 @@ class UserProfileDisplay(BaseDisplay):
         self.header_top = int(H * 0.10)
         self.header_gap = 6
 
-        # layout cache
+        # layout cache: card i spans [offsets[i], offsets[i] + heights[i]) in content space
         self.viewport_rect: Optional[pygame.Rect] = None
         self.content_height: int = 0
+        self._layout_width: Optional[int] = None
+        self._heights: List[int] = []
+        self._offsets: List[int] = []
+        self._kept: range = range(0)  # cards currently holding a rendered surface
 
     # ---------- BaseDisplay hooks ----------
     def on_event(self, event: pygame.event.Event):
@@ -272,6 +276,10 @@ class UserProfileDisplay(BaseDisplay):
         
 
     def update(self, dt_ms: int):
+        # Pull the next history page once the viewport gets within a screen of the end
+        if self.viewport_rect and self.scroll_y + 2 * self.viewport_rect.h >= self.content_height:
+            self._load_next_page()
+
         # Integrate inertia
         self.scroll_y += (self.scroll_v * dt_ms) / 1000.0
         # Damping (exponential wrt frame time)
@@ -294,8 +302,8 @@ class UserProfileDisplay(BaseDisplay):
         # Header
         username = str(self.user.get("username", "Player"))
         coins = int(self.user.get("coins", 0))
-        title = self.FONT_HERO.render(username, True, (255, 255, 255))
-        subtitle = self.FONT_SUB.render(f"Coins Left: {coins}", True, (220, 230, 245))
+        title = render_text(self.FONT_HERO, username, (255, 255, 255))
+        subtitle = render_text(self.FONT_SUB, f"Coins Left: {coins}", (220, 230, 245))
         surface.blit(title, title.get_rect(midtop=(W // 2, self.header_top)))
         surface.blit(subtitle, subtitle.get_rect(midtop=(W // 2, self.header_top + title.get_height() + self.header_gap)))
 
@@ -308,32 +316,16 @@ class UserProfileDisplay(BaseDisplay):
         height = H - top_margin - bottom_margin
         self.viewport_rect = pygame.Rect(left, top_margin, width, height)
 
-        # Build content surface based on cards
-        widths = width
-        # First pass: measure per-card heights
-        heights = []
-        for c in self.cards:
-            h_needed = c.measure_height(width, self._fonts_map)
-            heights.append(h_needed)
-        total_h = sum(heights) + (len(self.cards)-1) * 16  # gap
-        self.content_height = total_h
-        content_surf = pygame.Surface((width, max(1, total_h)), pygame.SRCALPHA)
-
-        # Second pass: render
-        y_off = 0
-        for c, ch in zip(self.cards, heights):
-            surf_card = c.get_surface((width, ch), self._fonts_map)
-            content_surf.blit(surf_card, (0, y_off))
-            y_off += ch + 16
-
-        # Blit viewport with scroll
-        clip = pygame.Surface((width, height), pygame.SRCALPHA)
-        clip.blit(content_surf, (0, -int(self.scroll_y)))
-        surface.blit(clip, self.viewport_rect.topleft)
-
-        clip = pygame.Surface((width, height), pygame.SRCALPHA)
-        clip.blit(content_surf, (0, -int(self.scroll_y)))
-        surface.blit(clip, self.viewport_rect.topleft)
+        # Only the cards intersecting the viewport are rendered
+        self._layout_cards(width)
+        first, last = self._visible_cards(int(self.scroll_y), height)
+        prev_clip = surface.get_clip()
+        surface.set_clip(self.viewport_rect.clip(prev_clip))
+        for i in range(first, last):
+            surf_card = self.cards[i].get_surface((width, self._heights[i]), self._fonts_map)
+            surface.blit(surf_card, (left, top_margin + self._offsets[i] - int(self.scroll_y)))
+        surface.set_clip(prev_clip)
+        self._release_cards(first, last)
 
         # Simple scrollbar
         max_scroll = max(0, self.content_height - self.viewport_rect.h)
@@ -345,10 +337,57 @@ class UserProfileDisplay(BaseDisplay):
             pygame.draw.rect(surface, (200, 220, 245), (bar_area.x, thumb_y, bar_area.w, thumb_h), border_radius=4)
 
         # Footer hint & X
-        hint = self.FONT_SM.render("Scroll: Mouse Wheel / ↑ ↓ / PgUp PgDn • ESC to go back", True, (210, 220, 235))
+        hint = render_text(self.FONT_SM, "Scroll: Mouse Wheel / ↑ ↓ / PgUp PgDn • ESC to go back", (210, 220, 235))
         surface.blit(hint, hint.get_rect(midbottom=(W // 2, H - 8)))
         self.x_btn.draw(surface)
 
+    # ---------- helpers ----------
+    def _layout_cards(self, width: int):
+        """Measure cards not yet measured at `width` and extend the offset index."""
+        if width != self._layout_width:
+            self._layout_width = width
+            self._heights, self._offsets = [], []
+        for c in self.cards[len(self._heights):]:
+            top = self._offsets[-1] + self._heights[-1] + CARD_GAP if self._offsets else 0
+            self._offsets.append(top)
+            self._heights.append(c.measure_height(width, self._fonts_map))
+        self.content_height = self._offsets[-1] + self._heights[-1] if self._offsets else 0
+
+    def _visible_cards(self, top: int, height: int) -> Tuple[int, int]:
+        """Index range [first, last) of the cards overlapping content rows top..top+height."""
+        first = max(0, bisect_right(self._offsets, top) - 1)
+        if first < len(self._offsets) and self._offsets[first] + self._heights[first] <= top:
+            first += 1  # top falls in the gap after this card
+        last = bisect_left(self._offsets, top + height, lo=first)
+        return first, last
+
+    def _release_cards(self, first: int, last: int):
+        """Free rendered surfaces of cards that scrolled well out of view."""
+        keep = range(max(0, first - CARD_CACHE_MARGIN), min(len(self.cards), last + CARD_CACHE_MARGIN))
+        for i in self._kept:
+            if i not in keep:
+                self.cards[i].release()
+        self._kept = keep
+
+    def _load_next_page(self):
+        """Materialize one more page of the player's game history into cards."""
+        if self.player is None:
+            return
+        history = self.player.game_history
+        if self._next_page >= history.page_count:
+            return
+        for record in history.page(self._next_page):
+            data = self._record_card_data(record)
+            self.animals.append(data)
+            self.cards.append(ProfileCard(data))
+        self._next_page += 1
+
+    @staticmethod
+    def _record_card_data(record: GameRecord) -> Dict[str, Any]:
+        animal = record.animalCaught
+        return {"species": animal.species, "epoch": animal.epoch, "place": record.place,
+                "time": record.timeMYA, "image": animal.imagePath}
+
 if __name__ == "__main__":
     pygame.init()
     screen = pygame.display.set_mode((1000, 640))